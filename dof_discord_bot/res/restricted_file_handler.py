@@ -1,22 +1,22 @@
 """
 Helper module storing the class to be used within the logging config files.
 """
-import logging as _logging
+from .rotating_file_handler import _RotatingFileHandler
 
 
-class _RestrictedFileHandler(_logging.FileHandler):
+class _RestrictedFileHandler(_RotatingFileHandler):
     """
-    Extends a classic file handler by restricting the logging messages to contain only the specified level.
+    Extends a (rotating) file handler by restricting the logging messages to contain only the specified level.
 
     .. note::
         Due to circular imports, it is impossible to place this class in the `logger` module.
     """
 
     def __init__(self, filename, *args, **kwargs):
-        _logging.FileHandler.__init__(self, filename, *args, **kwargs)
+        _RotatingFileHandler.__init__(self, filename, *args, **kwargs)
 
     def emit(self, record):
         """
         Overridden function modified to only log records of a matching level.
         """
-        return _logging.FileHandler.emit(self, record) if record.levelno == self.level else None
+        return _RotatingFileHandler.emit(self, record) if record.levelno == self.level else None
@@ -0,0 +1,50 @@
+"""
+Helper module storing the class to be used within the logging config files.
+"""
+import collections as _collections
+import logging as _logging
+
+
+class _RingBufferHandler(_logging.Handler):
+    """
+    Keeps the most recent formatted records in memory, so they can be queried without reading the log files.
+
+    At most `capacity` records are kept (the oldest ones are discarded first), and each formatted record is truncated
+    to `max_length` characters, so the memory use is bounded.
+
+    .. note::
+        Due to circular imports, it is impossible to place this class in the `logger` module.
+    """
+
+    def __init__(self, capacity: int = 1000, max_length: int = 1000):
+        super().__init__()
+        self.max_length = max_length
+        self._records = _collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        """
+        Overridden function modified to store the formatted record (together with its level) in the buffer.
+        """
+        try:
+            message = self.format(record)
+            if len(message) > self.max_length:
+                message = message[:self.max_length - 3] + "..."
+            self._records.append((record.levelno, message))
+        except Exception:
+            self.handleError(record)
+
+    def records(self, level: int = _logging.NOTSET, count: int = None) -> list:
+        """
+        Return up to `count` most recent formatted records of at least the given level, newest first.
+        """
+        matching = list()
+
+        # The records may be emitted from another thread (if logging is queued), so the buffer must not change here
+        with self.lock:
+            for levelno, message in reversed(self._records):
+                if count is not None and len(matching) >= count:
+                    break
+                if levelno >= level:
+                    matching.append(message)
+
+        return matching
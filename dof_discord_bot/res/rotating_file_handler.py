@@ -0,0 +1,190 @@
+"""
+Helper module storing the class to be used within the logging config files (directly, or as a base of other handlers).
+
+Rotated files are renamed with a timestamp suffix (for example `debug.log.201018120000`), then compressed and pruned
+in the background, so the rotation itself never blocks the logging call for longer than a file rename.
+"""
+import concurrent.futures as _futures
+import logging.handlers as _handlers
+import threading as _threading
+import shutil as _shutil
+import gzip as _gzip
+import time as _time
+import sys as _sys
+import os as _os
+
+# Single background worker used to compress and prune the rotated files, created on the first rotation
+_executor: _futures.ThreadPoolExecutor = None
+_executor_lock = _threading.Lock()
+
+
+def _submit(function, *args):
+    """
+    Helper function used to run the given function in the background worker thread.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = _futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotation")
+    _executor.submit(function, *args)
+
+
+def _rotation_key(file_name: str, base_name: str) -> tuple:
+    """
+    Return the (timestamp, counter) tuple used to order the rotated files chronologically, or None if the file name
+    doesn't follow the rotated file naming.
+    """
+    suffix = file_name[len(base_name) + 1:]
+    if suffix.endswith(".gz"):
+        suffix = suffix[:-3]
+
+    timestamp, _, counter = suffix.partition("-")
+    if not timestamp.isdigit() or (counter and not counter.isdigit()):
+        return None
+    return timestamp, int(counter or 0)
+
+
+def _archive(rotated_path: str, base_path: str, compress: bool, backup_count: int):
+    """
+    Compress the rotated file (if requested) and remove the oldest rotated files beyond the retention limit.
+
+    The rotated file may have already been removed, if many files were rotated before the worker caught up.
+
+    Errors are reported to the standard error stream, as logging them could cause another rotation.
+    """
+    try:
+        if compress and _os.path.exists(rotated_path):
+            with open(rotated_path, "rb") as source, _gzip.open(rotated_path + ".gz", "wb") as target:
+                _shutil.copyfileobj(source, target)
+            _os.remove(rotated_path)
+
+        if backup_count:
+            directory, base_name = _os.path.split(base_path)
+            backups = dict()
+            for file_name in _os.listdir(directory):
+                if file_name.startswith(base_name + "."):
+                    key = _rotation_key(file_name, base_name)
+                    if key is not None:
+                        backups[file_name] = key
+
+            for file_name in sorted(backups, key=backups.get)[:-backup_count]:
+                _os.remove(_os.path.join(directory, file_name))
+
+    except OSError as e:
+        print(f"Failed to archive the rotated log file {rotated_path} - {e}", file=_sys.stderr)
+
+
+class _RotatingFileHandler(_handlers.BaseRotatingHandler):
+    """
+    File handler rotating the file once it grows beyond the size cap, or once it gets older than the time cap.
+
+    The following arguments control the rotation (0 disables each of them, in which case the handler behaves like a
+    standard file handler):
+
+        - `max_bytes` - maximum size of the file (the file is rotated once it reaches this size)
+        - `max_age` - maximum number of seconds covered by a single file (the time each file was started is recorded
+          in a file next to it, with the `.start` extension, so that the file's age is kept across restarts)
+        - `backup_count` - how many rotated files should be kept
+        - `compress` - whether the rotated files should be compressed with gzip
+
+    .. note::
+        Due to circular imports, it is impossible to place this class in the `logger` module.
+    """
+
+    def __init__(self, filename, mode="a", encoding=None, delay=False, max_bytes: int = 0, max_age: int = 0,
+                 backup_count: int = 0, compress: bool = False):
+        super().__init__(filename, mode, encoding, delay)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backup_count = backup_count
+        self.compress = compress
+        self._rollover_at = self._started() + max_age if max_age else None
+
+    @property
+    def _start_path(self) -> str:
+        """
+        Getter for the path of the file recording when the current file was started (only used with the time cap).
+        """
+        return self.baseFilename + ".start"
+
+    def _started(self) -> float:
+        """
+        Helper function used to find when the current file was started, so that restarting the logging doesn't reset
+        its age - the time is recorded in a separate file when the file is started (see `_record_start`).
+
+        Files started without the record fall back to the creation time if the platform provides it, otherwise to the
+        last modification time (same as in the standard timed rotating handler). A missing or empty file is started
+        at the current time.
+        """
+        try:
+            stat = _os.stat(self.baseFilename)
+        except OSError:
+            stat = None
+
+        if stat is not None and stat.st_size:
+            try:
+                with open(self._start_path) as f:
+                    return float(f.read())
+            except (OSError, ValueError):
+                started = getattr(stat, "st_birthtime", stat.st_mtime)
+        else:
+            started = _time.time()
+
+        self._record_start(started)
+        return started
+
+    def _record_start(self, started: float):
+        """
+        Helper function used to record when the current file was started.
+
+        Errors are reported to the standard error stream, as logging them could cause another rotation.
+        """
+        try:
+            with open(self._start_path, "w") as f:
+                f.write(repr(started))
+        except OSError as e:
+            print(f"Failed to record the start of the log file {self.baseFilename} - {e}", file=_sys.stderr)
+
+    def shouldRollover(self, record) -> bool:
+        """
+        Check if the file should be rotated before writing the record.
+
+        Unlike the standard rotating handler, the record isn't formatted to predict the new size - the file is only
+        rotated once it already reached the size cap.
+        """
+        if self._rollover_at is not None and _time.time() >= self._rollover_at:
+            return True
+
+        if self.max_bytes:
+            if self.stream is None:
+                self.stream = self._open()
+            return self.stream.tell() >= self.max_bytes
+
+        return False
+
+    def doRollover(self):
+        """
+        Rename the current file and continue logging into a new one, leaving the archiving to the background worker.
+        """
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if _os.path.exists(self.baseFilename) and _os.path.getsize(self.baseFilename):
+            timestamp = _time.strftime("%y%m%d%H%M%S")
+            rotated_path = f"{self.baseFilename}.{timestamp}"
+            counter = 0
+            while _os.path.exists(rotated_path) or _os.path.exists(rotated_path + ".gz"):
+                counter += 1
+                rotated_path = f"{self.baseFilename}.{timestamp}-{counter}"
+
+            _os.replace(self.baseFilename, rotated_path)
+            _submit(_archive, rotated_path, self.baseFilename, self.compress, self.backup_count)
+
+        if self.max_age:
+            started = _time.time()
+            self._record_start(started)
+            self._rollover_at = started + self.max_age
+        if not self.delay:
+            self.stream = self._open()
@@ -0,0 +1,75 @@
+"""
+Helper module storing the class to be used within the logging config files.
+"""
+import logging as _logging
+from .rotating_file_handler import _RotatingFileHandler
+
+
+class _LevelRoutingFileHandler(_logging.Handler):
+    """
+    Writes each record into the file associated with the record's level, with a single lookup.
+
+    Replaces a set of per-level handlers (each one locking and filtering every record, even though only one of them
+    writes it) - the files are opened once and each record is dispatched directly to the relevant one. Records of
+    levels without an associated file are ignored.
+
+    The `filenames` argument maps the level (name or number) to the file path, for example::
+
+        "filenames": {"DEBUG": "debug.log", "INFO": "info.log", "WARNING": "warning.log", "ERROR": "error.log"}
+
+    All other arguments (including the rotation settings) are passed to each file's handler.
+
+    .. note::
+        Due to circular imports, it is impossible to place this class in the `logger` module.
+    """
+    target_class = _RotatingFileHandler
+
+    def __init__(self, filenames: dict, *args, **kwargs):
+        super().__init__()
+        self._targets = dict()
+
+        for level, filename in filenames.items():
+            levelno = level if isinstance(level, int) else _logging.getLevelName(str(level).upper())
+            if not isinstance(levelno, int):
+                raise ValueError(f"Unknown logging level - {level}")
+            self._targets[levelno] = self.target_class(filename, *args, **kwargs)
+
+    @property
+    def targets(self) -> dict:
+        """
+        Getter for the mapping of the level number to the handler writing into the associated file.
+        """
+        return self._targets
+
+    def setFormatter(self, fmt: _logging.Formatter):
+        """
+        Overridden function modified to share the formatter with the file handlers.
+        """
+        super().setFormatter(fmt)
+        for target in self._targets.values():
+            target.setFormatter(fmt)
+
+    def emit(self, record):
+        """
+        Overridden function modified to only pass the record to the file handler of the matching level.
+
+        The file handler's `emit` is called directly, as this handler's lock is already held.
+        """
+        target = self._targets.get(record.levelno)
+        if target is not None:
+            target.emit(record)
+
+    def flush(self):
+        """
+        Overridden function modified to flush all files.
+        """
+        for target in self._targets.values():
+            target.flush()
+
+    def close(self):
+        """
+        Overridden function modified to close all files.
+        """
+        for target in self._targets.values():
+            target.close()
+        super().close()
@@ -8,47 +8,120 @@ Additionally, amends the following logging record fields to give more relevant i
     - `lineno' - line number of the log statement
 """
 import logging as _logging
-import inspect as _inspect
+import functools as _functools
+import sys as _sys
 import os as _os
+from .rotating_file_handler import _RotatingFileHandler
 
 _ROOT_DIR = _os.path.normpath(_os.path.join(_os.path.dirname(__file__), ".."))
+_LOGGING_DIR = _os.path.dirname(_logging.__file__)
+
+# Declare the available caller resolution modes
+FRAME_RESOLUTION = "frame"
+RECORD_RESOLUTION = "record"
+
+# Python 3.8 introduced the `stacklevel` argument, which lets the logging module find the caller by itself
+STACKLEVEL_SUPPORTED = _sys.version_info >= (3, 8)
+
+
+@_functools.lru_cache(maxsize=None)
+def _is_logger_file(filename: str) -> bool:
+    """
+    Check if the given code file name points to the "logger.py" module.
+    """
+    return _os.path.basename(filename) == "logger.py"
+
+
+@_functools.lru_cache(maxsize=None)
+def _relative_path(filename: str) -> str:
+    """
+    Return the file path relative to the package root (cached, as there is only a handful of distinct callers).
+    """
+    return _os.path.relpath(filename, _ROOT_DIR)
+
+
+@_functools.lru_cache(maxsize=None)
+def _is_logging_file(filename: str) -> bool:
+    """
+    Check if the given code file name points to a module of the built-in logging package.
+    """
+    return _os.path.dirname(filename) == _LOGGING_DIR
 
 
 def _get_frame():
     """
-    Return the frame (see the `inspect' module for details) that called the logging function.
+    Return the frame that called the logging function.
+
+    The frames are walked lazily (from the innermost one), so no stack snapshot is built and no source code is read.
     """
-    stack = _inspect.stack()[::-1]
+    frame = _sys._getframe(1)
+    inner = None
+    fallback = None
+
+    # Find the "logger.py" frame which called into the logging package (the `Log` class call), skipping any other
+    # "logger.py" frames (such as the queue handler's). The frame following that is the calling frame.
+    while frame is not None:
+        if _is_logger_file(frame.f_code.co_filename):
+            if inner is not None and _is_logging_file(inner.f_code.co_filename):
+
+                # If logged within logger.py or failed to find the caller, return the "logger.py" frame
+                return frame.f_back or frame
+            if fallback is None:
+                fallback = frame.f_back or frame
+        inner = frame
+        frame = frame.f_back
+
+    return fallback
 
-    # Traverse backwards through the stack to find the first frame that has the filename "logger.py". The frame
-    # following that is the calling frame.
-    while stack:
-        frame = stack.pop()
-        if _os.path.basename(frame.filename) == "logger.py":
 
-            # If logged within logger.py or failed to find it, return the last caller frame.
-            try:
-                return stack.pop()[0]
-            except IndexError:
-                return frame
+def _resolve_caller(record: _logging.LogRecord):
+    """
+    Amend the record with the details of the frame that called the logging function.
+
+    Must be called from the thread (and the stack) in which the record was logged.
+    """
+    caller = _get_frame()
+    record.filename = _relative_path(caller.f_code.co_filename)
+    record.function = caller.f_code.co_name
+    record.lineno = caller.f_lineno
 
 
-class _VerboseFileHandler(_logging.FileHandler):
+class _VerboseFileHandler(_RotatingFileHandler):
     """
     Helper handler class used for logging configuration.
 
-    Any emit to a RestrictedFileHandler is also passed to this, so it is all the levels combined.
+    Any record written into a per-level file is also passed to this, so it is all the levels combined.
+
+    The `caller_resolution` argument specifies how the caller is found:
+
+        - "frame" - walks the frames until the `Log` class call is found (must be resolved in the logging thread)
+        - "record" - uses the caller details stored in the record, as found by the logging module through the
+          `stacklevel` argument (requires Python 3.8+)
+
+    Defaults to "record" if supported by the current Python version, and to "frame" otherwise.
+
+    All other arguments (including the rotation settings) are passed to the parent constructor.
     """
-    def __init__(self, filename, *args, **kwargs):
-        _logging.FileHandler.__init__(self, filename, *args, **kwargs)
+    def __init__(self, filename, *args, caller_resolution: str = None, **kwargs):
+        _RotatingFileHandler.__init__(self, filename, *args, **kwargs)
+
+        if caller_resolution is None:
+            caller_resolution = RECORD_RESOLUTION if STACKLEVEL_SUPPORTED else FRAME_RESOLUTION
+        if caller_resolution not in {FRAME_RESOLUTION, RECORD_RESOLUTION}:
+            raise ValueError(f"Unknown caller resolution mode - {caller_resolution}")
+        self.caller_resolution = caller_resolution
 
     def emit(self, record):
         """
         Overridden function modified so any logging call is put into the verbose file.
         """
-        caller = _inspect.getframeinfo(_get_frame())
-        record.filename = _os.path.relpath(caller.filename, _ROOT_DIR)
-        record.function = caller.function
-        record.lineno = caller.lineno
+        if self.caller_resolution == FRAME_RESOLUTION:
+
+            # The caller may have already been resolved (for example before the record was put on the logging queue)
+            if not hasattr(record, "function"):
+                _resolve_caller(record)
+        else:
+            record.filename = _relative_path(record.pathname)
+            record.function = record.funcName
 
-        return _logging.FileHandler.emit(self, record)
+        return _RotatingFileHandler.emit(self, record)
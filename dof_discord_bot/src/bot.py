@@ -2,12 +2,15 @@
 Module storing the bot master class - an extended version of Discord's commands bot.
 """
 import typing
+import asyncio
 import discord
 from discord import Intents
 from discord.ext import commands
 from .logger import Log
-from .utils import MemberApplication, MessageEmbed
-from .constants import COMMANDS_ORDER
+from .utils import MemberApplication, MessageEmbed, SessionManager, SessionScheduler
+from .store import SessionDatabase, LocaleDatabase
+from .constants import COMMANDS_ORDER, STRINGS_RELOAD_INTERVAL, DEFAULT_LOCALE, SESSIONS_DATABASE_PATH, \
+    LOCALES_DATABASE_PATH
 from . import strings
 
 
@@ -26,6 +29,11 @@ class Bot(commands.Bot):
         self._load_extensions()
         self._verify_commands_order()
         self._channels_being_updated = set()
+        self._strings_watcher = None
+        self._locales = dict()
+        self._locales_database = LocaleDatabase(LOCALES_DATABASE_PATH)
+        self._sessions = SessionManager(database=SessionDatabase(SESSIONS_DATABASE_PATH))
+        self._scheduler = SessionScheduler(self.loop)
 
     def _load_extensions(self):
         """
@@ -47,8 +55,9 @@ class Bot(commands.Bot):
         # Check that all commands have been "registered" in the ordering list
         difference = command_names.difference(set(COMMANDS_ORDER))
         if difference:
-            Log.warning(f"The order of some commands has not been specified. Please specify the order of {difference} "
-                        f"in constants.py - otherwise the commands will be added to the end of the list alphabetically")
+            Log.warning("The order of some commands has not been specified. Please specify their order in constants.py "
+                        "- otherwise the commands will be added to the end of the list alphabetically",
+                        commands=difference)
             for command in sorted(difference):
                 COMMANDS_ORDER.append(command)
 
@@ -66,6 +75,20 @@ class Bot(commands.Bot):
         """
         return self._applications
 
+    @property
+    def sessions(self) -> SessionManager:
+        """
+        Getter to retrieve the registry of the active sessions.
+        """
+        return self._sessions
+
+    @property
+    def scheduler(self) -> SessionScheduler:
+        """
+        Getter to retrieve the scheduler of the session timeouts.
+        """
+        return self._scheduler
+
     @property
     def guild(self) -> discord.Guild:
         """
@@ -73,6 +96,30 @@ class Bot(commands.Bot):
         """
         return self.guilds[0]
 
+    def get_locale(self, user: discord.abc.User = None, guild: discord.Guild = None) -> str:
+        """
+        Getter to retrieve the locale the strings should be displayed in - the user's own locale, or the server's
+        locale, or the default locale (in that order).
+
+        The server defaults to the user's server, or (in direct messages) to DoF Discord server.
+        """
+        if guild is None:
+            guild = getattr(user, "guild", None) or (self.guilds[0] if self.guilds else None)
+
+        for target in (user, guild):
+            if target is not None and target.id in self._locales:
+                return self._locales[target.id]
+        return DEFAULT_LOCALE
+
+    def set_locale(self, target: typing.Union[discord.abc.User, discord.Guild], locale: str):
+        """
+        Setter for the locale of a user or a server. The settings are stored in the database, so they are kept after
+        the bot is restarted.
+        """
+        Log.info("Locale updated", target=target, locale=locale)
+        self._locales[target.id] = locale
+        self._locales_database.save(target.id, locale)
+
     def _discover_channels(self):
         """
         Helper function used to discover all channels and store them in a dict.
@@ -87,22 +134,96 @@ class Bot(commands.Bot):
         """
         Upon logging, the bot will inform about its user name and id, as well as discover all guild channels.
         """
-        Log.info(f"Logged on as {self.user}")
+        Log.info("Logged on", user=self.user)
         self._discover_channels()
 
+        # Only start watching the strings (and restore the locales and the sessions from before a restart) once, even
+        # if the bot reconnects
+        if self._strings_watcher is None:
+            self._strings_watcher = self.loop.create_task(self._watch_strings())
+            self._locales = {**await self._locales_database.locales(), **self._locales}
+            await self._sessions.restore(self)
+
+    async def _watch_strings(self):
+        """
+        Background task used to reload the strings whenever any strings file (including the locale overlays) changes,
+        without restarting the bot.
+
+        The files are loaded in an executor, so the event loop is never blocked by parsing them. If the new strings are
+        invalid, the old ones are kept.
+        """
+        last_modified = strings.strings_modified()
+        while not self.is_closed():
+            await asyncio.sleep(STRINGS_RELOAD_INTERVAL)
+
+            try:
+                modified = strings.strings_modified()
+                if modified == last_modified:
+                    continue
+                last_modified = modified
+
+                Log.info("Detected strings file change, reloading the strings")
+                configs = await self.loop.run_in_executor(None, strings.load_strings)
+                strings.update_strings(configs)
+            except (OSError, strings.StringsError) as e:
+                Log.error("Failed to reload the strings", error=e)
+
+    async def close(self):
+        """
+        Upon closing, the bot will make sure all (possibly queued) log records are written out.
+        """
+        if self._strings_watcher is not None:
+            self._strings_watcher.cancel()
+        self._scheduler.close()
+        self._sessions.close()
+        self._locales_database.close()
+
+        await super().close()
+        Log.info("Bot closed")
+        Log.flush()
+
+    def _payload_user(self, payload: discord.RawReactionActionEvent) -> discord.abc.Snowflake:
+        """
+        Helper function used to find the user who added (or removed) the reaction - the member is only sent with the
+        added reactions in guilds, and the users may not be cached, in which case only their id is known.
+        """
+        return payload.member or self.get_user(payload.user_id) or discord.Object(payload.user_id)
+
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
+        """
+        Upon a reaction being added, the bot will route it to the session displayed in the reacted message (if any).
+
+        The raw event is used, because the other one is only dispatched for the cached messages, and the messages of
+        the restored sessions are never cached.
+        """
+        await self._sessions.on_reaction_add(payload.message_id, payload.emoji, self._payload_user(payload))
+
+    async def on_raw_reaction_remove(self, payload: discord.RawReactionActionEvent):
+        """
+        Upon a reaction being removed, the bot will route it to the session displayed in the message (if any).
+        """
+        await self._sessions.on_reaction_remove(payload.message_id, payload.emoji, self._payload_user(payload))
+
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """
+        Upon a message being deleted, the bot will stop the session displayed in the deleted message (if any).
+        """
+        await self._sessions.on_message_delete(payload.message_id)
+
     @commands.Cog.listener()
     async def on_guild_channel_create(self, channel: typing.Union[discord.VoiceChannel, discord.TextChannel]):
         """
         Listener used to keep the channels dictionary up to date and avoid name clashes.
         """
         if channel.name in self._channels:
-            Log.error(f"Attempted to create an already existing channel - name clash detected for {channel}")
+            Log.error("Attempted to create an already existing channel - name clash detected", channel=channel)
+            general = strings.General.localised(self.get_locale(guild=channel.guild))
             await self.channels["dof-general"].send(embed=MessageEmbed(
-                strings.General.failed_create_channel.format(channel), negative=True))
+                general.failed_create_channel.format(channel), negative=True))
             self._channels_being_updated.add(channel)
             await channel.delete()
         else:
-            Log.info(f"Channel {channel} created")
+            Log.info("Channel created", channel=channel)
             self._channels[channel.name] = channel
 
     @commands.Cog.listener()
@@ -110,7 +231,7 @@ class Bot(commands.Bot):
         """
         Listener used to keep the channels dictionary up to date.
         """
-        Log.info(f"Channel {channel} deleted")
+        Log.info("Channel deleted", channel=channel)
 
         # Make sure to only delete the channels that aren't part of reverting the creation process
         if channel not in self._channels_being_updated:
@@ -131,19 +252,20 @@ class Bot(commands.Bot):
 
         # Exit early if the name hasn't been changed - safe to update
         if after.name == before.name:
-            Log.info(f"Channel {before} updated")
+            Log.info("Channel updated", channel=before)
             self._channels[before.name] = after
             return
 
         # Revert any changes that create name clashes by editing the channel name to what it was
         if after.name in self._channels:
-            Log.error(f"Attempted to rename {before} channel to {after} - {after} already exists")
+            Log.error("Attempted to rename a channel to an already existing name", channel=before, name=after)
+            general = strings.General.localised(self.get_locale(guild=after.guild))
             await self.channels["dof-general"].send(embed=MessageEmbed(
-                strings.General.failed_rename_channel.format(before, after), negative=True))
+                general.failed_rename_channel.format(before, after), negative=True))
             self._channels_being_updated.add(after)
-            await after.edit(name=before.name, reason=strings.General.update_reason)
+            await after.edit(name=before.name, reason=general.update_reason)
             self._channels[before.name] = after
         else:
-            Log.info(f"Channel {before} updated to {after}")
+            Log.info("Channel renamed", channel=before, name=after)
             self._channels[after.name] = after
             del self._channels[before.name]
@@ -0,0 +1,268 @@
+"""
+Bannerlord characters - the character codes, and the structures used to look the characters up by their names.
+"""
+import re as _re
+import bisect as _bisect
+import collections as _collections
+import functools as _functools
+import typing as _typing
+
+# Declare the length of the n-grams used for the fuzzy search, and how many candidates are ranked by the edit distance
+_NGRAM_LENGTH = 3
+_FUZZY_CANDIDATES = 16
+
+# Declare the patterns used to parse the character codes
+_BODY_PROPERTIES = _re.compile(r'\s*<BodyProperties\s+((?:\w+\s*=\s*"[^"]*"\s*)*)/>\s*\Z')
+_ATTRIBUTE = _re.compile(r'(\w+)\s*=\s*"([^"]*)"')
+
+
+class CharacterError(ValueError):
+    """
+    A standard exception to handle character-related errors (for example malformed character codes).
+    """
+    pass
+
+
+@_functools.lru_cache(maxsize=None)
+def _number(text: str) -> float:
+    """
+    Helper function used to parse the numeric attributes - the same values (such as "0.5") are shared by many codes, so
+    they are only stored once.
+    """
+    return float(text)
+
+
+def _format_number(value: float) -> str:
+    """
+    Helper function used to format the numeric attributes the way they are written in the codes (for example "43"
+    rather than "43.0").
+    """
+    text = repr(value)
+    return text[:-2] if text.endswith(".0") else text
+
+
+class BodyProperties:
+    """
+    Bannerlord character code (the `<BodyProperties ... />` element), parsed into its values - the version, the age,
+    the weight, the build, and the key (decoded from hex into bytes).
+
+    Use `parse` to create the record from the code, and `str` to get the code back.
+    """
+    __slots__ = ("version", "age", "weight", "build", "key")
+
+    def __init__(self, version: int, age: float, weight: float, build: float, key: bytes):
+        self.version = version
+        self.age = age
+        self.weight = weight
+        self.build = build
+        self.key = key
+
+    @classmethod
+    def parse(cls, code: str) -> "BodyProperties":
+        """
+        Parse the character code, raises `CharacterError` if it's malformed.
+        """
+        match = _BODY_PROPERTIES.match(code)
+        if match is None:
+            raise CharacterError("Expected a single <BodyProperties ... /> element")
+
+        attributes = dict(_ATTRIBUTE.findall(match.group(1)))
+        try:
+            return cls(int(attributes["version"]), _number(attributes["age"]), _number(attributes["weight"]),
+                       _number(attributes["build"]), bytes.fromhex(attributes["key"]))
+        except KeyError as e:
+            raise CharacterError(f"Missing {e} attribute")
+        except ValueError as e:
+            raise CharacterError(f"Invalid attribute value - {e}")
+
+    def __str__(self) -> str:
+        return (f'<BodyProperties version="{self.version}" age="{_format_number(self.age)}" '
+                f'weight="{_format_number(self.weight)}" build="{_format_number(self.build)}" '
+                f'key="{self.key.hex().upper()}" />')
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BodyProperties):
+            return NotImplemented
+        return (self.version, self.age, self.weight, self.build, self.key) == \
+            (other.version, other.age, other.weight, other.build, other.key)
+
+    def __hash__(self) -> int:
+        return hash((self.version, self.age, self.weight, self.build, self.key))
+
+
+def normalise_name(name: str) -> str:
+    """
+    Return the name in the form used to store the characters (for example "Olek the Old" -> "olek_the_old").
+    """
+    return str.join("_", name.lower().replace("_", " ").split())
+
+
+def _ngrams(name: str) -> _typing.Set[str]:
+    """
+    Helper function used to split the (padded) name into n-grams, so that the beginning and the end of the name
+    carry more weight.
+    """
+    padded = f"  {name} "
+    return {padded[i:i + _NGRAM_LENGTH] for i in range(len(padded) - _NGRAM_LENGTH + 1)}
+
+
+def _deletions(name: str) -> _typing.Set[str]:
+    """
+    Helper function used to get all variants of the name with a single character removed.
+    """
+    return {name[:i] + name[i + 1:] for i in range(len(name))}
+
+
+def _pattern(name: str) -> _typing.Dict[str, int]:
+    """
+    Helper function used to precompute the bit masks of each character's positions in the name, used to compute the
+    edit distance from this name to many other names.
+    """
+    masks = dict()
+    for i, char in enumerate(name):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _edit_distance(name: str, pattern: _typing.Dict[str, int], other: str) -> int:
+    """
+    Helper function used to compute the Levenshtein distance between the name (with its precomputed pattern) and the
+    other name.
+
+    Uses the bit-parallel algorithm (Myers, as adapted by Hyyrö), processing a whole column of the distance matrix at
+    once, instead of filling the matrix cell by cell.
+    """
+    if not name:
+        return len(other)
+
+    mask = (1 << len(name)) - 1
+    last = 1 << (len(name) - 1)
+    positive, negative, distance = mask, 0, len(name)
+
+    for char in other:
+        matches = pattern.get(char, 0)
+        vertical = matches | negative
+        horizontal = (((matches & positive) + positive) ^ positive) | matches
+        horizontal_positive = negative | (~(horizontal | positive) & mask)
+        horizontal_negative = positive & horizontal
+
+        if horizontal_positive & last:
+            distance += 1
+        elif horizontal_negative & last:
+            distance -= 1
+
+        horizontal_positive = ((horizontal_positive << 1) | 1) & mask
+        horizontal_negative = (horizontal_negative << 1) & mask
+        positive = horizontal_negative | (~(vertical | horizontal_positive) & mask)
+        negative = horizontal_positive & vertical
+
+    return distance
+
+
+class NameIndex:
+    """
+    Index of the character names, built once and used to resolve the user's queries.
+
+    The names are looked up in the following ways:
+
+        - exact match - a single hash lookup
+        - prefix match - a binary search over the sorted names and name words, so "rhag" finds "rhagaea", and "old"
+          finds "olek_the_old"
+        - fuzzy match - the names a single typo away are found by looking up the query's variants with a character
+          removed (each name is indexed by all such variants), otherwise the names sharing the most n-grams with the
+          query are ranked by their edit distance - either way, typos can be answered with the closest names
+
+    The names are normalised with `normalise_name`, and so are the queries.
+    """
+
+    def __init__(self, names: _typing.Iterable[str]):
+        self._names = sorted({normalise_name(name) for name in names})
+        self._ids = {name: i for i, name in enumerate(self._names)}
+
+        # Each name is reachable by its own prefixes, as well as by the prefixes of each of its later words
+        prefixes = list()
+        for i, name in enumerate(self._names):
+            words = name.split("_")
+            for start in range(len(words)):
+                prefixes.append((str.join("_", words[start:]), i))
+        prefixes.sort()
+        self._prefixes = [prefix for prefix, _ in prefixes]
+        self._prefix_ids = [i for _, i in prefixes]
+
+        self._deletions = _collections.defaultdict(list)
+        self._ngrams = _collections.defaultdict(list)
+        for i, name in enumerate(self._names):
+            for deletion in _deletions(name):
+                self._deletions[deletion].append(i)
+            for ngram in _ngrams(name):
+                self._ngrams[ngram].append(i)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return normalise_name(name) in self._ids
+
+    def __iter__(self) -> _typing.Iterator[str]:
+        return iter(self._names)
+
+    def complete(self, prefix: str, limit: int = None) -> _typing.List[str]:
+        """
+        Return the names (or name words) starting with the given prefix, in alphabetical order.
+        """
+        prefix = normalise_name(prefix)
+        if not prefix:
+            return list()
+
+        start = _bisect.bisect_left(self._prefixes, prefix)
+        end = _bisect.bisect_left(self._prefixes, prefix + "\uffff", start)
+        ids = sorted(set(self._prefix_ids[start:end]))
+        return [self._names[i] for i in ids[:limit]]
+
+    def suggest(self, query: str, limit: int = 3) -> _typing.List[str]:
+        """
+        Return up to `limit` names closest to the given query, closest first. Names too different from the query (more
+        edits away than a third of the query's length, but no less than 2 edits) are never suggested.
+        """
+        query = normalise_name(query)
+        if not query:
+            return list()
+
+        pattern = _pattern(query)
+        max_distance = max(2, len(query) // 3)
+
+        # Most typos are a single replaced, missing, additional or swapped character - check these first
+        candidates = set(self._deletions.get(query, ()))
+        for deletion in _deletions(query):
+            candidates.update(self._deletions.get(deletion, ()))
+            if deletion in self._ids:
+                candidates.add(self._ids[deletion])
+        candidates.discard(self._ids.get(query))
+
+        if candidates:
+            ranked = [(_edit_distance(query, pattern, self._names[i]), 0, self._names[i]) for i in candidates]
+        else:
+            shared = _collections.Counter()
+            for ngram in _ngrams(query):
+                shared.update(self._ngrams.get(ngram, ()))
+            ranked = [(_edit_distance(query, pattern, self._names[i]), -count, self._names[i])
+                      for i, count in shared.most_common(_FUZZY_CANDIDATES)]
+
+        return [name for distance, _, name in sorted(ranked) if distance <= max_distance][:limit]
+
+    def resolve(self, query: str) -> _typing.Optional[str]:
+        """
+        Return the name matching the query exactly, or the only name matching the query as a prefix. Returns None if
+        no name or more than one name matches.
+        """
+        query = normalise_name(query)
+        if query in self._ids:
+            return query
+
+        matching = self.complete(query, limit=2)
+        if len(matching) == 1:
+            return matching[0]
+        return None
@@ -45,7 +45,7 @@ class ApplicationCog(commands.Cog):
             return
 
         if message.channel.type == discord.ChannelType.private:
-            Log.debug(f"Received a direct message from {member.display_name}")
+            Log.debug("Received a direct message", member=member.display_name)
 
             # Check if the message is application-related
             if member in self.bot.applications:
@@ -54,9 +54,9 @@ class ApplicationCog(commands.Cog):
 
                 # Once last question was answered, prepare current application for a review and ask for confirmation
                 if self.bot.applications[member].finished:
-                    Log.debug(f"Application by {member.display_name} completed")
-                    await member.send(strings.Application.completed
-                                      .format(self.bot.applications[member].answers))
+                    Log.debug("Application completed", member=member.display_name)
+                    application_strings = strings.Application.localised(self.bot.applications[member].locale)
+                    await member.send(application_strings.completed.format(self.bot.applications[member].answers))
                 else:
                     await member.send(f"{self.bot.applications[member].question}")
 
@@ -72,25 +72,26 @@ class ApplicationCog(commands.Cog):
             3. If application is in progress and finished, submission request message is displayed
         """
         member = ctx.author
-        Log.debug(f"Detected !apply command used by {member.display_name}")
+        application_strings = strings.Application.localised(self.bot.get_locale(member))
+        Log.debug("Detected !apply command", member=member.display_name)
 
         # Apply command is a dm-only command. Not using dm_only check to allow other checks in help command.
         if ctx.guild is not None:
-            Log.debug(f"Detected !apply command in a non-dm context, from {member.display_name}")
-            await member.send(strings.Application.dm_only.format("!apply", "start"))
+            Log.debug("Detected !apply command in a non-dm context", member=member.display_name)
+            await member.send(application_strings.dm_only.format("!apply", "start"))
             return
 
         if member not in self.bot.applications:
-            Log.info(f"Received new application request from {member.display_name}")
-            await member.send(strings.Application.new_application.format(member.display_name))
-            self.bot.applications[member] = MemberApplication(member)
+            Log.info("Received new application request", member=member.display_name)
+            await member.send(application_strings.new_application.format(member.display_name))
+            self.bot.applications[member] = MemberApplication(member, self.bot.get_locale(member))
             await member.send(f"{self.bot.applications[member].question}")
         else:
             if self.bot.applications[member].finished:
-                await member.send(strings.Application.completed
+                await member.send(application_strings.completed
                                   .format(self.bot.applications[member].answers))
             else:
-                await member.send(strings.Application.check_progress
+                await member.send(application_strings.check_progress
                                   .format(self.bot.applications[member].progress, len(MemberApplication.questions),
                                           self.bot.applications[member].question))
 
@@ -105,22 +106,23 @@ class ApplicationCog(commands.Cog):
             2. If application is finished, it is then formatted and submitted to the applications channel
         """
         member = ctx.author
-        Log.debug(f"Detected !submit command used by {member.display_name}")
+        application_strings = strings.Application.localised(self.bot.get_locale(member))
+        Log.debug("Detected !submit command", member=member.display_name)
 
         # Submit command is a dm-only command. Not using dm_only check to allow other checks in help command.
         if ctx.guild is not None:
-            Log.debug(f"Detected !submit command in a non-dm context, from {member.display_name}")
-            await member.send(strings.Application.dm_only.format("!submit", "submit"))
+            Log.debug("Detected !submit command in a non-dm context", member=member.display_name)
+            await member.send(application_strings.dm_only.format("!submit", "submit"))
             return
 
         if member in self.bot.applications and self.bot.applications[member].finished:
-            Log.info(f"Received application submission request from {member.display_name}")
+            Log.info("Received application submission request", member=member.display_name)
 
             await self.submit_application(member)
-            await member.send(strings.Application.submitted.format(member.display_name))
+            await member.send(application_strings.submitted.format(member.display_name))
             del self.bot.applications[member]
         else:
-            await member.send(strings.Application.unfinished.format(member.display_name))
+            await member.send(application_strings.unfinished.format(member.display_name))
 
     @commands.command()
     async def cancel(self, ctx: commands.Context):
@@ -133,27 +135,29 @@ class ApplicationCog(commands.Cog):
             2. If application is started, it is then cancelled and removed from the applications dictionary
         """
         member = ctx.author
-        Log.debug(f"Detected !cancel command used by {member.display_name}")
+        application_strings = strings.Application.localised(self.bot.get_locale(member))
+        Log.debug("Detected !cancel command", member=member.display_name)
 
         # Cancel command is a dm-only command. Not using dm_only check to allow other checks in help command.
         if ctx.guild is not None:
-            Log.debug(f"Detected !cancel command in a non-dm context, from {member.display_name}")
-            await member.send(strings.Application.dm_only.format("!cancel", "cancel"))
+            Log.debug("Detected !cancel command in a non-dm context", member=member.display_name)
+            await member.send(application_strings.dm_only.format("!cancel", "cancel"))
             return
 
         if member in self.bot.applications:
-            Log.info(f"Received application cancellation request from {member.display_name}")
-            await member.send(strings.Application.cancelled.format(member.display_name))
+            Log.info("Received application cancellation request", member=member.display_name)
+            await member.send(application_strings.cancelled.format(member.display_name))
             del self.bot.applications[member]
         else:
-            await member.send(strings.Application.not_started.format(member.display_name))
+            await member.send(application_strings.not_started.format(member.display_name))
 
     async def submit_application(self, member: discord.Member):
         """
         Helper method to format and send an application to the relevant channel.
         """
-        await self.bot.channels["applications"].send(
-            strings.Application.submit.format(member.display_name, self.bot.applications[member].answers))
+        locale = self.bot.get_locale(guild=self.bot.guild)
+        await self.bot.channels["applications"].send(strings.Application.localised(locale).submit.format(
+            member.display_name, self.bot.applications[member].format_answers(locale)))
 
 
 def setup(bot: commands.Bot):
@@ -1,19 +1,35 @@
 """
 Module storing character code fetching functionality.
 """
+import io
+import json
+import asyncio
 import discord
 import typing
 from discord.ext import commands
 from .. import strings
+from ..characters import NameIndex, BodyProperties, CharacterError, normalise_name
+from ..faces import FaceIndex
+from ..store import CharacterDatabase
 from ..utils import Session, LinePaginator, MessageEmbed, Page
 from ..constants import BANNERLORD_CHARACTER_ICON, DONT_CAPITALISE, \
     FEMALE_CHARACTER_SPACE, FEMALE_CHARACTERS_PER_LINE, \
     MALE_CHARACTER_SPACE, MALE_CHARACTERS_PER_LINE, \
-    CUSTOM_CHARACTER_SPACE, CUSTOM_CHARACTERS_PER_LINE
+    CUSTOM_CHARACTER_SPACE, CUSTOM_CHARACTERS_PER_LINE, MAX_CHARACTER_SUGGESTIONS, MAX_SIMILAR_CHARACTERS, \
+    CHARACTERS_DATABASE_PATH
 from ..bot import Bot
 from ..logger import Log
 
 
+class Character(typing.NamedTuple):
+    """
+    Character found by its name or alias - the (full) name, the character code and the category.
+    """
+    name: str
+    body_properties: BodyProperties
+    category: str
+
+
 def split(iterable: typing.Iterable, chunks: int) -> typing.List[typing.List]:
     """
     Helper function to split an iterable into a number of chunks in a tuple.
@@ -26,15 +42,204 @@ def split(iterable: typing.Iterable, chunks: int) -> typing.List[typing.List]:
     return new_items
 
 
-# Fetch the characters by checking if the class annotations start with the character code specific string
-CUSTOM_CHARACTERS = {char[0] for char in strings.CustomCharacters if char[1].startswith("<BodyProperties")}
-FEMALE_CHARACTERS = {char[0] for char in strings.FemaleCharacters if char[1].startswith("<BodyProperties")}
-MALE_CHARACTERS = {char[0] for char in strings.MaleCharacters if char[1].startswith("<BodyProperties")}
+CUSTOM_CHARACTERS: typing.Dict[str, BodyProperties] = dict()
+FEMALE_CHARACTERS: typing.Dict[str, BodyProperties] = dict()
+MALE_CHARACTERS: typing.Dict[str, BodyProperties] = dict()
+# Characters added with the !character add command, loaded from the database - mapping of name to (category, code)
+STORED_CHARACTERS: typing.Dict[str, typing.Tuple[str, BodyProperties]] = dict()
+CUSTOM_CHARACTERS_SPLIT = list()
+FEMALE_CHARACTERS_SPLIT = list()
+
+# Mapping of the character names and aliases to the characters, so that finding a character is a single lookup
+CHARACTERS: typing.Dict[str, Character] = dict()
+MALE_CHARACTERS_SPLIT = list()
+CHARACTER_INDEX = NameIndex(())
+FACE_INDEX = FaceIndex(dict())
+
+# Pages of the character session, built once per locale and shared by all sessions - cleared when the characters change
+SESSION_PAGES: typing.Dict[str, typing.Tuple[str, ...]] = dict()
+
+# Exported character codes (of all characters, or of a single category), built once and cleared when the characters
+# change - the version is increased with each change, so that an outdated export is never stored
+EXPORTS: typing.Dict[typing.Optional[str], bytes] = dict()
+CHARACTERS_VERSION = 0
+
+# Rebuilds of the character collections running in the background, started by the strings updates
+_REBUILDS: typing.Set[asyncio.Task] = set()
+
+
+def format_name(name: str) -> str:
+    """
+    Helper function used to format a character name so it appears properly in the message.
+    """
+    return " ".join(part.capitalize() if part not in DONT_CAPITALISE else part for part in name.split("_"))
+
+
+# Mapping of the category names (as stored in the database) to the characters of each category
+CATEGORIES = {"custom": CUSTOM_CHARACTERS, "female": FEMALE_CHARACTERS, "male": MALE_CHARACTERS}
+
+
+class Catalogue(typing.NamedTuple):
+    """
+    Character collections built from the strings and the stored characters - see `build_characters`.
+    """
+    characters: typing.Dict[str, Character]
+    categories: typing.Dict[str, typing.Dict[str, BodyProperties]]
+    splits: typing.Dict[str, typing.List[typing.List[str]]]
+    index: NameIndex
+    faces: FaceIndex
+
+
+def character_sources() -> tuple:
+    """
+    Helper function used to take a snapshot of the character sources - returns the list of (category, source name,
+    characters) entries (the strings first, then the stored characters) and the list of (alias, name) pairs.
+    """
+    entries = [("custom", strings.CustomCharacters.__name__, list(strings.CustomCharacters)),
+               ("female", strings.FemaleCharacters.__name__, list(strings.FemaleCharacters)),
+               ("male", strings.MaleCharacters.__name__, list(strings.MaleCharacters))]
+    for category in CATEGORIES:
+        stored = [(name, body_properties) for name, (stored_category, body_properties) in STORED_CHARACTERS.items()
+                  if stored_category == category]
+        entries.append((category, CharacterDatabase.__name__, stored))
+    return entries, list(strings.CharacterAliases)
+
+
+def build_characters(entries: list, aliases: list) -> Catalogue:
+    """
+    Helper function used to build the character collections and the search indexes from the given sources (as taken
+    by `character_sources`). Doesn't modify any global state, so it can be called from a background thread.
+
+    The codes are already parsed by the strings classes, and any names or codes used more than once are reported (the
+    first category a name was found in takes precedence, and the strings take precedence over the database). The
+    aliases are added last, and can't replace any of the names - they are only found by an exact match.
+    """
+    sources = dict()
+    names = dict()
+    characters = dict()
+    categories = {category: dict() for category in CATEGORIES}
+
+    for category, source, category_characters in entries:
+        for name, body_properties in category_characters:
+            if name in characters:
+                Log.warning("Found a character declared more than once - only the first one is used", name=name,
+                            category=sources[name], duplicate_category=source)
+                continue
+            if body_properties in names:
+                Log.warning("Found a character code used more than once", name=name,
+                            duplicate_name=names[body_properties])
+
+            sources[name] = source
+            names.setdefault(body_properties, name)
+            categories[category][name] = body_properties
+            characters[name] = Character(name, body_properties, category)
+
+    for alias, name in aliases:
+        alias, name = normalise_name(alias), normalise_name(name)
+        if alias in characters:
+            Log.warning("Found an alias clashing with a character name or another alias - the alias is ignored",
+                        alias=alias, name=name, existing_name=characters[alias].name)
+        elif name not in characters:
+            Log.warning("Found an alias of an unknown character - the alias is ignored", alias=alias, name=name)
+        else:
+            characters[alias] = characters[name]
+
+    # Create lists which store the characters in smaller chunks, so that multiple characters can be displayed same line
+    splits = {category: split(sorted(categories[category]), per_line) for category, per_line in (
+        ("custom", CUSTOM_CHARACTERS_PER_LINE), ("female", FEMALE_CHARACTERS_PER_LINE),
+        ("male", MALE_CHARACTERS_PER_LINE))}
+
+    faces = FaceIndex({name: body_properties for category in categories.values()
+                       for name, body_properties in category.items()})
+    return Catalogue(characters, categories, splits, NameIndex(sources), faces)
+
+
+def swap_characters(catalogue: Catalogue):
+    """
+    Helper function used to replace the character collections (updated in place) and the search indexes with the built
+    ones, and to clear everything derived from the previous characters.
+    """
+    global CHARACTER_INDEX, FACE_INDEX, CHARACTERS_VERSION
+
+    CHARACTERS.clear()
+    CHARACTERS.update(catalogue.characters)
+    for category, characters in CATEGORIES.items():
+        characters.clear()
+        characters.update(catalogue.categories[category])
+
+    CUSTOM_CHARACTERS_SPLIT[:] = catalogue.splits["custom"]
+    FEMALE_CHARACTERS_SPLIT[:] = catalogue.splits["female"]
+    MALE_CHARACTERS_SPLIT[:] = catalogue.splits["male"]
+
+    SESSION_PAGES.clear()
+    EXPORTS.clear()
+    CHARACTERS_VERSION += 1
+    CHARACTER_INDEX = catalogue.index
+    FACE_INDEX = catalogue.faces
+
+
+@strings.on_strings_update
+def update_characters():
+    """
+    Helper function used to (re)build the character collections from the strings and the characters stored in the
+    database - they are updated in place, and the search indexes are rebuilt.
+
+    If called from within the running event loop (for example when the strings are reloaded), the collections are
+    rebuilt in the background (see `rebuild_characters`), otherwise this blocks until they are rebuilt.
+    """
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+
+    if loop is not None and loop.is_running():
+        task = loop.create_task(rebuild_characters(loop))
+        _REBUILDS.add(task)
+        task.add_done_callback(_REBUILDS.discard)
+    else:
+        swap_characters(build_characters(*character_sources()))
+
+
+async def rebuild_characters(loop: asyncio.AbstractEventLoop):
+    """
+    Helper function used to (re)build the character collections in an executor, so that the event loop isn't blocked
+    by (re)building the search indexes, then swap them on the event loop.
+
+    If the characters are changed in the meantime (for example by the strings being reloaded, or another rebuild),
+    the collections are built again, so that the latest sources are always used.
+    """
+    while True:
+        version = CHARACTERS_VERSION
+        catalogue = await loop.run_in_executor(None, build_characters, *character_sources())
+        if version == CHARACTERS_VERSION:
+            swap_characters(catalogue)
+            return
 
-# Create lists which store the characters in smaller chunks, so that multiple characters can be displayed same line
-CUSTOM_CHARACTERS_SPLIT = split(sorted(CUSTOM_CHARACTERS), CUSTOM_CHARACTERS_PER_LINE)
-FEMALE_CHARACTERS_SPLIT = split(sorted(FEMALE_CHARACTERS), FEMALE_CHARACTERS_PER_LINE)
-MALE_CHARACTERS_SPLIT = split(sorted(MALE_CHARACTERS), MALE_CHARACTERS_PER_LINE)
+
+def find_character(query: str) -> typing.Optional[Character]:
+    """
+    Helper function used to find the character by its name or alias, or by the only name matching it as a prefix -
+    returns None if not found. The aliases must match exactly, they aren't searched by their prefixes.
+    """
+    character = CHARACTERS.get(normalise_name(query))
+    if character is None:
+        character = CHARACTERS.get(CHARACTER_INDEX.resolve(query))
+    return character
+
+
+def export_characters(characters: typing.Dict[str, typing.Dict[str, BodyProperties]]) -> bytes:
+    """
+    Helper function used to export the characters (mapping of category to the characters) as a JSON document, with the
+    characters of each category sorted by their names.
+
+    Called from a background thread, so the characters should be a copy which isn't modified while being exported.
+    """
+    return json.dumps({category: {name: str(body_properties) for name, body_properties in sorted(codes.items())}
+                       for category, codes in characters.items()}, indent=2).encode("utf-8")
+
+
+# Build the initial collections straight away, so that the characters are available once the module is imported
+swap_characters(build_characters(*character_sources()))
 
 
 class CharacterNotFound(discord.DiscordException):
@@ -53,50 +258,63 @@ class CharacterSession(Session):
 
     async def build_pages(self):
         """
-        Builds predefined pages and puts them into the paginator.
+        Reuses the pages built for the session's locale, only building them if the characters have changed since.
+        """
+        pages = SESSION_PAGES.get(self.locale)
+        if pages is None:
+            Log.debug("Building character session pages", locale=self.locale)
+            pages = SESSION_PAGES[self.locale] = self.paginate(self.locale)
+
+        # Save organised pages to the session
+        self.pages = pages
+
+    @classmethod
+    def paginate(cls, locale: str) -> typing.Tuple[str, ...]:
+        """
+        Builds predefined pages and puts them into the paginator, returns the (immutable) pages.
         """
+        characters_strings = strings.Characters.localised(locale)
         paginator = LinePaginator(prefix="", suffix="", max_size=4096)
 
         # Add the introduction, then each section will have a separate header and list of characters
         paginator.add_page(Page(
-            strings.Characters.introduction,
+            characters_strings.introduction,
             "",
-            strings.Characters.explanation,
+            characters_strings.explanation,
             "",
-            strings.Characters.example_success,
+            characters_strings.example_success,
             "",
-            "```" + strings.FemaleCharacters.rhagaea + "```"
+            "```" + str(strings.FemaleCharacters.rhagaea) + "```"
         ))
 
-        paginator.add_line(strings.Characters.available_custom_characters)
+        paginator.add_line(characters_strings.available_custom_characters)
         paginator.add_line("```")
         for characters in CUSTOM_CHARACTERS_SPLIT:
-            paginator.add_line("".join(f"{self._format_name(char):<{CUSTOM_CHARACTER_SPACE}}" for char in characters))
+            paginator.add_line("".join(f"{cls._format_name(char):<{CUSTOM_CHARACTER_SPACE}}" for char in characters))
         paginator.add_line("```")
         paginator.close_page()
 
-        paginator.add_line(strings.Characters.available_female_characters)
+        paginator.add_line(characters_strings.available_female_characters)
         paginator.add_line("```")
         for characters in FEMALE_CHARACTERS_SPLIT:
-            paginator.add_line("".join(f"{self._format_name(char):<{FEMALE_CHARACTER_SPACE}}" for char in characters))
+            paginator.add_line("".join(f"{cls._format_name(char):<{FEMALE_CHARACTER_SPACE}}" for char in characters))
         paginator.add_line("```")
         paginator.close_page()
 
-        paginator.add_line(strings.Characters.available_male_characters)
+        paginator.add_line(characters_strings.available_male_characters)
         paginator.add_line("```")
         for characters in MALE_CHARACTERS_SPLIT:
-            paginator.add_line("".join(f"{self._format_name(char):<{MALE_CHARACTER_SPACE}}" for char in characters))
+            paginator.add_line("".join(f"{cls._format_name(char):<{MALE_CHARACTER_SPACE}}" for char in characters))
         paginator.add_line("```")
 
-        # Save organised pages to the session
-        self.pages = paginator.pages
+        return tuple(paginator.pages)
 
     @staticmethod
     def _format_name(name: str):
         """
         Helper function used to format a name so it appears properly in the message.
         """
-        return "• " + " ".join(part.capitalize() if part not in DONT_CAPITALISE else part for part in name.split("_"))
+        return "• " + format_name(name)
 
 
 class CharacterCog(commands.Cog):
@@ -107,8 +325,40 @@ class CharacterCog(commands.Cog):
     def __init__(self, bot: Bot):
         super().__init__()
         self.bot = bot
+        self.database = CharacterDatabase(CHARACTERS_DATABASE_PATH)
+        self._loading = bot.loop.create_task(self.load_characters())
+
+    def cog_unload(self):
+        """
+        Stops loading the stored characters (if still loading) and closes the database.
+        """
+        self._loading.cancel()
+        self.database.close()
 
-    @commands.command(aliases=["characters"])
+    async def load_characters(self):
+        """
+        Loads the characters stored in the database (in the background), and rebuilds the character collections.
+        """
+        stored = await self.database.characters()
+        STORED_CHARACTERS.clear()
+        STORED_CHARACTERS.update((name, (category, body_properties)) for name, category, body_properties in stored)
+        await rebuild_characters(self.bot.loop)
+        Log.info("Stored characters loaded", count=len(stored))
+
+    @staticmethod
+    def _not_found(name: str, characters_strings: typing.Any) -> CharacterNotFound:
+        """
+        Helper function used to create the error informing about an invalid character, with the names starting with
+        the query (if it's ambiguous), or the closest ones (if it's a typo) suggested.
+        """
+        suggestions = CHARACTER_INDEX.complete(name, limit=MAX_CHARACTER_SUGGESTIONS) \
+            or CHARACTER_INDEX.suggest(name, limit=MAX_CHARACTER_SUGGESTIONS)
+        if suggestions:
+            return CharacterNotFound(characters_strings.invalid_character_suggestions.format(
+                name, str.join(", ", (format_name(suggestion) for suggestion in suggestions))))
+        return CharacterNotFound(characters_strings.invalid_character.format(name))
+
+    @commands.group(aliases=["characters"], invoke_without_command=True)
     async def character(self, ctx: commands.Context, *name):
         """
         Provides a character code (you can copy the code into the character edition screen in Bannerlord).
@@ -117,27 +367,137 @@ class CharacterCog(commands.Cog):
 
            1. `!character` -> explains how to get a character code and which names are available
            2. `!character <name>` -> returns the specific character code using the input name
+           3. `!character similar <name>` -> lists the characters with the faces most similar to the given character
+           4. `!character export [male|female|custom]` -> sends a file with the codes of the characters
+           5. `!character add <name> <code>` -> (Defender-only) adds a custom character
+
+        The name can be shortened, as long as only one character matches it. If no character matches, the closest
+        names are suggested instead.
         """
         member = ctx.author
-        Log.debug(f"Detected !character command used by {member.display_name}")
+        characters_strings = strings.Characters.localised(self.bot.get_locale(member))
+        Log.debug("Detected !character command", member=member.display_name)
 
         if name:
-            # Make sure commands such as "!character Rhagaea" or "!character Stannis Baratheon" work
-            name_formatted = "_".join(part.lower() for part in name) if len(name) > 1 else name[0].lower()
+            # Make sure commands such as "!character Rhagaea", "!character Stannis Baratheon" or "!character rhag" work
             name = " ".join(part for part in name) if len(name) > 1 else name[0]
-            Log.debug(f"Retrieving \"{name_formatted}\" character preset, requested by {member.display_name}")
+            character = find_character(name)
+            Log.debug("Retrieving character preset", member=member.display_name, name=name,
+                      resolved=lambda: character and character.name)
 
             # Embed the character code in a nicely visible "box"
-            if name_formatted in MALE_CHARACTERS:
-                await ctx.send(embed=MessageEmbed(getattr(strings.MaleCharacters, name_formatted)))
-            elif name_formatted in FEMALE_CHARACTERS:
-                await ctx.send(embed=MessageEmbed(getattr(strings.FemaleCharacters, name_formatted)))
-            elif name_formatted in CUSTOM_CHARACTERS:
-                await ctx.send(embed=MessageEmbed(getattr(strings.CustomCharacters, name_formatted)))
+            if character is not None:
+                await ctx.send(embed=MessageEmbed(str(character.body_properties)))
             else:
-                await self.character_handler(ctx, CharacterNotFound(strings.Characters.invalid_character.format(name)))
+                await self.character_handler(ctx, self._not_found(name, characters_strings))
         else:
-            await CharacterSession.start(ctx, strings.Characters.title, icon=BANNERLORD_CHARACTER_ICON)
+            await CharacterSession.start(ctx, characters_strings.title, icon=BANNERLORD_CHARACTER_ICON)
+
+    @character.command()
+    async def similar(self, ctx: commands.Context, *name):
+        """
+        Lists the characters with the faces most similar to the given character's face.
+
+        For example, `!character similar rhagaea` -> lists the characters which look the most like Rhagaea
+        """
+        member = ctx.author
+        characters_strings = strings.Characters.localised(self.bot.get_locale(member))
+        Log.debug("Detected !character similar command", member=member.display_name)
+
+        if not name:
+            await ctx.send(embed=MessageEmbed(characters_strings.similar_missing_name, negative=True))
+            return
+
+        name = " ".join(part for part in name)
+        character = find_character(name)
+        Log.debug("Retrieving similar characters", member=member.display_name, name=name,
+                  resolved=lambda: character and character.name)
+
+        if character is None:
+            await self.character_handler(ctx, self._not_found(name, characters_strings))
+        else:
+            similar = FACE_INDEX.similar(character.body_properties, limit=MAX_SIMILAR_CHARACTERS,
+                                         exclude={character.name})
+            await ctx.send(embed=MessageEmbed(characters_strings.similar_characters.format(
+                format_name(character.name), str.join(", ", (format_name(other) for other, _ in similar)))))
+
+    @character.command()
+    async def export(self, ctx: commands.Context, category: str = None):
+        """
+        Sends a JSON file with the codes of all characters, or of the given category (male, female or custom).
+
+        For example, `!character export female` -> sends the codes of all female characters
+        """
+        member = ctx.author
+        characters_strings = strings.Characters.localised(self.bot.get_locale(member))
+        Log.debug("Detected !character export command", member=member.display_name, category=category)
+
+        category = category.lower() if category else None
+        if category is not None and category not in CATEGORIES:
+            await ctx.send(embed=MessageEmbed(characters_strings.invalid_export_category.format(
+                category, str.join(", ", CATEGORIES)), negative=True))
+            return
+
+        data = EXPORTS.get(category)
+        if data is None:
+            # Only copy the characters here, the (much slower) export happens in the background
+            version = CHARACTERS_VERSION
+            characters = {name: dict(CATEGORIES[name]) for name in ((category,) if category else CATEGORIES)}
+            data = await self.bot.loop.run_in_executor(None, export_characters, characters)
+
+            if version == CHARACTERS_VERSION:
+                EXPORTS[category] = data
+            Log.debug("Exported characters", category=category, size=len(data))
+
+        await ctx.send(embed=MessageEmbed(characters_strings.characters_exported),
+                       file=discord.File(io.BytesIO(data), filename=f"{category or 'all'}_characters.json"))
+
+    @character.command()
+    @commands.has_role("Defender")
+    async def add(self, ctx: commands.Context, name: str, *, code: str):
+        """
+        Add command is a Defender-only command used to add a custom character, stored in the database.
+
+        For example, `!character add "Olek the Young" <BodyProperties version="4" ... />` -> adds Olek the Young
+        """
+        member = ctx.author
+        characters_strings = strings.Characters.localised(self.bot.get_locale(member))
+        Log.debug("Detected !character add command", member=member.display_name, name=name)
+
+        try:
+            body_properties = BodyProperties.parse(code)
+        except CharacterError as e:
+            await ctx.send(embed=MessageEmbed(characters_strings.invalid_character_code.format(e), negative=True))
+            return
+
+        # Names of the subcommands would never reach the character (the subcommand would be invoked instead)
+        name_normalised = normalise_name(name)
+        if not name_normalised or name_normalised in self.character.all_commands:
+            await ctx.send(embed=MessageEmbed(characters_strings.invalid_character_name.format(name), negative=True))
+            return
+
+        if name_normalised in CHARACTERS or not await self.database.add(
+                name_normalised, "custom", body_properties, author=str(member)):
+            await ctx.send(embed=MessageEmbed(characters_strings.character_exists.format(format_name(name_normalised)),
+                                              negative=True))
+            return
+
+        STORED_CHARACTERS[name_normalised] = ("custom", body_properties)
+        await rebuild_characters(self.bot.loop)
+        Log.info("Character added", member=member.display_name, name=name_normalised)
+        await ctx.send(embed=MessageEmbed(characters_strings.character_added.format(format_name(name_normalised))))
+
+    @add.error
+    async def add_handler(self, ctx: commands.Context, error: discord.DiscordException):
+        """
+        Custom handler needed to handle the custom errors - the user should be informed about a missing role or
+        missing arguments.
+        """
+        if isinstance(error, (commands.MissingRole, commands.UserInputError)):
+            Log.debug("Caught invalid character add query error", error=error)
+            await ctx.send(embed=MessageEmbed(str(error), negative=True))
+        else:
+            raise
 
     @character.error
     async def character_handler(self, ctx: commands.Context, error: discord.DiscordException):
@@ -145,7 +505,7 @@ class CharacterCog(commands.Cog):
         Custom handler needed to handle the custom error - the user should be informed about an invalid character.
         """
         if isinstance(error, CharacterNotFound):
-            Log.debug(f"Caught invalid character error - {error}")
+            Log.debug("Caught invalid character error", error=error)
             await ctx.send(embed=MessageEmbed(str(error), negative=True))
         else:
             raise
@@ -8,7 +8,7 @@ from .. import strings
 from ..bot import Bot
 from ..logger import Log
 from ..constants import MAX_HELP_LINES, COMMAND_PREFIX, COMMANDS_ORDER
-from ..utils import Session, LinePaginator, MessageEmbed
+from ..utils import Session, LinePaginator, MessageEmbed, Page
 
 
 class HelpQueryNotFound(discord.DiscordException):
@@ -52,7 +52,7 @@ class HelpSession(Session):
         """
         Retrieves all commands and formats them correctly
         """
-        Log.debug(f"Displaying global help (all commands) for {self.author}")
+        Log.debug("Displaying global help (all commands)", member=self.author)
 
         # Sort the commands by the index in the ordering and add them to the help message
         for command in sorted(self.bot.commands, key=lambda cmd: COMMANDS_ORDER.index(cmd.name)):
@@ -61,7 +61,7 @@ class HelpSession(Session):
             try:
                 await command.can_run(self.ctx)
             except commands.CheckFailure:
-                Log.debug(f"{self.author} is not allowed to use the {command.name} command")
+                Log.debug("Member is not allowed to use the command", member=self.author, command=command.name)
                 continue
 
             # Retrieve command name. signature and docs (description)
@@ -71,24 +71,20 @@ class HelpSession(Session):
             else:
                 details = f"{info}\n*No details provided.*"
 
-            if paginator.lines_count + len(details.split("\n")) > MAX_HELP_LINES:
-                paginator.lines_count = 0
-                paginator.close_page()
-
-            paginator.add_line(details)
-            paginator.add_line("")
+            # Keep the command details together, on a single page
+            paginator.add_block(Page(details, ""))
 
     async def command_help(self, paginator: LinePaginator, command: commands.Command):
         """
         Retrieves command-related information and formats it correctly.
         """
-        Log.debug(f"Displaying command-specific help about {command.name} for {self.author}")
+        Log.debug("Displaying command-specific help", member=self.author, command=command.name)
 
         # Skip any commands which can't be run
         try:
             await command.can_run(self.ctx)
         except commands.CheckFailure as e:
-            Log.debug(f"{self.author} is not allowed to use the {command.name} command")
+            Log.debug("Member is not allowed to use the command", member=self.author, command=command.name)
             await self.ctx.send(embed=MessageEmbed(str(e), negative=True))
             return
 
@@ -99,7 +95,7 @@ class HelpSession(Session):
         aliases = ", ".join(f"`{a}`" for a in command.aliases)
         if aliases:
             paginator.add_line("")
-            paginator.add_line(strings.Help.help_aliases.format(aliases))
+            paginator.add_line(strings.Help.localised(self.locale).help_aliases.format(aliases))
 
 
 class HelpCog(commands.Cog):
@@ -127,20 +123,21 @@ class HelpCog(commands.Cog):
         stop the session early and remove it.
         """
         member = ctx.author
-        Log.debug(f"Detected !help command used by {member.display_name}")
+        help_strings = strings.Help.localised(ctx.bot.get_locale(member))
+        Log.debug("Detected !help command", member=member.display_name)
 
         # Set the query details for the session - query is either a command object, or a bot object
         if command:
             query = ctx.bot.get_command(command)
             if not query:
-                await self.help_handler(ctx, HelpQueryNotFound(strings.Help.invalid_query.format(command)))
+                await self.help_handler(ctx, HelpQueryNotFound(help_strings.invalid_query.format(command)))
             else:
                 ctx.query = query
-                title = str.join(" | ", (strings.Help.help_title, query.name))
+                title = str.join(" | ", (help_strings.help_title, query.name))
                 await HelpSession.start(ctx, title)
         else:
             ctx.query = ctx.bot
-            title = strings.Help.help_title
+            title = help_strings.help_title
             await HelpSession.start(ctx, title)
 
     @help.error
@@ -149,7 +146,7 @@ class HelpCog(commands.Cog):
         Custom handler needed to handle the custom error - the user should be informed about an invalid query.
         """
         if isinstance(error, HelpQueryNotFound):
-            Log.debug(f"Caught invalid query error - {error}")
+            Log.debug("Caught invalid query error", error=error)
             await ctx.send(embed=MessageEmbed(str(error), negative=True))
         else:
             raise error
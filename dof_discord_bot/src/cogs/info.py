@@ -1,13 +1,16 @@
 """
 Module storing DoF info-related and welcome functionalities, as well as bot-related informational commands.
 """
+import math
 import discord
+import typing
 from dof_discord_bot import __version__, __title__
 from discord.ext import commands
 from .. import strings
 from ..bot import Bot
-from ..logger import Log
-from ..utils import Session, Page, LinePaginator, MessageEmbed
+from ..logger import Log, LogError
+from ..constants import DEFAULT_LOGS_COUNT, MAX_LOGS_LINES
+from ..utils import Session, Page, LinePaginator, MessageEmbed, PageSource
 
 
 class InfoSession(Session):
@@ -18,60 +21,105 @@ class InfoSession(Session):
         """
         Builds predefined pages and puts them into the paginator.
         """
+        info = strings.Info.localised(self.locale)
         paginator = LinePaginator(prefix="", suffix="")
 
         # Add general info page
         paginator.add_page(Page(
-            strings.Info.bot_welcome,
+            info.bot_welcome,
             "",
-            strings.Info.bot_tutorial,
+            info.bot_tutorial,
             "",
-            strings.Info.bot_browse,
+            info.bot_browse,
             "",
-            strings.Info.bot_output
+            info.bot_output
         ))
 
         # Add rules page
         paginator.add_page(Page(
-            strings.Info.rules_welcome,
+            info.rules_welcome,
             "",
-            strings.Info.rules_first,
-            strings.Info.rules_second,
-            strings.Info.rules_third,
-            strings.Info.rules_fourth,
-            strings.Info.rules_fifth,
-            strings.Info.rules_sixth
+            info.rules_first,
+            info.rules_second,
+            info.rules_third,
+            info.rules_fourth,
+            info.rules_fifth,
+            info.rules_sixth
         ))
 
         # Add links page
         paginator.add_page(Page(
-            strings.Info.links_welcome,
+            info.links_welcome,
             "",
-            strings.Info.links_ts,
+            info.links_ts,
             "",
-            strings.Info.links_website,
+            info.links_website,
             "",
-            strings.Info.links_public_steam,
+            info.links_public_steam,
             "",
-            strings.Info.links_private_steam
+            info.links_private_steam
         ))
 
         # Add authors page
         paginator.add_page(Page(
-            strings.Info.authors_welcome,
+            info.authors_welcome,
             "",
-            strings.Info.authors_bertalicious,
-            strings.Info.authors_white_noise,
+            info.authors_bertalicious,
+            info.authors_white_noise,
             "",
-            strings.Info.authors_support,
+            info.authors_support,
             "",
-            strings.Info.authors_link
+            info.authors_link
         ))
 
         # Save organised pages to session
         self.pages = paginator.pages
 
 
+class LogsSession(Session):
+    """
+    Logs Session handling properly displaying the most recent log records in an interactive, per-user session.
+    """
+
+    # noinspection PyUnresolvedReferences
+    def __init__(self, ctx: commands.Context, *args, **kwargs):
+        """
+        Overridden init to include query information - each logs query is a list of formatted log records.
+        """
+        self.query: typing.List[str] = ctx.query
+        super().__init__(ctx, *args, **kwargs)
+
+    async def build_pages(self):
+        """
+        Sets the pages to be produced from the queried records, once the user visits them.
+        """
+        self.pages = LogsPageSource(self.query)
+
+
+class LogsPageSource(PageSource):
+    """
+    Source of the logs session pages, each record is a separate (possibly multi-line) paginator line.
+    """
+
+    def __init__(self, records: typing.List[str]):
+        super().__init__(estimated_count=math.ceil(len(records) / MAX_LOGS_LINES))
+        self.records = records
+
+    async def produce(self) -> typing.AsyncIterator[str]:
+        """
+        Produces the pages of up to the maximum number of records each.
+        """
+        for start in range(0, len(self.records), MAX_LOGS_LINES):
+            paginator = LinePaginator(prefix="```", suffix="```", max_lines=MAX_LOGS_LINES)
+
+            # Make sure the records can't break the code block formatting
+            for record in self.records[start:start + MAX_LOGS_LINES]:
+                paginator.add_line(record.replace("```", "'''"))
+
+            for page in paginator.pages:
+                yield page
+
+
 class InformationCog(commands.Cog):
     """
     Information Cog is a discord extension providing a set of DoF-related informational commands and listeners.
@@ -86,8 +134,9 @@ class InformationCog(commands.Cog):
         """
         Listener providing a way to listen to a new member joining DoF discord, to welcome them properly.
         """
-        Log.info(f"{member.display_name} joined DoF discord for the first time")
-        await self.bot.channels["chat"].send(strings.Info.welcome.format(member.mention))
+        Log.info("Member joined DoF discord for the first time", member=member.display_name)
+        info = strings.Info.localised(self.bot.get_locale(member))
+        await self.bot.channels["chat"].send(info.welcome.format(member.mention))
 
     @commands.command()
     async def info(self, ctx: commands.Context):
@@ -96,7 +145,7 @@ class InformationCog(commands.Cog):
         """
         member = ctx.author
 
-        Log.debug(f"Detected !info command used by {member.display_name}")
+        Log.debug("Detected !info command", member=member.display_name)
         await InfoSession.start(ctx, "Information")
 
     @commands.command()
@@ -107,8 +156,8 @@ class InformationCog(commands.Cog):
         """
         member: discord.Member = ctx.author
 
-        Log.debug(f"Detected !version command used by {member.display_name}")
-        Log.debug(f"{member.display_name}'s roles are {tuple(role.name for role in member.roles)}")
+        Log.debug("Detected !version command", member=member.display_name,
+                  roles=lambda: tuple(role.name for role in member.roles))
         await ctx.send(embed=MessageEmbed(f"{__title__} v{__version__}"))
 
     @version.error
@@ -117,11 +166,89 @@ class InformationCog(commands.Cog):
         Custom handler needed to handle the custom error - the user should be informed about an invalid character.
         """
         if isinstance(error, commands.MissingRole):
-            Log.debug(f"Caught missing role error - {error}")
+            Log.debug("Caught missing role error", error=error)
             await ctx.send(embed=MessageEmbed(str(error), negative=True))
         else:
             raise
 
+    @commands.command()
+    @commands.has_role("Defender")
+    async def logs(self, ctx: commands.Context, level: str = "debug", count: int = DEFAULT_LOGS_COUNT):
+        """
+        Logs command is a Defender-only command used to display the most recent log records.
+
+        Some examples of the command:
+
+            1. `!logs` -> displays the most recent records of all levels
+            2. `!logs error 10` -> displays up to 10 most recent error records
+
+        The records are kept in memory, so only a limited number of the most recent records is available.
+        """
+        member: discord.Member = ctx.author
+        info = strings.Info.localised(self.bot.get_locale(member))
+        Log.debug("Detected !logs command", member=member.display_name, level=level, count=count)
+
+        try:
+            records = Log.recent(level, count)
+        except LogError as e:
+            await ctx.send(embed=MessageEmbed(info.invalid_logs_query.format(e), negative=True))
+            return
+
+        if records:
+            ctx.query = records
+            await LogsSession.start(ctx, info.logs_title.format(level.upper()))
+        else:
+            await ctx.send(embed=MessageEmbed(info.logs_not_found.format(level.upper()), negative=True))
+
+    @logs.error
+    async def logs_handler(self, ctx: commands.Context, error: discord.DiscordException):
+        """
+        Custom handler needed to handle the custom errors - the user should be informed about a missing role or an
+        invalid records count.
+        """
+        if isinstance(error, (commands.MissingRole, commands.BadArgument)):
+            Log.debug("Caught invalid logs query error", error=error)
+            await ctx.send(embed=MessageEmbed(str(error), negative=True))
+        else:
+            raise
+
+    @commands.command()
+    async def locale(self, ctx: commands.Context, locale: str = "", scope: str = "user"):
+        """
+        Locale command is used to display or change the language of the bot's messages.
+
+        Some examples of the command:
+
+            1. `!locale` -> displays your current language and all available languages
+            2. `!locale de` -> sets your language to German
+            3. `!locale de server` -> (Defender-only) sets the default language of the server to German
+        """
+        member: discord.Member = ctx.author
+        Log.debug("Detected !locale command", member=member.display_name, locale=locale, scope=scope)
+
+        info = strings.Info.localised(self.bot.get_locale(member))
+        available = str.join(", ", (f"`{available}`" for available in strings.available_locales()))
+
+        if not locale:
+            await ctx.send(embed=MessageEmbed(info.locale_current.format(self.bot.get_locale(member), available)))
+            return
+
+        locale = strings.normalise_locale(locale)
+        if locale not in strings.available_locales():
+            await ctx.send(embed=MessageEmbed(info.invalid_locale.format(locale, available), negative=True))
+            return
+
+        if scope.lower() == "server":
+            if not any(role.name == "Defender" for role in getattr(member, "roles", ())):
+                await ctx.send(embed=MessageEmbed(str(commands.MissingRole("Defender")), negative=True))
+                return
+            self.bot.set_locale(self.bot.guild, locale)
+            info = strings.Info.localised(self.bot.get_locale(member))
+            await ctx.send(embed=MessageEmbed(info.locale_server_updated.format(locale)))
+        else:
+            self.bot.set_locale(member, locale)
+            await ctx.send(embed=MessageEmbed(strings.Info.localised(locale).locale_updated.format(locale)))
+
 
 def setup(bot: commands.Bot):
     """
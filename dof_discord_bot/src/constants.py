@@ -15,6 +15,7 @@ DOF_DISCORD_BOT_DIR = _os.path.join(ROOT_DIR, "dof_discord_bot")
 SRC_DIR = _os.path.join(DOF_DISCORD_BOT_DIR, "src")
 LOG_DIR = _os.path.join(DOF_DISCORD_BOT_DIR, "log")
 RES_DIR = _os.path.join(DOF_DISCORD_BOT_DIR, "res")
+DATA_DIR = _os.path.join(DOF_DISCORD_BOT_DIR, "data")
 TESTS_DIR = _os.path.join(ROOT_DIR, "tests")
 
 # Load environment variables
@@ -39,6 +40,8 @@ COMMANDS_ORDER = [
     "info",
     "help",
     "version",
+    "logs",
+    "locale",
     "apply",
     "submit",
     "cancel",
@@ -56,9 +59,19 @@ LAST_PAGE_EMOJI = "\u23ED"
 DEFAULT_SESSION_ICON = "https://cdn.discordapp.com/emojis/512367613339369475.png"
 BANNERLORD_CHARACTER_ICON = "https://cdn.discordapp.com/emojis/705858278005145601.png"
 
+# Declare how many session page embeds are cached (the embeds are shared by all sessions displaying the same pages)
+PAGE_EMBEDS_CACHE_SIZE = 256
+
+# Declare how many sessions can be active at once - the least recently used sessions are stopped above the limit
+MAX_SESSIONS = 100
+
 # Declare the maximum number of the lines for the !help command
 MAX_HELP_LINES = 8
 
+# Declare the default number of records and the maximum number of records per page for the !logs command
+DEFAULT_LOGS_COUNT = 50
+MAX_LOGS_LINES = 10
+
 # Declare the constant to avoid capitalisation of some words in !character command
 DONT_CAPITALISE = {"of", "the", "by"}
 
@@ -71,3 +84,24 @@ MALE_CHARACTERS_PER_LINE = 4
 CUSTOM_CHARACTER_SPACE = 30
 FEMALE_CHARACTER_SPACE = 12
 MALE_CHARACTER_SPACE = 12
+
+# Declare how many names should be suggested if the !character command doesn't match any character
+MAX_CHARACTER_SUGGESTIONS = 3
+
+# Declare how many characters should be listed by the !character similar command
+MAX_SIMILAR_CHARACTERS = 5
+
+# Declare how often (in seconds) the strings file should be checked for changes, to reload the strings
+STRINGS_RELOAD_INTERVAL = 5
+
+# Declare the locale of the main strings file, used unless a user or the server selects a different one
+DEFAULT_LOCALE = "en"
+
+# Declare the path to the database storing the locales selected by the users and the server with the !locale command
+LOCALES_DATABASE_PATH = _os.path.join(DATA_DIR, "locales.db")
+
+# Declare the path to the database storing the characters added with the !character add command
+CHARACTERS_DATABASE_PATH = _os.path.join(DATA_DIR, "characters.db")
+
+# Declare the path to the database storing the active sessions, so that they can be restored after a restart
+SESSIONS_DATABASE_PATH = _os.path.join(DATA_DIR, "sessions.db")
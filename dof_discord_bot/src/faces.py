@@ -0,0 +1,57 @@
+"""
+Bannerlord character faces - the structures used to compare the faces encoded in the character codes.
+
+Kept apart from the `characters` module, so that loading the strings doesn't need to import numpy.
+"""
+import numpy as _numpy
+import typing as _typing
+from .characters import BodyProperties as _BodyProperties
+
+
+class FaceIndex:
+    """
+    Index of the character faces, used to find the characters with the faces most similar to a given face.
+
+    Each face key is unpacked into nibbles (each hex digit of the key is a separate value) and stored as a row of a
+    single contiguous matrix, built once. A query compares the face to all faces at once, as the sum of the absolute
+    nibble differences (L1 distance) - the lower the distance, the more similar the faces are.
+    """
+
+    def __init__(self, faces: _typing.Mapping[str, _BodyProperties]):
+        self._names = list(faces)
+        self._width = max((len(face.key) for face in faces.values()), default=0)
+        self._nibbles = self._unpack([face.key for face in faces.values()])
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _unpack(self, keys: _typing.List[bytes]) -> _numpy.ndarray:
+        """
+        Helper function used to unpack the keys into a matrix of nibbles, one row per key. Shorter keys are padded with
+        zeros, and longer keys are truncated to the widest indexed key.
+        """
+        data = b"".join(key[:self._width].ljust(self._width, b"\0") for key in keys)
+        packed = _numpy.frombuffer(data, dtype=_numpy.uint8).reshape(len(keys), self._width)
+
+        nibbles = _numpy.empty((len(keys), self._width * 2), dtype=_numpy.int8)
+        nibbles[:, 0::2] = packed >> 4
+        nibbles[:, 1::2] = packed & 0x0F
+        return nibbles
+
+    def similar(self, face: _BodyProperties, limit: int = 5,
+                exclude: _typing.Collection[str] = ()) -> _typing.List[_typing.Tuple[str, int]]:
+        """
+        Return up to `limit` (name, distance) pairs of the characters with the faces most similar to the given face,
+        most similar first. Characters with names in `exclude` are skipped.
+        """
+        if not self._names or limit <= 0:
+            return list()
+
+        distances = _numpy.abs(self._nibbles - self._unpack([face.key])).sum(axis=1)
+
+        # Only sort the closest faces (enough of them to still have `limit` faces after skipping the excluded ones)
+        count = min(len(self._names), limit + len(exclude))
+        closest = _numpy.argpartition(distances, count - 1)[:count]
+        closest = closest[_numpy.lexsort((closest, distances[closest]))]
+
+        return [(self._names[i], int(distances[i])) for i in closest if self._names[i] not in exclude][:limit]
@@ -5,14 +5,29 @@ The config.json file stored within the res folder is used to configure most of t
 working with this module provides more direct control over the mechanisms.
 """
 from .constants import LOG_DIR as _LOG_DIR, RES_DIR as _RES_DIR
+from ..res import verbose_file_handler as _verbose
+from ..res import ring_buffer_handler as _ring_buffer
 import logging as _logging
 import logging.config as _config
+import logging.handlers as _handlers
+import atexit as _atexit
+import queue as _queue
 import json as _json
+import sys as _sys
 import os as _os
 
 _CONFIG_FILE_PATH = _os.path.join(_RES_DIR, "config.json")
+_LOGGER_NAME = "dof-discord-bot"
 _FILE_HANDLERS = {"logging.FileHandler", "dof_discord_bot.res.restricted_file_handler._RestrictedFileHandler",
-                  "dof_discord_bot.res.verbose_file_handler._VerboseFileHandler"}
+                  "dof_discord_bot.res.verbose_file_handler._VerboseFileHandler",
+                  "dof_discord_bot.res.rotating_file_handler._RotatingFileHandler"}
+_MULTI_FILE_HANDLERS = {"dof_discord_bot.res.routing_file_handler._LevelRoutingFileHandler"}
+
+# Let the logging module skip the `Log` methods when looking for the caller (supported since Python 3.8)
+_CALLER_KWARGS = {"stacklevel": 2} if _sys.version_info >= (3, 8) else {}
+
+# Declare the keyword arguments consumed by the logging module - any other keyword arguments are structured fields
+_LOGGING_KWARGS = {"exc_info", "stack_info", "stacklevel", "extra"}
 
 
 class LogError(Exception):
@@ -22,7 +37,145 @@ class LogError(Exception):
     pass
 
 
-def _configure(config_file_path: str = _CONFIG_FILE_PATH, log_directory: str = _LOG_DIR):
+class _StructuredMessage:
+    """
+    Log message with key/value fields, rendered only when (and if) a handler formats the record.
+
+    Callable field values are called during rendering, so any expensive value can be passed lazily, for example::
+
+        Log.debug("Member roles retrieved", member=member.display_name, roles=lambda: [r.name for r in member.roles])
+
+    is rendered as::
+
+        Member roles retrieved | member=Bertalicious roles=['Defender', '@everyone']
+    """
+    __slots__ = "message", "args", "fields"
+
+    def __init__(self, message: str, args: tuple, fields: dict):
+        self.message = message
+        self.args = args
+        self.fields = fields
+
+    def __str__(self) -> str:
+        message = self.message % self.args if self.args else self.message
+        fields = " ".join(f"{key}={value() if callable(value) else value}" for key, value in self.fields.items())
+        return f"{message} | {fields}"
+
+
+def _structure(message: str, args: tuple, kwargs: dict) -> tuple:
+    """
+    Helper function used to split the keyword arguments into the logging module arguments and the structured fields.
+
+    Returns the message (wrapped with the fields if there are any), the message arguments and the logging module
+    keyword arguments.
+    """
+    if not kwargs:
+        return message, args, _CALLER_KWARGS
+
+    logging_kwargs = dict(_CALLER_KWARGS)
+    fields = dict()
+    for key, value in kwargs.items():
+        if key in _LOGGING_KWARGS:
+            logging_kwargs[key] = value
+        else:
+            fields[key] = value
+
+    if not fields:
+        return message, args, logging_kwargs
+    return _StructuredMessage(message, args, fields), (), logging_kwargs
+
+
+class _QueueHandler(_handlers.QueueHandler):
+    """
+    Queue handler which leaves the formatting to the handlers served by the listener thread.
+
+    The records never leave the process, so only the message is merged with its arguments (to avoid reading objects
+    which may have been modified in the meantime) - everything else is done in the background.
+    """
+
+    def __init__(self, queue: _queue.Queue, resolve_callers: bool = False):
+        """
+        The `resolve_callers` argument should be set if any of the served handlers resolves the callers by walking
+        the stack, which is only possible from within the thread which logged the record.
+        """
+        super().__init__(queue)
+        self.resolve_callers = resolve_callers
+
+    def prepare(self, record: _logging.LogRecord) -> _logging.LogRecord:
+        """
+        Overridden function modified to avoid formatting the record on the calling thread.
+        """
+        if self.resolve_callers:
+            _verbose._resolve_caller(record)
+
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Listener running in the background and passing the queued records to the actual handlers, if queueing is enabled
+_listener: _handlers.QueueListener = None
+
+
+def _start_listener(logger: _logging.Logger):
+    """
+    Helper function used to move all handlers of the logger to a background thread.
+
+    The logger will then only put records on a queue, which never blocks the calling thread.
+    """
+    global _listener
+
+    handlers = logger.handlers[:]
+    for handler in handlers:
+        logger.removeHandler(handler)
+
+    queue = _queue.Queue()
+    resolve_callers = any(getattr(handler, "caller_resolution", None) == _verbose.FRAME_RESOLUTION
+                          for handler in handlers)
+    logger.addHandler(_QueueHandler(queue, resolve_callers=resolve_callers))
+    _listener = _handlers.QueueListener(queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener():
+    """
+    Helper function used to write out all queued records, stop the background thread and give the handlers back to
+    the logger, which will then log synchronously.
+
+    Does nothing if queueing isn't enabled.
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    # Stopping the listener processes all records that are still on the queue
+    _listener.stop()
+    logger = _logging.getLogger(_LOGGER_NAME)
+    for handler in logger.handlers[:]:
+        if isinstance(handler, _QueueHandler):
+            logger.removeHandler(handler)
+    for handler in _listener.handlers:
+        logger.addHandler(handler)
+        handler.flush()
+
+    _listener = None
+
+
+def _get_handlers(logger: _logging.Logger) -> list:
+    """
+    Helper function used to retrieve the handlers actually handling the records, including the queued ones.
+    """
+    if _listener is not None:
+        return list(_listener.handlers)
+    return logger.handlers[:]
+
+
+# Make sure no records are lost if the interpreter exits without the bot being closed
+_atexit.register(_stop_listener)
+
+
+def _configure(config_file_path: str = _CONFIG_FILE_PATH, log_directory: str = _LOG_DIR, queued: bool = None):
     """
     Helper function to configure the built-in logging module.
 
@@ -30,6 +183,9 @@ def _configure(config_file_path: str = _CONFIG_FILE_PATH, log_directory: str = _
 
     Providing `config_file_path` will result in reconfiguring the built-in logging functionalities, rather than
     specific logger's config - use with caution!
+
+    Set `queued` to override the "queued" value of the config file. If enabled, the logger only puts the records on
+    a queue, and all formatting and I/O is done by a background thread.
     """
     if not _os.path.exists(config_file_path):
         raise LogError(f"Failed to find the log config file at {config_file_path}")
@@ -45,13 +201,27 @@ def _configure(config_file_path: str = _CONFIG_FILE_PATH, log_directory: str = _
             for handler in handlers:
                 if handlers[handler]["class"] in _FILE_HANDLERS:
                     handlers[handler]["filename"] = _os.path.join(log_directory, handlers[handler]["filename"])
+                elif handlers[handler]["class"] in _MULTI_FILE_HANDLERS:
+                    handlers[handler]["filenames"] = {level: _os.path.join(log_directory, filename)
+                                                      for level, filename in handlers[handler]["filenames"].items()}
 
     except OSError as e:
         raise LogError(f"An error occurred while setting up the logging module - {e}")
 
+    # The queueing setting is not a part of the standard configuration schema
+    queued_config = config.pop("queued", False)
+    if queued is None:
+        queued = queued_config
+
+    # Make sure the records logged with the previous configuration are written out before reconfiguring
+    _stop_listener()
+
     # Finally, load the configuration
     _logging.config.dictConfig(config)
 
+    if queued:
+        _start_listener(_logging.getLogger(_LOGGER_NAME))
+
 
 class Log:
     """
@@ -65,34 +235,79 @@ class Log:
         Log.info("Info message")
         Log.warning("Warning message")
         Log.error("Error message")
+
+    Each message is only formatted if the record is actually handled - use the arguments instead of f-strings to avoid
+    paying the formatting cost of disabled levels. Any keyword arguments not consumed by the logging module (such as
+    `exc_info`) are treated as the structured fields, appended to the message as key/value pairs. Pass a callable to
+    defer computing an expensive field value::
+
+        Log.debug("Reaction added", user=user.display_name, emoji=reaction.emoji)
+        Log.debug("Roles retrieved", roles=lambda: tuple(role.name for role in member.roles))
+
+    If logging is queued (see `_configure`), call `flush` before exiting to make sure all records are written.
     """
     _configure()
-    _logger = _logging.getLogger("dof-discord-bot")
+    _logger = _logging.getLogger(_LOGGER_NAME)
 
     @classmethod
     def debug(cls, message: str, *args, **kwargs):
         """
         Standard debug logging.
         """
-        cls._logger.debug(message, *args, **kwargs)
+        if cls._logger.isEnabledFor(_logging.DEBUG):
+            message, args, kwargs = _structure(message, args, kwargs)
+            cls._logger.debug(message, *args, **kwargs)
 
     @classmethod
     def info(cls, message: str, *args, **kwargs):
         """
         Standard info logging.
         """
-        cls._logger.info(message, *args, **kwargs)
+        if cls._logger.isEnabledFor(_logging.INFO):
+            message, args, kwargs = _structure(message, args, kwargs)
+            cls._logger.info(message, *args, **kwargs)
 
     @classmethod
     def warning(cls, message: str, *args, **kwargs):
         """
         Standard warning logging.
         """
-        cls._logger.warning(message, *args, **kwargs)
+        if cls._logger.isEnabledFor(_logging.WARNING):
+            message, args, kwargs = _structure(message, args, kwargs)
+            cls._logger.warning(message, *args, **kwargs)
 
     @classmethod
     def error(cls, message: str, *args, **kwargs):
         """
         Standard error logging.
         """
-        cls._logger.error(message, *args, **kwargs)
+        if cls._logger.isEnabledFor(_logging.ERROR):
+            message, args, kwargs = _structure(message, args, kwargs)
+            cls._logger.error(message, *args, **kwargs)
+
+    @classmethod
+    def flush(cls):
+        """
+        Writes out all queued records and switches back to synchronous logging.
+
+        Does nothing if logging isn't queued.
+        """
+        _stop_listener()
+
+    @classmethod
+    def recent(cls, level: str = "DEBUG", count: int = None) -> list:
+        """
+        Returns up to `count` most recent formatted records of at least the given level (name), newest first.
+
+        The records are retrieved from memory (see the "memory" handler in the config file), so no files are read.
+        Raises :class:`LogError` if the level is unknown or the memory handler isn't configured.
+        """
+        levelno = _logging.getLevelName(level.upper())
+        if not isinstance(levelno, int):
+            raise LogError(f"Unknown logging level - {level}")
+
+        for handler in _get_handlers(cls._logger):
+            if isinstance(handler, _ring_buffer._RingBufferHandler):
+                return handler.records(levelno, count)
+
+        raise LogError("Failed to find the in-memory log handler")
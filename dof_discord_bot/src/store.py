@@ -0,0 +1,242 @@
+"""
+Module storing the local SQLite databases used to persist the data (such as the added characters) across restarts.
+
+All queries are run by a single background thread owned by the database, so that they never block the event loop,
+and so that the connection is only ever used by the thread which created it.
+"""
+import os as _os
+import json as _json
+import time as _time
+import asyncio as _asyncio
+import sqlite3 as _sqlite3
+import typing as _typing
+import concurrent.futures as _futures
+from .characters import BodyProperties as _BodyProperties, normalise_name as _normalise_name
+from .logger import Log as _Log
+
+
+class Database:
+    """
+    Base class of the SQLite databases, which runs the queries in a background thread.
+
+    The connection is opened lazily (by the first query), in the WAL mode - the readers don't block the writer and
+    the writer doesn't block the readers. Subclasses should declare the `schema` (executed when the connection is
+    opened, so it should only create the missing tables and indexes) and implement the queries on top of `run`, as
+    follows::
+
+        async def count(self) -> int:
+            return await self.run(lambda connection: connection.execute("SELECT COUNT(*) FROM table").fetchone()[0])
+    """
+    schema = ""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._connection = None
+        self._executor = _futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix=type(self).__name__)
+
+    def _connect(self) -> _sqlite3.Connection:
+        """
+        Helper function used to open the connection and make sure the schema exists, called by the background thread.
+        """
+        if self._path != ":memory:":
+            _os.makedirs(_os.path.dirname(self._path), exist_ok=True)
+
+        connection = _sqlite3.connect(self._path)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.executescript(self.schema)
+        _Log.info("Database opened", database=type(self).__name__, path=self._path)
+        return connection
+
+    def _call(self, function: _typing.Callable, args: tuple) -> _typing.Any:
+        """
+        Helper function used to call the function with the connection, in a single transaction (committed if the
+        function succeeds and rolled back otherwise), called by the background thread.
+        """
+        if self._connection is None:
+            self._connection = self._connect()
+
+        with self._connection:
+            return function(self._connection, *args)
+
+    async def run(self, function: _typing.Callable, *args) -> _typing.Any:
+        """
+        Run the function with the connection (and any additional arguments) in the background thread, and return its
+        result.
+        """
+        return await _asyncio.get_event_loop().run_in_executor(self._executor, self._call, function, args)
+
+    def submit(self, function: _typing.Callable, *args) -> _futures.Future:
+        """
+        Run the function with the connection (and any additional arguments) in the background thread, without waiting
+        for the result - used for the writes which don't need to hold up the caller. The functions are run in the order
+        they were submitted in, and any errors are reported.
+        """
+        future = self._executor.submit(self._call, function, args)
+        future.add_done_callback(self._report)
+        return future
+
+    def _report(self, future: _futures.Future):
+        """
+        Helper function used to report the failed submitted functions.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            _Log.error("Database query failed", database=type(self).__name__, error=future.exception())
+
+    def close(self):
+        """
+        Close the connection once all scheduled queries are finished.
+        """
+        def close():
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+        self._executor.submit(close)
+        self._executor.shutdown(wait=False)
+
+
+class LocaleDatabase(Database):
+    """
+    Database of the locales selected with the `!locale` command, stored under the ids of the users and the servers.
+    """
+    schema = """
+        CREATE TABLE IF NOT EXISTS locales (
+            target_id INTEGER PRIMARY KEY,
+            locale TEXT NOT NULL
+        );
+    """
+
+    async def locales(self) -> _typing.Dict[int, str]:
+        """
+        Return the mapping of the user or server id to the selected locale.
+        """
+        return await self.run(lambda connection: dict(connection.execute("SELECT target_id, locale FROM locales")))
+
+    def save(self, target_id: int, locale: str):
+        """
+        Store the locale selected by the user or server (in the background), replacing the previously selected one.
+        """
+        self.submit(lambda connection: connection.execute("INSERT OR REPLACE INTO locales VALUES (?, ?)",
+                                                          (target_id, locale)))
+
+
+class CharacterDatabase(Database):
+    """
+    Database of the characters added with the `!character add` command, stored alongside the characters declared in
+    the strings.
+
+    The characters are stored under their normalised names, with each value of the character code in a separate
+    column (see `BodyProperties`).
+    """
+    schema = """
+        CREATE TABLE IF NOT EXISTS characters (
+            name TEXT PRIMARY KEY,
+            category TEXT NOT NULL,
+            version INTEGER NOT NULL,
+            age REAL NOT NULL,
+            weight REAL NOT NULL,
+            build REAL NOT NULL,
+            key BLOB NOT NULL,
+            author TEXT,
+            created REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS characters_category ON characters (category, name);
+    """
+
+    async def characters(self, category: str = None) -> _typing.List[_typing.Tuple[str, str, _BodyProperties]]:
+        """
+        Return the (name, category, body properties) of all stored characters (or of the given category only), in
+        alphabetical order.
+        """
+        def select(connection: _sqlite3.Connection) -> list:
+            query = "SELECT name, category, version, age, weight, build, key FROM characters"
+            if category is None:
+                rows = connection.execute(query + " ORDER BY name")
+            else:
+                rows = connection.execute(query + " WHERE category = ? ORDER BY name", (category,))
+            return [(name, category, _BodyProperties(version, age, weight, build, bytes(key)))
+                    for name, category, version, age, weight, build, key in rows]
+
+        return await self.run(select)
+
+    async def add(self, name: str, category: str, body_properties: _BodyProperties, author: str = None) -> bool:
+        """
+        Store the character under its normalised name, returns False if a character with such name is already stored.
+        """
+        def insert(connection: _sqlite3.Connection) -> bool:
+            cursor = connection.execute(
+                "INSERT OR IGNORE INTO characters (name, category, version, age, weight, build, key, author, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (_normalise_name(name), category, body_properties.version, body_properties.age, body_properties.weight,
+                 body_properties.build, body_properties.key, author, _time.time()))
+            return cursor.rowcount == 1
+
+        return await self.run(insert)
+
+
+class SessionDatabase(Database):
+    """
+    Database of the active sessions, so that they can be restored after the bot restarts.
+
+    Each session is stored with its message and channel ids, the author's id, the session type, its title, icon, locale
+    and pages (as a JSON list), the currently displayed page, and the (wall clock) time the session times out at.
+
+    The pages are stored as they were displayed, rather than the query they were built from - building them again would
+    need the original context (the help pages depend on the commands the author can run), so the sessions restored
+    after the strings are reloaded keep displaying the previous content.
+    """
+    schema = """
+        CREATE TABLE IF NOT EXISTS sessions (
+            message_id INTEGER PRIMARY KEY,
+            channel_id INTEGER NOT NULL,
+            author_id INTEGER NOT NULL,
+            session_type TEXT NOT NULL,
+            title TEXT NOT NULL,
+            icon TEXT NOT NULL,
+            locale TEXT NOT NULL,
+            pages TEXT NOT NULL,
+            current_page INTEGER NOT NULL,
+            deadline REAL NOT NULL
+        );
+    """
+
+    def save(self, message_id: int, channel_id: int, author_id: int, session_type: str, title: str, icon: str,
+             locale: str, pages: _typing.Sequence[str], current_page: int, deadline: float):
+        """
+        Store the session (in the background), replacing the session previously stored with the same message id.
+        """
+        def insert(connection: _sqlite3.Connection):
+            connection.execute("INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                               (message_id, channel_id, author_id, session_type, title, icon, locale,
+                                _json.dumps(list(pages)), current_page, deadline))
+
+        self.submit(insert)
+
+    def update(self, message_id: int, current_page: int, deadline: float):
+        """
+        Update the currently displayed page and the deadline of the stored session (in the background).
+        """
+        def update(connection: _sqlite3.Connection):
+            connection.execute("UPDATE sessions SET current_page = ?, deadline = ? WHERE message_id = ?",
+                               (current_page, deadline, message_id))
+
+        self.submit(update)
+
+    def delete(self, message_id: int):
+        """
+        Remove the stored session (in the background).
+        """
+        self.submit(lambda connection: connection.execute("DELETE FROM sessions WHERE message_id = ?", (message_id,)))
+
+    async def take(self) -> _typing.List[tuple]:
+        """
+        Remove all stored sessions and return them - each session in the same order of values as passed to `save`,
+        with the pages decoded back into a list.
+        """
+        def take(connection: _sqlite3.Connection) -> list:
+            rows = connection.execute("SELECT * FROM sessions ORDER BY deadline").fetchall()
+            connection.execute("DELETE FROM sessions")
+            return [row[:7] + (_json.loads(row[7]),) + row[8:] for row in rows]
+
+        return await self.run(take)
@@ -1,24 +1,216 @@
 """
 Formattable strings, loaded from a YAML file.
+
+Parsing the YAML file is relatively slow, so the parsed content is cached in a binary snapshot next to it. The
+snapshot is used as long as the YAML file's modification time and size (or, if those changed, its content hash)
+match the ones recorded in the snapshot.
+
+The strings can be translated with locale overlays - YAML files placed next to the main file and named after the
+locale (for example `strings.de.yaml`), declaring any subset of the strings. The fallback chain of each locale (for
+example `pt-br` -> `pt` -> the default locale) is flattened into a single table per strings class when the strings
+are loaded, so accessing the localised strings costs no more than accessing the default ones.
+
+The strings can be reloaded while the bot is running - load the files with `load_strings` (ideally off the event
+loop), then swap the strings with `update_strings`. Any values derived from the strings should be rebuilt by the
+callbacks registered with `on_strings_update`.
 """
 import os as _os
+import contextlib as _contextlib
+import hashlib as _hashlib
+import marshal as _marshal
+import typing as _typing
 import yaml as _yaml
-from .constants import RES_DIR as _RES_DIR
+from .constants import RES_DIR as _RES_DIR, DEFAULT_LOCALE as _DEFAULT_LOCALE
 from .logger import Log as _Log
+from .characters import BodyProperties as _BodyProperties
+
+_STRINGS_FILE_PATH = _os.path.join(_RES_DIR, "strings.yaml")
+
+# Bump the version whenever the snapshot's layout changes, to invalidate the old snapshots
+_CACHE_VERSION = 1
+
+# Use the (much faster) C loader if PyYAML was built with libyaml
+_YAML_LOADER = getattr(_yaml, "CSafeLoader", _yaml.SafeLoader)
+
+
+class StringsError(Exception):
+    """
+    A standard exception to handle strings-related errors (for example missing or invalid strings).
+    """
+    pass
+
+
+class _StringsLoader(_YAML_LOADER):
+    """
+    YAML loader reporting the duplicate keys, which would otherwise silently override each other.
+    """
+
+    def construct_mapping(self, node, deep=False):
+        mapping = super().construct_mapping(node, deep=deep)
+
+        if len(mapping) < len(node.value):
+            keys = [self.construct_object(key_node) for key_node, _ in node.value]
+            duplicates = sorted({key for key in keys if keys.count(key) > 1})
+            _Log.warning("Found duplicate keys in the strings file - only the last values are used",
+                         line=node.start_mark.line + 1, keys=duplicates)
+
+        return mapping
+
+
+def _parse(content: bytes) -> dict:
+    """
+    Helper function used to parse the content of the YAML file.
+    """
+    return _yaml.load(content, Loader=_StringsLoader)
+
+
+def _read_cache(cache_file_path: str) -> tuple:
+    """
+    Helper function used to read the snapshot, returns None if it doesn't exist or is invalid.
+    """
+    try:
+        with open(cache_file_path, "rb") as f:
+            cache = _marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(cache, tuple) or len(cache) != 5 or cache[0] != _CACHE_VERSION:
+        return None
+    return cache
+
+
+def _write_cache(cache_file_path: str, cache: tuple):
+    """
+    Helper function used to (atomically) write the snapshot - the package directory may be read-only, or the strings
+    may contain values which can't be marshalled (such as dates or sets), in which case the strings will simply be
+    parsed every time.
+    """
+    temporary_path = f"{cache_file_path}.{_os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as f:
+            _marshal.dump(cache, f)
+        _os.replace(temporary_path, cache_file_path)
+    except (OSError, ValueError) as e:
+        _Log.warning("Failed to write the strings cache", path=cache_file_path, error=e)
+        with _contextlib.suppress(OSError):
+            _os.remove(temporary_path)
+
+
+def _load(file_path: str = _STRINGS_FILE_PATH, cache_file_path: str = None) -> dict:
+    """
+    Load the strings from the YAML file, using the binary snapshot if it's up to date.
+
+    The snapshot is stored next to the YAML file (with the `.cache` extension), unless a different path is given.
+    """
+    if cache_file_path is None:
+        cache_file_path = _os.path.splitext(file_path)[0] + ".cache"
+
+    stat = _os.stat(file_path)
+    cache = _read_cache(cache_file_path)
+
+    # Fast path - the file hasn't been touched since the snapshot was made
+    if cache is not None and cache[1] == stat.st_mtime_ns and cache[2] == stat.st_size:
+        return cache[4]
 
-with open(_os.path.join(_RES_DIR, "strings.yaml"), encoding="UTF-8") as f:
-    _CONFIG_YAML = _yaml.safe_load(f)
+    with open(file_path, "rb") as f:
+        content = f.read()
+    digest = _hashlib.sha256(content).hexdigest()
+
+    # The file has been touched, but the content is still the same
+    if cache is not None and cache[3] == digest:
+        config = cache[4]
+    else:
+        _Log.debug("Parsing the strings file", path=file_path)
+        config = _parse(content)
+
+    _write_cache(cache_file_path, (_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest, config))
+    return config
+
+
+def normalise_locale(locale: str) -> str:
+    """
+    Return the locale in the form used by the strings files (for example `pt_BR` -> `pt-br`).
+    """
+    return locale.strip().lower().replace("_", "-")
+
+
+def _fallback_chain(locale: str) -> list:
+    """
+    Helper function used to get the locales to look the strings up in, most specific first (for example `pt-br` ->
+    `["pt-br", "pt", "en"]`). The chain always ends with the default locale.
+    """
+    parts = locale.split("-")
+    chain = [str.join("-", parts[:i]) for i in range(len(parts), 0, -1)]
+    if _DEFAULT_LOCALE not in chain:
+        chain.append(_DEFAULT_LOCALE)
+    return chain
+
+
+def _locale_files(file_path: str = _STRINGS_FILE_PATH) -> _typing.Dict[str, str]:
+    """
+    Helper function used to find the strings files - the main file (in the default locale) and all locale overlays
+    next to it. Returns the mapping of locale to the file path.
+    """
+    directory, file_name = _os.path.split(file_path)
+    stem, extension = _os.path.splitext(file_name)
+    files = {_DEFAULT_LOCALE: file_path}
+
+    for name in sorted(_os.listdir(directory)):
+        if name.startswith(stem + ".") and name.endswith(extension):
+            locale = normalise_locale(name[len(stem) + 1:-len(extension)])
+            if locale and locale != _DEFAULT_LOCALE:
+                files[locale] = _os.path.join(directory, name)
+
+    return files
+
+
+def _load_all(file_path: str = _STRINGS_FILE_PATH) -> _typing.Dict[str, dict]:
+    """
+    Load the main strings file and all locale overlays, returns the mapping of locale to the parsed content.
+    """
+    return {locale: _load(path) for locale, path in _locale_files(file_path).items()}
+
+
+_CONFIGS = _load_all()
+
+# Declare all classes using the strings, and the callbacks to call after the strings are updated
+_STRINGS_CLASSES = list()
+_UPDATE_CALLBACKS = list()
 
 # Hard code the root section as the yaml file is only used for strings resources
 _MAIN_YAML_SECTION = "strings"
 
 
+class _LocalisedStrings:
+    """
+    Strings of a single strings class in a specific locale, stored as plain instance attributes.
+
+    Created by `_YAMLStringsGetter` when the strings are loaded - use `localised` on the strings class to get them.
+    """
+
+    def __init__(self, name: str, locale: str, table: dict):
+        self.__dict__.update(table)
+        self._description = f"{name}({locale})"
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+    def __repr__(self):
+        return self._description
+
+
 class _YAMLStringsGetter(type):
     """
     Implements a custom metaclass used for accessing configuration data by simply accessing class attributes.
 
     `section` specifies the YAML configuration section (or "key") in which the configuration lives, and must be set.
     'subsection' specifies an optional section within the parent section. Use it to access nested values.
+    `converter` specifies an optional function used to convert each string into the stored value (for example to parse
+    it once, rather than every time it's used) - it should raise `ValueError` if the string is invalid.
+
+    Each annotated name is resolved once, when the class is created, and stored as a plain class attribute - accessing
+    the strings costs no more than a standard attribute read. A `StringsError` is raised at class creation if any of
+    the annotated names can not be found in the YAML file.
 
     Example Usage:
 
@@ -31,39 +223,266 @@ class _YAMLStringsGetter(type):
         # strings.py
         class Application(metaclass=YAMLGetter):
             section = "apply_cog"
+            new_application: str
+            application_completed: str
 
         # Usage in Python code
         import strings
         print(strings.Application.new_application)
+
+    The strings in other locales are resolved in the same way, into one table per locale - use `localised` to get
+    them, for example `strings.Application.localised("de").new_application`. Any strings missing in the locale's
+    overlay fall back to the less specific locales, and ultimately to the default strings.
     """
     section: str
     subsection: str = None
+    converter: _typing.Callable[[str], _typing.Any] = None
+
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        table = cls._table(_CONFIGS[_DEFAULT_LOCALE])
+        cls._update(table, cls._localise(_CONFIGS, table))
+        _STRINGS_CLASSES.append(cls)
+
+    def _table(cls, config: dict) -> dict:
+        """
+        Look up all annotated names in the given (parsed YAML) configuration and return the mapping of names to values.
+
+        Raises `StringsError` if any of the values is missing or isn't a string (or can't be converted).
+        """
+        section = cls.__dict__.get("section")
+        subsection = cls.__dict__.get("subsection")
+        if section is None:
+            raise StringsError(f"Can not access the values of {cls.__name__} without providing a \"section\" key")
+
+        try:
+            table = config[_MAIN_YAML_SECTION][section]
+            if subsection is not None:
+                table = table[subsection]
+        except (KeyError, TypeError):
+            dotted_path = ".".join((section, subsection) if subsection else (section,))
+            _Log.error("Tried accessing a configuration section, but it could not be found", path=dotted_path)
+            raise StringsError(f"Missing configuration section - {dotted_path}")
+
+        if not isinstance(table, dict):
+            dotted_path = ".".join((section, subsection) if subsection else (section,))
+            _Log.error("Tried accessing a configuration section, but it isn't a mapping", path=dotted_path)
+            raise StringsError(f"Invalid configuration section - {dotted_path}")
+
+        # Classes without any annotated names (such as the aliases) would otherwise see the metaclass' annotations
+        annotations = cls.__dict__.get("__annotations__", {})
+        invalid = [name for name in annotations if not isinstance(table.get(name), str)]
+        if invalid:
+            dotted_paths = [".".join((section, subsection, name) if subsection else (section, name))
+                            for name in invalid]
+            _Log.error("Tried accessing configuration variables, but they are missing or invalid", paths=dotted_paths)
+            raise StringsError(f"Missing or invalid configuration variables - {', '.join(dotted_paths)}")
+
+        # Any additional strings in the section (such as newly added characters) are made available as well, as long
+        # as they don't clash with the class' own attributes
+        reserved = set(vars(cls)).difference(cls.__dict__.get("_names", ()))
+        resolved = {name: value for name, value in table.items() if isinstance(value, str) and name.isidentifier()
+                    and name not in reserved and not hasattr(_YAMLStringsGetter, name)}
+        resolved.update((name, table[name]) for name in annotations)
+        return cls._convert(resolved)
+
+    def _convert(cls, table: dict) -> dict:
+        """
+        Convert the values from the given table with the class' converter (if it has one) and return the converted
+        table. Values which can't be converted are reported and skipped, unless they are annotated.
+
+        Raises `StringsError` if any of the annotated values can't be converted.
+        """
+        converter = cls.__dict__.get("converter")
+        if converter is None:
+            return table
+
+        converted = dict()
+        invalid = dict()
+        for name, value in table.items():
+            try:
+                converted[name] = converter(value)
+            except ValueError as e:
+                invalid[name] = str(e)
+
+        if invalid:
+            _Log.error("Found invalid configuration variables", strings=cls.__name__, errors=invalid)
+            required = set(invalid).intersection(cls.__dict__.get("__annotations__", {}))
+            if required:
+                raise StringsError(f"Invalid configuration variables of {cls.__name__} - {', '.join(sorted(required))}")
+
+        return converted
+
+    def _overlay(cls, config: dict, default_table: dict) -> dict:
+        """
+        Look up the names from the default table in the given locale overlay and return the mapping of the (translated)
+        names to values. Unlike the default strings, the overlay may be missing any of the values.
+
+        Raises `StringsError` if any of the values isn't a string.
+        """
+        section = cls.__dict__["section"]
+        subsection = cls.__dict__.get("subsection")
 
-    def __getattr__(cls, name):
-        name = name.lower()
         try:
-            if cls.subsection is not None:
-                return _CONFIG_YAML[_MAIN_YAML_SECTION][cls.section][cls.subsection][name]
-            elif cls.section is not None:
-                return _CONFIG_YAML[_MAIN_YAML_SECTION][cls.section][name]
-            else:
-                raise KeyError("Can not access the values without providing a \"section\" key")
+            table = config[_MAIN_YAML_SECTION][section]
+            if subsection is not None:
+                table = table[subsection]
+        except (KeyError, TypeError):
+            return dict()
+
+        if not isinstance(table, dict):
+            table = dict()
+        invalid = [name for name in default_table if name in table and not isinstance(table[name], str)]
+        if invalid:
+            dotted_paths = [".".join((section, subsection, name) if subsection else (section, name))
+                            for name in invalid]
+            _Log.error("Found invalid translated configuration variables", paths=dotted_paths)
+            raise StringsError(f"Invalid translated configuration variables - {', '.join(dotted_paths)}")
+
+        return cls._convert({name: table[name] for name in default_table if name in table})
+
+    def _localise(cls, configs: dict, default_table: dict) -> dict:
+        """
+        Build the strings of each locale from the given (parsed YAML) configurations, flattening each locale's fallback
+        chain into a single table. Returns the mapping of locale to the localised strings.
+        """
+        overlays = {locale: cls._overlay(config, default_table) for locale, config in configs.items()
+                    if locale != _DEFAULT_LOCALE}
+        locales = {_DEFAULT_LOCALE: cls}
+
+        for locale in overlays:
+            table = dict(default_table)
+            for fallback in reversed(_fallback_chain(locale)):
+                table.update(overlays.get(fallback, ()))
+            locales[locale] = _LocalisedStrings(cls.__name__, locale, table)
+
+        return locales
+
+    def _update(cls, table: dict, locales: dict):
+        """
+        Store the values from the given table as class attributes, removing the ones which are no longer available, and
+        swap the localised strings.
+        """
+        for name in set(cls.__dict__.get("_names", ())).difference(table):
+            delattr(cls, name)
+        for name, value in table.items():
+            setattr(cls, name, value)
+        cls._names = tuple(table)
+        cls._locales = locales
+
+    def localised(cls, locale: str = None) -> _typing.Any:
+        """
+        Return the strings in the given locale - either the class itself (for the default locale), or an object with
+        the same attributes.
+
+        Locales without their own overlay resolve to the closest available locale (for example `de-at` -> `de`), and
+        the result is remembered, so each locale is only resolved once.
+        """
+        try:
+            return cls._locales[locale]
         except KeyError:
-            dotted_path = ".".join((cls.subsection, cls.section, name) if cls.subsection else (cls.section, name))
-            _Log.error(f"Tried accessing configuration variable at `{dotted_path}`, but it could not be found.")
-            raise
+            if locale is None:
+                return cls
+
+        for fallback in _fallback_chain(normalise_locale(locale)):
+            if fallback in cls._locales:
+                cls._locales[locale] = cls._locales[fallback]
+                break
+        return cls._locales[locale]
+
+    def __getattr__(cls, name):
+        """
+        Only called if the name wasn't resolved - supports the case-insensitive access, and reports the unknown names.
+        """
+        # Special names are looked up by various tools (for example when inspecting objects), no need to report them
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if name.lower() in cls.__dict__.get("__annotations__", ()):
+            return getattr(cls, name.lower())
+
+        _Log.error("Tried accessing an unknown configuration variable", strings=cls.__name__, name=name)
+        raise AttributeError(f"{cls.__name__} has no configuration variable {name}")
 
     def __getitem__(cls, name):
-        return cls.__getattr__(name)
+        return getattr(cls, name)
 
     def __iter__(cls):
         """
         Return generator of key: value pairs of current constants class' config values.
         """
-        for name in cls.__annotations__:
+        for name in cls._names:
             yield name, getattr(cls, name)
 
 
+def available_locales() -> _typing.Tuple[str, ...]:
+    """
+    Return all locales the strings are available in (the default locale and the locales with an overlay).
+    """
+    return _LOCALES
+
+
+def strings_modified(file_path: str = _STRINGS_FILE_PATH) -> tuple:
+    """
+    Return the modification times and sizes of the strings files (including the locale overlays), which can be
+    compared to detect changes.
+    """
+    modified = list()
+    for locale, path in _locale_files(file_path).items():
+        stat = _os.stat(path)
+        modified.append((locale, stat.st_mtime_ns, stat.st_size))
+    return tuple(modified)
+
+
+def load_strings(file_path: str = _STRINGS_FILE_PATH) -> _typing.Dict[str, dict]:
+    """
+    Load (and parse, if needed) the strings file and all locale overlays, without updating the strings yet.
+
+    This may take a while, so consider running it in an executor. Raises `StringsError` if any file can't be loaded.
+    """
+    try:
+        return _load_all(file_path)
+    except (OSError, _yaml.YAMLError) as e:
+        raise StringsError(f"Failed to load the strings file - {e}")
+
+
+def update_strings(configs: _typing.Dict[str, dict]):
+    """
+    Swap all strings to the given (loaded) ones, then call all registered update callbacks.
+
+    All strings classes (in all locales) are validated before any of them is updated, so either all strings are
+    updated or, if `StringsError` is raised, none of them are. No coroutines can run in between, so the swap is atomic
+    from the event loop's point of view. Any errors raised by the callbacks are reported, without stopping the other
+    callbacks.
+    """
+    global _LOCALES
+
+    updates = list()
+    for cls in _STRINGS_CLASSES:
+        table = cls._table(configs[_DEFAULT_LOCALE])
+        updates.append((cls, table, cls._localise(configs, table)))
+    for cls, table, locales in updates:
+        cls._update(table, locales)
+    _LOCALES = tuple(sorted(configs))
+
+    # The strings are already updated, so a failing callback shouldn't stop the other ones from running
+    for callback in _UPDATE_CALLBACKS:
+        try:
+            callback()
+        except Exception as e:
+            _Log.error("Strings update callback failed", callback=callback.__qualname__, error=e, exc_info=True)
+    _Log.info("Strings updated")
+
+
+def on_strings_update(callback: _typing.Callable[[], None]) -> _typing.Callable[[], None]:
+    """
+    Register a callback to be called after the strings are updated - use it to rebuild any values derived from the
+    strings. Can be used as a decorator.
+    """
+    _UPDATE_CALLBACKS.append(callback)
+    return callback
+
+
 class General(metaclass=_YAMLStringsGetter):
     """
     Strings related to the most general, discord-related features (e.g. handling channel changes).
@@ -142,6 +561,13 @@ class Info(metaclass=_YAMLStringsGetter):
     authors_white_noise: str
     authors_support: str
     authors_link: str
+    logs_title: str
+    logs_not_found: str
+    invalid_logs_query: str
+    locale_current: str
+    locale_updated: str
+    locale_server_updated: str
+    invalid_locale: str
 
 
 class Help(metaclass=_YAMLStringsGetter):
@@ -161,6 +587,15 @@ class Characters(metaclass=_YAMLStringsGetter):
     section = "character_cog"
     title: str
     invalid_character: str
+    invalid_character_suggestions: str
+    similar_characters: str
+    similar_missing_name: str
+    characters_exported: str
+    invalid_export_category: str
+    character_added: str
+    character_exists: str
+    invalid_character_code: str
+    invalid_character_name: str
     introduction: str
     explanation: str
     example_success: str
@@ -169,250 +604,264 @@ class Characters(metaclass=_YAMLStringsGetter):
     available_custom_characters: str
 
 
+class CharacterAliases(metaclass=_YAMLStringsGetter):
+    """
+    Alternative names of the Bannerlord characters - mapping of each alias to the character's name.
+    """
+    section = "character_cog"
+    subsection = "aliases"
+
+
 class FemaleCharacters(metaclass=_YAMLStringsGetter):
     """
-    Female Bannerlord character codes.
+    Female Bannerlord character codes, parsed into `BodyProperties` records.
     """
     section = "character_cog"
     subsection = "female_characters"
-    rhagaea: str
-    alijin: str
-    bolat: str
-    yana: str
-    abagai: str
-    alynneth: str
-    wythuin: str
-    anat: str
-    mesui: str
-    alcaea: str
-    nywin: str
-    asela: str
-    silvind: str
-    liena: str
-    elys: str
-    calatild: str
-    elthild: str
-    philenora: str
-    panalea: str
-    ira: str
-    helea: str
-    debana: str
-    mina: str
-    phaea: str
-    sora: str
-    chalia: str
-    zoana: str
-    jathea: str
-    martira: str
-    rhagaea: str
-    lysica: str
-    melkea: str
-    vendelia: str
-    phenoria: str
-    zerosica: str
-    varra: str
-    anidha: str
-    arwa: str
-    manan: str
-    ruma: str
-    maraa: str
-    jinda: str
-    svana: str
-    idrun: str
-    erta: str
-    siga: str
-    asta: str
+    converter = _BodyProperties.parse
+    rhagaea: _BodyProperties
+    alijin: _BodyProperties
+    bolat: _BodyProperties
+    yana: _BodyProperties
+    abagai: _BodyProperties
+    alynneth: _BodyProperties
+    wythuin: _BodyProperties
+    anat: _BodyProperties
+    mesui: _BodyProperties
+    alcaea: _BodyProperties
+    nywin: _BodyProperties
+    asela: _BodyProperties
+    silvind: _BodyProperties
+    liena: _BodyProperties
+    elys: _BodyProperties
+    calatild: _BodyProperties
+    elthild: _BodyProperties
+    philenora: _BodyProperties
+    panalea: _BodyProperties
+    ira: _BodyProperties
+    helea: _BodyProperties
+    debana: _BodyProperties
+    mina: _BodyProperties
+    phaea: _BodyProperties
+    sora: _BodyProperties
+    chalia: _BodyProperties
+    zoana: _BodyProperties
+    jathea: _BodyProperties
+    martira: _BodyProperties
+    lysica: _BodyProperties
+    melkea: _BodyProperties
+    vendelia: _BodyProperties
+    phenoria: _BodyProperties
+    zerosica: _BodyProperties
+    varra: _BodyProperties
+    anidha: _BodyProperties
+    arwa: _BodyProperties
+    manan: _BodyProperties
+    ruma: _BodyProperties
+    maraa: _BodyProperties
+    jinda: _BodyProperties
+    svana: _BodyProperties
+    idrun: _BodyProperties
+    erta: _BodyProperties
+    siga: _BodyProperties
+    asta: _BodyProperties
 
 
 class MaleCharacters(metaclass=_YAMLStringsGetter):
     """
-    Male Bannerlord character codes.
+    Male Bannerlord character codes, parsed into `BodyProperties` records.
     """
     section = "character_cog"
     subsection = "male_characters"
-    chaghan: str
-    esur: str
-    nayantai: str
-    temun: str
-    bortu: str
-    oragur: str
-    hurunag: str
-    akrum: str
-    ilatar: str
-    kanujan: str
-    taslur: str
-    ulman: str
-    achaku: str
-    kinteg: str
-    mehir: str
-    muinser: str
-    raonul: str
-    pryndor: str
-    luichan: str
-    aeron: str
-    aradwyr: str
-    branoc: str
-    fenagan: str
-    siaramus: str
-    carfyd: str
-    fiarad: str
-    monchug: str
-    bagai: str
-    tulag: str
-    khada: str
-    suran: str
-    bestein: str
-    culharn: str
-    sein: str
-    melidir: str
-    ergeon: str
-    caladog: str
-    ecarand: str
-    vartin: str
-    peric: str
-    lucand: str
-    hecard: str
-    belgir: str
-    servic: str
-    ospir: str
-    varmund: str
-    morcan: str
-    elbet: str
-    ingalther: str
-    erdurand: str
-    morcon: str
-    morcon: str
-    romund: str
-    lasand: str
-    thomund: str
-    furnhard: str
-    alary: str
-    unthery: str
-    aldric: str
-    derthert: str
-    qahin: str
-    hashan: str
-    ukhai: str
-    karith: str
-    talas: str
-    awdhan: str
-    ghuzid: str
-    suruq: str
-    iyalas: str
-    nuqar: str
-    thamza: str
-    dhiyul: str
-    addas: str
-    usair: str
-    haqan: str
-    tais: str
-    adram: str
-    tariq: str
-    lashonek: str
-    galden: str
-    alvar: str
-    unqid: str
-    tovir: str
-    svedorn: str
-    fafen: str
-    vashorki: str
-    ratagost: str
-    yorig: str
-    vyldur: str
-    sven: str
-    vidar: str
-    isvan: str
-    lek: str
-    simir: str
-    mimir: str
-    urik: str
-    godun: str
-    raganvad: str
-    olek: str
-    sechanis: str
-    abalytos: str
-    tharos: str
-    niphon: str
-    ascyron: str
-    oros: str
-    honoratus: str
-    zeno: str
-    pharon: str
-    maximin: str
-    crotor: str
-    apys: str
-    phadon: str
-    garios: str
-    penton: str
-    manteos: str
-    lucon: str
-    urkhun: str
-    solun: str
-    kuyug: str
-    undul: str
-    nimr: str
-    olek_the_old: str
-    baranor: str
-    serandon: str
-    seranor: str
-    sejaron: str
-    turiados: str
-    joron: str
-    sichanis: str
-    vipon: str
-    ovagos: str
-    altenos: str
-    saratis: str
-    achios: str
-    tynops: str
-    desporion: str
-    tasynor: str
-    miron: str
-    lantanor: str
-    olypos: str
-    gyphor: str
-    nicasor: str
-    milos: str
-    encurion: str
-    chason: str
-    nemos: str
-    ulbos: str
-    obron: str
-    belithor: str
-    arcor: str
-    arion: str
-    sanion: str
-    eutropius: str
-    temion: str
-    meritor: str
-    patyr: str
-    thephilos: str
-    eronyx: str
-    jastion: str
-    tadeos: str
-    andros: str
+    converter = _BodyProperties.parse
+    chaghan: _BodyProperties
+    esur: _BodyProperties
+    nayantai: _BodyProperties
+    temun: _BodyProperties
+    bortu: _BodyProperties
+    oragur: _BodyProperties
+    hurunag: _BodyProperties
+    akrum: _BodyProperties
+    ilatar: _BodyProperties
+    kanujan: _BodyProperties
+    taslur: _BodyProperties
+    ulman: _BodyProperties
+    achaku: _BodyProperties
+    kinteg: _BodyProperties
+    mehir: _BodyProperties
+    muinser: _BodyProperties
+    raonul: _BodyProperties
+    pryndor: _BodyProperties
+    luichan: _BodyProperties
+    aeron: _BodyProperties
+    aradwyr: _BodyProperties
+    branoc: _BodyProperties
+    fenagan: _BodyProperties
+    siaramus: _BodyProperties
+    carfyd: _BodyProperties
+    fiarad: _BodyProperties
+    monchug: _BodyProperties
+    bagai: _BodyProperties
+    tulag: _BodyProperties
+    khada: _BodyProperties
+    suran: _BodyProperties
+    bestein: _BodyProperties
+    culharn: _BodyProperties
+    sein: _BodyProperties
+    melidir: _BodyProperties
+    ergeon: _BodyProperties
+    caladog: _BodyProperties
+    ecarand: _BodyProperties
+    vartin: _BodyProperties
+    peric: _BodyProperties
+    lucand: _BodyProperties
+    hecard: _BodyProperties
+    belgir: _BodyProperties
+    servic: _BodyProperties
+    ospir: _BodyProperties
+    varmund: _BodyProperties
+    morcan: _BodyProperties
+    elbet: _BodyProperties
+    ingalther: _BodyProperties
+    erdurand: _BodyProperties
+    morcon: _BodyProperties
+    romund: _BodyProperties
+    lasand: _BodyProperties
+    thomund: _BodyProperties
+    furnhard: _BodyProperties
+    alary: _BodyProperties
+    unthery: _BodyProperties
+    aldric: _BodyProperties
+    derthert: _BodyProperties
+    qahin: _BodyProperties
+    hashan: _BodyProperties
+    ukhai: _BodyProperties
+    karith: _BodyProperties
+    talas: _BodyProperties
+    awdhan: _BodyProperties
+    ghuzid: _BodyProperties
+    suruq: _BodyProperties
+    iyalas: _BodyProperties
+    nuqar: _BodyProperties
+    thamza: _BodyProperties
+    dhiyul: _BodyProperties
+    addas: _BodyProperties
+    usair: _BodyProperties
+    haqan: _BodyProperties
+    tais: _BodyProperties
+    adram: _BodyProperties
+    tariq: _BodyProperties
+    lashonek: _BodyProperties
+    galden: _BodyProperties
+    alvar: _BodyProperties
+    unqid: _BodyProperties
+    tovir: _BodyProperties
+    svedorn: _BodyProperties
+    fafen: _BodyProperties
+    vashorki: _BodyProperties
+    ratagost: _BodyProperties
+    yorig: _BodyProperties
+    vyldur: _BodyProperties
+    sven: _BodyProperties
+    vidar: _BodyProperties
+    isvan: _BodyProperties
+    lek: _BodyProperties
+    simir: _BodyProperties
+    mimir: _BodyProperties
+    urik: _BodyProperties
+    godun: _BodyProperties
+    raganvad: _BodyProperties
+    olek: _BodyProperties
+    sechanis: _BodyProperties
+    abalytos: _BodyProperties
+    tharos: _BodyProperties
+    niphon: _BodyProperties
+    ascyron: _BodyProperties
+    oros: _BodyProperties
+    honoratus: _BodyProperties
+    zeno: _BodyProperties
+    pharon: _BodyProperties
+    maximin: _BodyProperties
+    crotor: _BodyProperties
+    apys: _BodyProperties
+    phadon: _BodyProperties
+    garios: _BodyProperties
+    penton: _BodyProperties
+    manteos: _BodyProperties
+    lucon: _BodyProperties
+    urkhun: _BodyProperties
+    solun: _BodyProperties
+    kuyug: _BodyProperties
+    undul: _BodyProperties
+    nimr: _BodyProperties
+    olek_the_old: _BodyProperties
+    baranor: _BodyProperties
+    serandon: _BodyProperties
+    seranor: _BodyProperties
+    sejaron: _BodyProperties
+    turiados: _BodyProperties
+    joron: _BodyProperties
+    sichanis: _BodyProperties
+    vipon: _BodyProperties
+    ovagos: _BodyProperties
+    altenos: _BodyProperties
+    saratis: _BodyProperties
+    achios: _BodyProperties
+    tynops: _BodyProperties
+    desporion: _BodyProperties
+    tasynor: _BodyProperties
+    miron: _BodyProperties
+    lantanor: _BodyProperties
+    olypos: _BodyProperties
+    gyphor: _BodyProperties
+    nicasor: _BodyProperties
+    milos: _BodyProperties
+    encurion: _BodyProperties
+    chason: _BodyProperties
+    nemos: _BodyProperties
+    ulbos: _BodyProperties
+    obron: _BodyProperties
+    belithor: _BodyProperties
+    arcor: _BodyProperties
+    arion: _BodyProperties
+    sanion: _BodyProperties
+    eutropius: _BodyProperties
+    temion: _BodyProperties
+    meritor: _BodyProperties
+    patyr: _BodyProperties
+    thephilos: _BodyProperties
+    eronyx: _BodyProperties
+    jastion: _BodyProperties
+    tadeos: _BodyProperties
+    andros: _BodyProperties
 
 
 class CustomCharacters(metaclass=_YAMLStringsGetter):
     """
-    Custom Bannerlord character codes.
+    Custom Bannerlord character codes, parsed into `BodyProperties` records.
     """
     section = "character_cog"
     subsection = "custom_characters"
-    druidess_by_rawex: str
-    stannis_baratheon: str
-    tyrion_lannister: str
-    khal_drogo: str
-    sandor_clegane: str
-    tywin_lannister: str
-    bronn_of_the_blackwater: str
-    jon_snow: str
-    joffrey_baratheon: str
-    tormund_giantsbane: str
-    hodor: str
-    looter_hero: str
-    sea_raiders_hero: str
-    mountain_bandits_hero: str
-    forest_bandits_hero: str
-    desert_bandits_hero: str
-    steppe_bandits_hero: str
+    converter = _BodyProperties.parse
+    druidess_by_rawex: _BodyProperties
+    stannis_baratheon: _BodyProperties
+    tyrion_lannister: _BodyProperties
+    khal_drogo: _BodyProperties
+    sandor_clegane: _BodyProperties
+    tywin_lannister: _BodyProperties
+    bronn_of_the_blackwater: _BodyProperties
+    jon_snow: _BodyProperties
+    joffrey_baratheon: _BodyProperties
+    tormund_giantsbane: _BodyProperties
+    hodor: _BodyProperties
+    looter_hero: _BodyProperties
+    sea_raiders_hero: _BodyProperties
+    mountain_bandits_hero: _BodyProperties
+    forest_bandits_hero: _BodyProperties
+    desert_bandits_hero: _BodyProperties
+    steppe_bandits_hero: _BodyProperties
+
+
+# All strings have been resolved into the classes, no need to keep the parsed files in memory
+_LOCALES = tuple(sorted(_CONFIGS))
+del _CONFIGS
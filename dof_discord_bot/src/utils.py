@@ -4,12 +4,21 @@ An unorganised collection of non-static constructs, such as classes or utility f
 import discord as _discord
 import abc as _abc
 import asyncio as _asyncio
+import collections as _collections
 import contextlib as _contextlib
+import functools as _functools
+import heapq as _heapq
+import itertools as _itertools
+import sys as _sys
+import time as _time
+import typing as _typing
 from .logger import Log as _Log
 from . import strings as _strings
+from .store import SessionDatabase as _SessionDatabase
 from .constants import DEFAULT_SESSION_ICON as _DEFAULT_SESSION_ICON, LAST_PAGE_EMOJI as _LAST_PAGE_EMOJI, \
     FIRST_PAGE_EMOJI as _FIRST_PAGE_EMOJI, NEXT_PAGE_EMOJI as _NEXT_PAGE_EMOJI, DELETE_EMOJI as _DELETE_EMOJI, \
-    PREVIOUS_PAGE_EMOJI as _PREVIOUS_PAGE_EMOJI
+    PREVIOUS_PAGE_EMOJI as _PREVIOUS_PAGE_EMOJI, DEFAULT_LOCALE as _DEFAULT_LOCALE, \
+    PAGE_EMBEDS_CACHE_SIZE as _PAGE_EMBEDS_CACHE_SIZE, MAX_SESSIONS as _MAX_SESSIONS
 from discord.ext import commands as _commands
 
 
@@ -17,36 +26,27 @@ class MemberApplication:
     """
     Member application class storing information about each applicant and the application stage.
 
+    The questions are asked in the applicant's locale (as it was when the application was started).
+
     See usage example in `ApplicationCog` (`apply.py`)
     """
-    questions = [
-        _strings.Utils.steam_profile_long,
-        _strings.Utils.tw_profile_long,
-        _strings.Utils.country_long,
-        _strings.Utils.english_fluency_long,
-        _strings.Utils.dof_first_encounter_long,
-        _strings.Utils.dof_why_join_long,
-        _strings.Utils.other_games_long,
-        _strings.Utils.time_availability_long,
-        _strings.Utils.anything_else_long
-    ]
-    _questions_summary = [
-        _strings.Utils.steam_profile_short,
-        _strings.Utils.tw_profile_short,
-        _strings.Utils.country_short,
-        _strings.Utils.english_fluency_short,
-        _strings.Utils.dof_first_encounter_short,
-        _strings.Utils.dof_why_join_short,
-        _strings.Utils.other_games_short,
-        _strings.Utils.time_availability_short,
-        _strings.Utils.anything_else_short
-    ]
-
-    def __init__(self, member: _discord.Member):
+    questions = list()
+    _questions_summary = list()
+    _localised_questions = dict()
+
+    def __init__(self, member: _discord.Member, locale: str = _DEFAULT_LOCALE):
         self._member = member
+        self._locale = locale
         self._progress = 0
         self._answers = list()
 
+    @property
+    def locale(self) -> str:
+        """
+        Getter for the locale the application is handled in.
+        """
+        return self._locale
+
     @property
     def progress(self) -> int:
         """
@@ -59,15 +59,14 @@ class MemberApplication:
         """
         Getter for current question.
         """
-        return MemberApplication.questions[self._progress]
+        return MemberApplication.localised_questions(self._locale)[0][self._progress]
 
     @property
     def answers(self) -> str:
         """
         Get formatted answers.
         """
-        return str.join("\n", (f"{MemberApplication._questions_summary[i]}: {self._answers[i]}"
-                               for i in range(len(self._answers)))) + "\n"
+        return self.format_answers(self._locale)
 
     @property
     def finished(self) -> bool:
@@ -83,10 +82,73 @@ class MemberApplication:
         self._progress += 1
         self._answers.append(answer)
 
+    def format_answers(self, locale: str = _DEFAULT_LOCALE) -> str:
+        """
+        Function used to format the answers, with the questions summarised in the given locale.
+        """
+        questions_summary = MemberApplication.localised_questions(locale)[1]
+        return str.join("\n", (f"{questions_summary[i]}: {self._answers[i]}" for i in range(len(self._answers)))) + "\n"
+
+    @staticmethod
+    def _build_questions(utils: _typing.Any) -> _typing.Tuple[list, list]:
+        """
+        Helper function used to build the questions and their summaries from the (possibly localised) strings.
+        """
+        questions = [
+            utils.steam_profile_long,
+            utils.tw_profile_long,
+            utils.country_long,
+            utils.english_fluency_long,
+            utils.dof_first_encounter_long,
+            utils.dof_why_join_long,
+            utils.other_games_long,
+            utils.time_availability_long,
+            utils.anything_else_long
+        ]
+        questions_summary = [
+            utils.steam_profile_short,
+            utils.tw_profile_short,
+            utils.country_short,
+            utils.english_fluency_short,
+            utils.dof_first_encounter_short,
+            utils.dof_why_join_short,
+            utils.other_games_short,
+            utils.time_availability_short,
+            utils.anything_else_short
+        ]
+        return questions, questions_summary
+
+    @classmethod
+    def localised_questions(cls, locale: str) -> _typing.Tuple[list, list]:
+        """
+        Function used to get the questions and their summaries in the given locale - each locale is only built once.
+        """
+        try:
+            return cls._localised_questions[locale]
+        except KeyError:
+            questions = cls._localised_questions[locale] = cls._build_questions(_strings.Utils.localised(locale))
+            return questions
+
+    @classmethod
+    def update_questions(cls):
+        """
+        Function used to (re)build the questions from the strings - the default lists are updated in place, and the
+        localised ones are rebuilt on demand.
+        """
+        cls.questions[:], cls._questions_summary[:] = cls._build_questions(_strings.Utils)
+        cls._localised_questions = {_DEFAULT_LOCALE: (cls.questions, cls._questions_summary)}
+
+
+# Build the questions now, and rebuild them whenever the strings are reloaded
+MemberApplication.update_questions()
+_strings.on_strings_update(MemberApplication.update_questions)
+
 
 class Page:
     """
     Page class is used to represent multiple paginator lines, which can be then added all at once.
+
+    The total length of the lines is computed once, so the paginator can check if the whole page fits at once.
     """
 
     def __init__(self, *lines):
@@ -103,6 +165,7 @@ class Page:
             if not isinstance(line, str):
                 raise ValueError(f"Each page line is expected to be a string, not {type(line)}")
             self._lines.append(line)
+        self._length = sum(len(line) for line in self._lines)
 
     @property
     def lines(self) -> list:
@@ -111,53 +174,272 @@ class Page:
         """
         return self._lines
 
+    @property
+    def length(self) -> int:
+        """
+        Getter for the total number of characters in the page lines (without the line separators).
+        """
+        return self._length
+
 
-class LinePaginator(_commands.Paginator):
+class LinePaginator:
     """
-    Extended paginator used to restrict the amount of displayed content by checking the number of lines.
+    Paginator used to split the content into pages, restricting both the number of characters (like the discord.py's
+    `Paginator`) and the number of lines per page.
 
-    Additionally supports adding a `Page` instance, instead of manually adding each line.
+    Supports adding a single line, a `Page` instance as a block (kept on a single page, unless it can't fit on any
+    page), or a `Page` instance as a whole page. The size of each line is only checked once, and a whole `Page` is
+    checked at once.
     """
 
-    def __init__(self, max_lines: int = None, **kwargs):
+    def __init__(self, max_lines: int = None, prefix: str = "```", suffix: str = "```", max_size: int = 2000,
+                 linesep: str = "\n"):
         """
         Max lines argument is used to restrict the maximum amount of content (even though the lines can be as long as
         needed, as long as they are under the character limit).
 
-        All other keyword-only arguments are passed into the parent constructor.
+        The prefix and suffix are added to each page, and the max size is the limit of characters per page (including
+        the prefix and the suffix) - same as in discord.py's `Paginator`.
         """
-        super().__init__(**kwargs)
         self.max_lines = max_lines
+        self.prefix = prefix
+        self.suffix = suffix
+        self.max_size = max_size
+        self.linesep = linesep
+        self.clear()
+
+    def clear(self):
+        """
+        Removes all pages and the current page's content.
+        """
+        self._pages = list()
+        self._start_page()
+
+    def _start_page(self):
+        """
+        Helper function used to start a new (empty) page.
+        """
+        if self.prefix is not None:
+            self._current_page = [self.prefix]
+            self._count = len(self.prefix) + len(self.linesep)
+        else:
+            self._current_page = list()
+            self._count = 0
         self.lines_count = 0
 
-    def add_line(self, line: str = "", *args, **kwargs):
+    def _fits(self, length: int, lines_count: int) -> bool:
         """
-        Extended add_line method from the parent class, added the functionality to also restrict the number of lines.
+        Helper function used to check if the lines of given total length (including the line separators) fit on the
+        current page.
         """
-        if self.max_lines is not None:
-            if self.lines_count >= self.max_lines:
-                self.close_page()
-            self.lines_count += 1
+        suffix_length = len(self.suffix) if self.suffix is not None else 0
+        if self._count + length > self.max_size - suffix_length:
+            return False
+        return self.max_lines is None or self.lines_count + lines_count <= self.max_lines
 
-        super().add_line(line, *args, **kwargs)
+    def add_line(self, line: str = "", *, empty: bool = False):
+        """
+        Adds a line to the current page, or to a new page if it doesn't fit on the current page. If `empty` is set, an
+        additional empty line is added.
+
+        Raises `RuntimeError` if the line can't fit on any page.
+        """
+        max_length = self.max_size - len(self.prefix or "") - len(self.suffix or "") - 2 * len(self.linesep)
+        if len(line) > max_length:
+            raise RuntimeError(f"Line exceeds maximum page size {max_length}")
+
+        if not self._fits(len(line) + len(self.linesep), 1):
+            self.close_page()
+
+        self._current_page.append(line)
+        self._count += len(line) + len(self.linesep)
+        self.lines_count += 1
+
+        if empty:
+            self.add_line()
+
+    def _add_lines(self, page: Page):
+        """
+        Helper function used to add the lines of the page - all at once if they fit on the current page, otherwise one
+        by one (splitting them between the pages).
+        """
+        length = page.length + len(page.lines) * len(self.linesep)
+        if self._fits(length, len(page.lines)):
+            self._current_page.extend(page.lines)
+            self._count += length
+            self.lines_count += len(page.lines)
+        else:
+            for line in page.lines:
+                self.add_line(line)
+
+    def add_block(self, page: Page):
+        """
+        Adds the lines of the page to the current page, or to a new page if they don't all fit on the current page - so
+        that the lines are displayed together. Lines which can't fit on any single page are split between the pages.
+        """
+        started = len(self._current_page) > (0 if self.prefix is None else 1)
+        if started and not self._fits(page.length + len(page.lines) * len(self.linesep), len(page.lines)):
+            self.close_page()
+        self._add_lines(page)
 
     def add_page(self, page: Page):
         """
-        New support method to allow adding multiple lines (pages) at once.
+        Adds the lines of the page to the current page, and closes the page.
         """
-        for line in page.lines:
-            self.add_line(line)
+        self._add_lines(page)
         self.close_page()
 
     def close_page(self):
         """
-        Extended close_page method from the parent class, added the functionality to reset line count limiter.
+        Closes the current page (even if it's not full), and starts a new one.
+        """
+        if self.suffix is not None:
+            self._current_page.append(self.suffix)
+        self._pages.append(self.linesep.join(self._current_page))
+        self._start_page()
 
-        Note that if the paginator was given the line restriction, the pages may be closed early. Don't pass max_lines
-        restriction in the constructor to allow unlimited amount of lines per page.
+    def __len__(self) -> int:
+        return sum(len(page) for page in self._pages) + self._count
+
+    @property
+    def pages(self) -> _typing.List[str]:
         """
-        self.lines_count = 0
-        super().close_page()
+        Getter for the pages, closing the current page if it has any content.
+        """
+        if len(self._current_page) > (0 if self.prefix is None else 1):
+            self.close_page()
+        return self._pages
+
+
+class PageSource(_abc.ABC):
+    """
+    Source of the session pages, which produces the pages on demand - only the pages the user visits (and the pages
+    before them) are produced, each page only once, so the first page can be displayed without producing all pages.
+
+    Subclasses must implement the asynchronous generator `produce`, yielding the pages in order, and should pass the
+    estimated number of pages to the constructor - the session displays the estimate until all pages are produced.
+
+    Set the source as the session pages in `build_pages`, as follows::
+
+        async def build_pages(self):
+            self.pages = RecordsPageSource(self.query)
+
+    The produced pages can be accessed the same way as the list of pages (with `len` and by the page number).
+    """
+
+    def __init__(self, estimated_count: int = 1):
+        self._pages = list()
+        self._producer = None
+        self._lock = None
+        self._estimated_count = estimated_count
+        self.exhausted = False
+
+    def __len__(self) -> int:
+        """
+        Return the number of the pages - exact once all pages are produced, otherwise the estimated number (but always
+        at least one more than produced so far).
+        """
+        if self.exhausted:
+            return len(self._pages)
+        return max(self._estimated_count, len(self._pages) + 1)
+
+    def __getitem__(self, page_number: int) -> str:
+        return self._pages[page_number]
+
+    def __iter__(self) -> _typing.Iterator[str]:
+        return iter(self._pages)
+
+    @_abc.abstractmethod
+    def produce(self) -> _typing.AsyncIterator[str]:
+        """
+        Method to be overridden - each source needs to know how to produce the pages.
+
+        You MUST implement this method as an asynchronous generator, yielding the pages in order:
+
+            async def produce(self):
+                for chunk in self.chunks:
+                    yield format_page(chunk)
+        """
+        pass
+
+    async def fetch(self, page_number: int) -> int:
+        """
+        Produce the pages up to the given page number (if not produced yet), and return the page number - or the last
+        page's number, if there are fewer pages.
+        """
+        if self._producer is None:
+            self._producer = self.produce()
+            self._lock = _asyncio.Lock()
+
+        # The pages are produced by one caller at a time, since the generator can't be resumed concurrently
+        async with self._lock:
+
+            # Once the estimated number of pages is reached, produce one more page to find out if there are any more
+            while not self.exhausted and (len(self._pages) <= page_number or len(self._pages) == self._estimated_count):
+                try:
+                    self._pages.append(await self._producer.__anext__())
+                except StopAsyncIteration:
+                    self.exhausted = True
+
+        return min(page_number, len(self._pages) - 1)
+
+    async def fetch_all(self) -> int:
+        """
+        Produce all remaining pages, and return the last page's number.
+        """
+        return await self.fetch(_sys.maxsize)
+
+
+class _RestoredContext:
+    """
+    Replacement of the context of a restored session - the session only needs the bot, the author and the channel.
+    """
+
+    def __init__(self, bot: _commands.Bot, author: _discord.abc.User, channel: _discord.abc.Messageable):
+        self.bot = bot
+        self.author = author
+        self.channel = channel
+        self.guild = getattr(channel, "guild", None)
+
+
+class _PageEmbed(_discord.Embed):
+    """
+    Embed of a session page, which is only serialised once - the result is reused each time the page is sent.
+    """
+
+    def to_dict(self) -> dict:
+        """
+        Return the serialised embed - the same dictionary is returned each time, so the callers must never modify it.
+        """
+        try:
+            return self._dict
+        except AttributeError:
+            self._dict = super().to_dict()
+            return self._dict
+
+
+@_functools.lru_cache(maxsize=_PAGE_EMBEDS_CACHE_SIZE)
+def _page_embed(title: str, icon: str, page: str, page_number: int, page_count: int,
+                exact: bool = True) -> _PageEmbed:
+    """
+    Helper function used to create the embed of a session page - the embeds are cached, so that the sessions displaying
+    the same pages (for example the `!info` sessions of different users) share them.
+
+    If the number of pages is only estimated (not exact), it's displayed as such.
+
+    The returned embed (and its serialised dictionary) is shared, so it must never be modified - copy it first instead.
+    """
+    embed = _PageEmbed()
+
+    embed.set_author(name=title, icon_url=icon)
+    embed.description = page
+
+    # Add page counter to footer if paginating
+    if page_count > 1:
+        embed.set_footer(text=f"Page {page_number + 1} / {page_count}" if exact else
+                         f"Page {page_number + 1} / ~{page_count}")
+
+    return embed
 
 
 class Session:
@@ -171,7 +453,21 @@ class Session:
 
     When inheriting from this class, you must implement an asynchronous `build_pages` functions, and set the session's
     pages in there.
+
+    The navigation is handled by a single task per session, one action at a time - a burst of page changes results in
+    a single message edit (to the last requested page), and the pages are always displayed in the requested order.
     """
+    # Whether the user's reactions are removed once handled (so the same icon can be used again) - otherwise removing
+    # a reaction is handled the same way as adding it, which saves the API calls and works in the direct messages
+    # (where the bot can't remove the user's reactions)
+    remove_reactions = True
+
+    # Mapping of the session type names to the session classes, used to restore the sessions after a restart
+    types: _typing.Dict[str, type] = dict()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Session.types[cls.type_name()] = cls
 
     def __init__(self, ctx: _commands.Context, title: str, icon: str = _DEFAULT_SESSION_ICON, timeout: int = 60):
         """
@@ -183,19 +479,26 @@ class Session:
 
         Title must be set and will be displayed with the message. Icon is optional and defaults to a question mark.
 
+        The pages should be built in the author's locale - use `self.locale` to get the localised strings.
+
         Timeout defines after how long of no interaction should the session be ended.
         """
         self.ctx = ctx
         self.bot = ctx.bot
         self.author = ctx.author
+        self.locale = ctx.bot.get_locale(ctx.author)
         self.destination = ctx.channel
         self.title = title
         self.icon = icon
         self.pages = list()
         self.session_timeout = timeout
         self.current_page = 0
+        self.requested_page = 0
         self.message = None
-        self.timeout_task = None
+        self.deadline = None
+        self.remove_reactions = self.remove_reactions and ctx.guild is not None
+        self._removed_reactions = dict()
+        self._actions_task = None
 
         # Declare a mapping of emoji to reaction functions
         self.reactions = {
@@ -211,20 +514,47 @@ class Session:
         """
         Create and begin a session based on the given context.
         """
-        _Log.info(f"Starting a session, initiated by {ctx.author}")
+        _Log.info("Starting a session", author=ctx.author)
 
         session = cls(ctx, title, icon)
         await session.prepare()
         return session
 
+    @classmethod
+    def restore(cls, bot: _commands.Bot, message: _discord.Message, author: _discord.abc.User, title: str, icon: str,
+                locale: str, pages: _typing.List[str], current_page: int) -> "Session":
+        """
+        Recreate the session displayed in the given message (after the bot restarted). The pages are restored as they
+        were displayed, rather than built again, so the session doesn't need the original context (but keeps the
+        content it was created with, even if the strings were reloaded since).
+
+        The restored message isn't cached by discord.py, which is why the events are routed by the message ids.
+        """
+        session = cls.__new__(cls)
+        Session.__init__(session, _RestoredContext(bot, author, message.channel), title, icon)
+        session.locale = locale
+        session.pages = pages
+        session.current_page = session.requested_page = current_page
+        session.message = message
+        return session
+
+    @classmethod
+    def type_name(cls) -> str:
+        """
+        Return the name the session type is stored under.
+        """
+        return f"{cls.__module__}.{cls.__qualname__}"
+
     async def stop(self):
         """
-        Stops the session, removes event listeners and attempts to delete the session message.
+        Stops the session, stops routing its events, removes its timeout and attempts to delete the session message.
         """
-        _Log.info(f"Stopping the session started by {self.author}")
+        _Log.info("Stopping the session", author=self.author)
 
-        self.bot.remove_listener(self.on_reaction_add)
-        self.bot.remove_listener(self.on_message_delete)
+        self.bot.sessions.unregister(self)
+        self.bot.scheduler.cancel(self)
+        if self._actions_task is not None:
+            self._actions_task.cancel()
 
         # Ignore if permission issue, or the message doesn't exist
         with _contextlib.suppress(_discord.HTTPException, AttributeError):
@@ -234,24 +564,25 @@ class Session:
         """
         Sets up the session pages, events, message, and reactions.
         """
-        _Log.debug(f"Preparing the session for {self.author}")
+        _Log.debug("Preparing the session", author=self.author)
 
-        # Create paginated content
+        # Create paginated content (if the pages are produced on demand, only the first page is produced here)
         await self.build_pages()
+        if isinstance(self.pages, PageSource):
+            await self.pages.fetch(0)
 
         # Only continue if there are pages to display - otherwise stop the session early
         if self.pages:
 
-            # Setup the listeners to allow page browsing
-            self.bot.add_listener(self.on_reaction_add)
-            self.bot.add_listener(self.on_message_delete)
-
             # Display the first page
             await self.update_page()
 
             # Initial timeout reset to set the timer
             self.reset_timeout()
 
+            # Register the session message to allow page browsing (replacing the author's previous session of this type)
+            await self.bot.sessions.register(self)
+
             # Add the reactions once the message is visible
             self.add_reactions()
 
@@ -269,6 +600,8 @@ class Session:
             # Code which adds pages to paginator
 
             self.pages = paginator.pages
+
+        Alternatively, set self.pages to a `PageSource`, to only produce the pages once the user visits them.
         """
         pass
 
@@ -290,74 +623,100 @@ class Session:
         """
         Event that is called when the user requests the first page.
         """
-        _Log.debug(f"Getting first page for {self.author}")
+        _Log.debug("Getting first page", author=self.author)
 
-        if not self.is_first_page:
-            await self.update_page(0)
+        self.request_page(0)
 
     async def do_previous_page(self):
         """
         Event that is called when the user requests the previous page.
         """
-        _Log.debug(f"Getting previous page for {self.author}")
+        _Log.debug("Getting previous page", author=self.author)
 
-        if not self.is_first_page:
-            await self.update_page(self.current_page - 1)
+        self.request_page(self.requested_page - 1)
 
     async def do_next_page(self):
         """
         Event that is called when the user requests the next page.
         """
-        _Log.debug(f"Getting next page for {self.author}")
+        _Log.debug("Getting next page", author=self.author)
 
-        if not self.is_last_page:
-            await self.update_page(self.current_page + 1)
+        self.request_page(self.requested_page + 1)
 
     async def do_last_page(self):
         """
         Event that is called when the user requests the last page.
         """
-        _Log.debug(f"Getting last page for {self.author}")
+        _Log.debug("Getting last page", author=self.author)
 
-        if not self.is_last_page:
-            await self.update_page(len(self.pages) - 1)
+        # The number of pages is only estimated until all pages are produced
+        if isinstance(self.pages, PageSource):
+            await self.pages.fetch_all()
 
-    async def do_delete(self):
+        self.request_page(len(self.pages) - 1)
+
+    def request_page(self, page_number: int):
         """
-        Event that is called when the user requests to stop the help session.
+        Requests the given page (counting from any previously requested pages which aren't displayed yet) to be
+        displayed, once any pending actions are done.
         """
-        _Log.debug(f"Deleting the message for {self.author}")
+        self.requested_page = max(0, min(page_number, len(self.pages) - 1))
+        self._process_actions()
 
-        await self.message.delete()
+    def _process_actions(self):
+        """
+        Helper function used to start handling the pending actions, unless they are already being handled.
+        """
+        if self._actions_task is None:
+            self._actions_task = self.bot.loop.create_task(self._handle_actions())
 
-    async def timeout(self):
+    async def _handle_actions(self):
         """
-        Waits for a set number of seconds, then stops the help session.
+        Helper function used to handle the pending actions one at a time - first displaying the last requested page,
+        then removing the handled reactions (once per icon).
         """
-        await _asyncio.sleep(self.session_timeout)
-        await self.stop()
+        try:
+            while True:
+                if self.requested_page != self.current_page:
+                    await self.update_page(self.requested_page)
+                elif self._removed_reactions:
+                    emoji, user = self._removed_reactions.pop(next(iter(self._removed_reactions)))
+                    with _contextlib.suppress(_discord.HTTPException):
+                        await self.message.remove_reaction(emoji, user)
+                else:
+                    break
+
+            # Remember the displayed page, in case the session has to be restored
+            self.bot.sessions.update(self)
+        except _discord.HTTPException as e:
+            _Log.debug("Failed to handle the session actions", author=self.author, error=e)
+        finally:
+            self._actions_task = None
+
+    async def do_delete(self):
+        """
+        Event that is called when the user requests to stop the help session.
+        """
+        _Log.debug("Deleting the session message", author=self.author)
+
+        await self.message.delete()
 
     def reset_timeout(self):
         """
-        Cancels the original timeout task and sets it up again from the start.
+        Sets the session to be stopped after the timeout, counting from now.
 
         Used mainly to keep the session after users interact with it.
         """
-        _Log.debug(f"A user action by {self.author} forced the timeout reset")
-
-        # Cancel the original task if it exists
-        if self.timeout_task:
-            if not self.timeout_task.cancelled():
-                self.timeout_task.cancel()
+        _Log.debug("A user action forced the timeout reset", author=self.author)
 
-        # Recreate the timeout task
-        self.timeout_task = self.bot.loop.create_task(self.timeout())
+        self.deadline = _time.time() + self.session_timeout
+        self.bot.scheduler.schedule(self, self.session_timeout)
 
     def add_reactions(self):
         """
         Adds the relevant reactions to the session message based on if pagination is required.
         """
-        _Log.debug(f"Adding reactions for {self.author}'s session")
+        _Log.debug("Adding session reactions", author=self.author)
 
         if len(self.pages) > 1:
             for reaction in self.reactions:
@@ -369,6 +728,11 @@ class Session:
         """
         Displays the initial page, or changes the existing one to the given page number.
         """
+        # Produce the page first if needed - if there are fewer pages than estimated, the last page is displayed instead
+        if isinstance(self.pages, PageSource):
+            page_number = await self.pages.fetch(page_number)
+            self.requested_page = min(self.requested_page, len(self.pages) - 1)
+
         self.current_page = page_number
         embed_page = self.embed_page(page_number)
 
@@ -380,51 +744,315 @@ class Session:
     def embed_page(self, page_number: int = 0) -> _discord.Embed:
         """
         Returns an Embed with the requested page formatted within.
-        """
-        embed = _discord.Embed()
-
-        embed.set_author(name=self.title, icon_url=self.icon)
-        embed.description = self.pages[page_number]
-
-        # Add page counter to footer if paginating
-        page_count = len(self.pages)
-        if page_count > 1:
-            embed.set_footer(text=f"Page {self.current_page + 1} / {page_count}")
 
-        return embed
+        The embed is shared by all sessions displaying the same page, and must not be modified.
+        """
+        return _page_embed(self.title, self.icon, self.pages[page_number], page_number, len(self.pages),
+                           getattr(self.pages, "exhausted", True))
 
-    async def on_reaction_add(self, reaction: _discord.Reaction, user: _discord.User):
+    async def on_reaction_add(self, emoji: _typing.Union[str, _discord.PartialEmoji], user: _discord.abc.Snowflake):
         """
-        Event handler for when reactions are added on the session message.
+        Event handler for when reactions are added on the session message (called by the `SessionManager`).
         """
-        _Log.debug(f"Reaction added by {user.display_name}")
-
-        # Ensure it was the relevant session message
-        if reaction.message.id != self.message.id:
-            return
+        _Log.debug("Reaction added", user=user, emoji=emoji)
 
         # Ensure it was the session author who reacted
         if user.id != self.author.id:
             return
 
         # Only handle valid action emoji-s
-        if str(reaction.emoji) in self.reactions:
+        if str(emoji) in self.reactions:
             self.reset_timeout()
-            await self.reactions[str(reaction.emoji)]()
+            await self.reactions[str(emoji)]()
         else:
             return
 
-        # Remove the added reaction to prep for re-use
-        with _contextlib.suppress(_discord.HTTPException):
-            _Log.debug(f"Reaction by {user.display_name} handled by the session")
-            await self.message.remove_reaction(reaction, user)
+        # Remove the added reaction to prep for re-use, once the requested page is displayed
+        if self.remove_reactions:
+            _Log.debug("Reaction handled by the session", user=user)
+            self._removed_reactions[str(emoji)] = (emoji, user)
+            self._process_actions()
 
-    async def on_message_delete(self, message: _discord.Message):
+    async def on_reaction_remove(self, emoji: _typing.Union[str, _discord.PartialEmoji],
+                                 user: _discord.abc.Snowflake):
         """
-        Closes the help session when the session message is deleted.
+        Event handler for when reactions are removed from the session message (called by the `SessionManager`) - only
+        handled if the session doesn't remove the reactions itself.
         """
-        if message.id == self.message.id:
-            await self.stop()
+        if not self.remove_reactions and user.id == self.author.id and str(emoji) in self.reactions:
+            _Log.debug("Reaction removed", user=user, emoji=emoji)
+            self.reset_timeout()
+            await self.reactions[str(emoji)]()
+
+    async def on_message_delete(self):
+        """
+        Closes the session when the session message is deleted (called by the `SessionManager`).
+        """
+        await self.stop()
+
+
+class SessionScheduler:
+    """
+    Scheduler of the session timeouts, which stops the sessions once their deadlines pass.
+
+    The deadlines are kept in a heap, with a single timer set for the earliest one - the sessions don't need a task
+    each. Extending a deadline (the usual case, since each interaction resets the timeout) only updates the stored
+    deadline, and the heap entry is moved once it comes up. All sessions past their deadlines are stopped together.
+    """
+
+    def __init__(self, loop: _asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._heap = list()
+        self._deadlines: _typing.Dict[Session, float] = dict()
+        self._counter = _itertools.count()
+        self._timer = None
+        self._timer_deadline = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, session: Session, timeout: float):
+        """
+        Set the session to be stopped after the timeout (in seconds), replacing its previous deadline (if any).
+        """
+        deadline = self._loop.time() + timeout
+        previous = self._deadlines.get(session)
+        self._deadlines[session] = deadline
+
+        # A later deadline will be picked up when the existing heap entry comes up
+        if previous is None or deadline < previous:
+            _heapq.heappush(self._heap, (deadline, next(self._counter), session))
+            self._set_timer()
+
+    def cancel(self, session: Session):
+        """
+        Remove the session's deadline (if any) - the heap entry is discarded once it comes up.
+        """
+        self._deadlines.pop(session, None)
+
+    def close(self):
+        """
+        Remove all deadlines and stop the timer.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._timer_deadline = None
+        self._heap.clear()
+        self._deadlines.clear()
+
+    def _set_timer(self):
+        """
+        Helper function used to make sure the timer is set for the earliest deadline in the heap.
+        """
+        if not self._heap:
+            return
+
+        deadline = self._heap[0][0]
+        if self._timer is None or deadline < self._timer_deadline:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = self._loop.call_at(deadline, self._expire)
+            self._timer_deadline = deadline
+
+    def _expire(self):
+        """
+        Helper function used to stop all sessions past their deadlines, called by the timer.
+        """
+        self._timer = self._timer_deadline = None
+        now = self._loop.time()
+        expired = list()
+
+        while self._heap and self._heap[0][0] <= now:
+            deadline, _, session = _heapq.heappop(self._heap)
+            current = self._deadlines.get(session)
+
+            # The session was either stopped, or its deadline was moved (to a later time, or to an earlier time, with
+            # another heap entry added)
+            if current is None or current < deadline:
+                continue
+            if current > deadline:
+                _heapq.heappush(self._heap, (current, next(self._counter), session))
+                continue
+
+            del self._deadlines[session]
+            expired.append(session)
+
+        if expired:
+            _Log.debug("Session timeouts expired", count=len(expired))
+            self._loop.create_task(self._stop(expired))
+        self._set_timer()
+
+    @staticmethod
+    async def _stop(sessions: _typing.List[Session]):
+        """
+        Helper function used to stop the sessions (together), reporting any sessions which failed to stop.
+        """
+        results = await _asyncio.gather(*(session.stop() for session in sessions), return_exceptions=True)
+        for session, result in zip(sessions, results):
+            if isinstance(result, Exception):
+                _Log.error("Failed to stop the session", author=session.author, error=result)
+
+
+class SessionManager:
+    """
+    Registry of the active sessions, used to route the reaction and message deletion events to the sessions.
+
+    The sessions are stored by their message ids, so each (raw) event is routed with a single lookup, no matter how many
+    sessions are active - events of any other messages are ignored. The bot owns a single manager, and calls it from
+    its own event handlers::
+
+        async def on_raw_reaction_add(self, payload):
+            await self.sessions.on_reaction_add(payload.message_id, payload.emoji, payload.member)
+
+    The number of sessions is limited - each user can only have one session of each type (a new session replaces the
+    previous one), and once there are more than `max_sessions` sessions, the least recently used ones are stopped.
+
+    If a database is given, the sessions are stored in it (in the background), so that they can be restored with
+    `restore` once the bot restarts.
+    """
+
+    def __init__(self, max_sessions: int = _MAX_SESSIONS, database: _SessionDatabase = None):
+        self._max_sessions = max_sessions
+        self._database = database
+        self._sessions: _typing.Dict[int, Session] = _collections.OrderedDict()
+        self._owned_sessions: _typing.Dict[_typing.Tuple[int, type], Session] = dict()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def get(self, message_id: int) -> _typing.Optional[Session]:
+        """
+        Return the session displayed in the message with the given id, or None if there is no such session.
+        """
+        return self._sessions.get(message_id)
+
+    async def register(self, session: Session):
+        """
+        Start routing the events of the session message to the session, and stop the sessions it replaces (the
+        author's previous session of the same type, and the least recently used sessions above the limit).
+        """
+        stopped = list()
+
+        previous = self._owned_sessions.get((session.author.id, type(session)))
+        if previous is not None and previous is not session:
+            stopped.append(previous)
+            self.unregister(previous)
+
+        self._sessions[session.message.id] = session
+        self._owned_sessions[session.author.id, type(session)] = session
+        if self._database is not None:
+            # Sessions with pages not produced yet are stored without the pages - only to delete them after a restart
+            pages = session.pages if getattr(session.pages, "exhausted", True) else ()
+            self._database.save(session.message.id, session.destination.id, session.author.id, session.type_name(),
+                                session.title, session.icon, session.locale, pages, session.current_page,
+                                session.deadline)
+
+        # The evicted sessions are no longer registered when `unregister` is called, so they are deleted from here
+        while len(self._sessions) > self._max_sessions:
+            message_id, evicted = self._sessions.popitem(last=False)
+            stopped.append(evicted)
+            self.unregister(evicted)
+            if self._database is not None:
+                self._database.delete(message_id)
+
+        if stopped:
+            _Log.debug("Stopping replaced sessions", count=len(stopped))
+            await _asyncio.gather(*(other.stop() for other in stopped))
+
+    def unregister(self, session: Session):
+        """
+        Stop routing the events to the session (if it was registered).
+        """
+        if session.message is not None and self._sessions.get(session.message.id) is session:
+            del self._sessions[session.message.id]
+            if self._database is not None:
+                self._database.delete(session.message.id)
+        if self._owned_sessions.get((session.author.id, type(session))) is session:
+            del self._owned_sessions[session.author.id, type(session)]
+
+    def update(self, session: Session):
+        """
+        Update the stored displayed page and deadline of the session (if it's registered).
+        """
+        if self._database is not None and self._sessions.get(session.message.id) is session:
+            self._database.update(session.message.id, session.current_page, session.deadline)
+
+    def close(self):
+        """
+        Close the database (the sessions stay stored, to be restored once the bot restarts).
+        """
+        if self._database is not None:
+            self._database.close()
+
+    async def restore(self, bot: _commands.Bot):
+        """
+        Restore the sessions stored before the bot restarted, all at once - the sessions which timed out in the
+        meantime (or whose types are no longer available) are stopped, and their messages deleted.
+        """
+        if self._database is None:
+            return
+
+        stored = await self._database.take()
+        now = _time.time()
+        results = await _asyncio.gather(*(self._restore(bot, now, *values) for values in stored),
+                                        return_exceptions=True)
+
+        for values, result in zip(stored, results):
+            if isinstance(result, Exception):
+                _Log.debug("Failed to restore the session", message_id=values[0], error=result)
+        _Log.info("Sessions restored", stored=len(stored), restored=sum(result is True for result in results))
+
+    async def _restore(self, bot: _commands.Bot, now: float, message_id: int, channel_id: int, author_id: int,
+                       session_type: str, title: str, icon: str, locale: str, pages: _typing.List[str],
+                       current_page: int, deadline: float) -> bool:
+        """
+        Helper function used to restore a single session, returns whether the session was restored or stopped.
+        """
+        channel = bot.get_channel(channel_id) or await bot.fetch_channel(channel_id)
+        message = await channel.fetch_message(message_id)
+
+        session_class = Session.types.get(session_type)
+        if session_class is None or deadline <= now or not pages:
+            await message.delete()
+            return False
+
+        guild = getattr(channel, "guild", None)
+        author = (guild and guild.get_member(author_id)) or bot.get_user(author_id) or _discord.Object(author_id)
+        session = session_class.restore(bot, message, author, title, icon, locale, pages,
+                                        min(current_page, len(pages) - 1))
+
+        session.deadline = deadline
+        bot.scheduler.schedule(session, deadline - now)
+        await self.register(session)
+        return True
+
+    async def on_reaction_add(self, message_id: int, emoji: _typing.Union[str, _discord.PartialEmoji],
+                              user: _discord.abc.Snowflake):
+        """
+        Route the reaction added to the message with the given id to the session displayed in it (if any).
+        """
+        session = self._sessions.get(message_id)
+        if session is not None:
+            self._sessions.move_to_end(message_id)
+            await session.on_reaction_add(emoji, user)
+
+    async def on_reaction_remove(self, message_id: int, emoji: _typing.Union[str, _discord.PartialEmoji],
+                                 user: _discord.abc.Snowflake):
+        """
+        Route the reaction removed from the message with the given id to the session displayed in it (if any).
+        """
+        session = self._sessions.get(message_id)
+        if session is not None:
+            self._sessions.move_to_end(message_id)
+            await session.on_reaction_remove(emoji, user)
+
+    async def on_message_delete(self, message_id: int):
+        """
+        Route the deletion of the message with the given id to the session displayed in it (if any).
+        """
+        session = self._sessions.get(message_id)
+        if session is not None:
+            await session.on_message_delete()
 
 
 class MessageEmbed(_discord.Embed):
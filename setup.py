@@ -11,6 +11,7 @@ Of course, alternatively, you can execute the code pulled from github directly.
 """
 import os
 import json
+import glob
 import setuptools
 
 # Fetch the root folder to specify absolute paths to the files to include
@@ -22,6 +23,7 @@ PACKAGE_DATA = [
     os.path.join(ROOT, "dof_discord_bot", "res", "meta.json"),
     os.path.join(ROOT, "dof_discord_bot", "res", "config.json"),
     os.path.join(ROOT, "dof_discord_bot", "log", ".keep"),
+    *glob.glob(os.path.join(ROOT, "dof_discord_bot", "res", "strings.*.yaml")),
 ]
 
 with open(os.path.join(ROOT, "dof_discord_bot", "res", "meta.json")) as f:
@@ -49,7 +51,8 @@ setuptools.setup(
     install_requires=[
         "discord",
         "pyyaml",
-        "python-dotenv"
+        "python-dotenv",
+        "numpy"
     ],
     python_requires=">=3.6",
 )
@@ -0,0 +1,139 @@
+"""
+Benchmark of the character name and face lookups, on a generated catalogue of 10k characters.
+
+Run it directly from the root folder of the project:
+
+    python tests/benchmarks/bench_characters.py
+"""
+import os as _os
+import sys as _sys
+import random as _random
+import timeit as _timeit
+import difflib as _difflib
+
+# Make sure dof_discord_bot package can be found and overrides any installed versions, the token is never used
+_sys.path.insert(0, _os.path.join(_os.path.dirname(__file__), "..", ".."))
+_os.environ.setdefault("DOF_TOKEN", "benchmark")
+from dof_discord_bot.src.characters import NameIndex as _NameIndex, BodyProperties as _BodyProperties  # noqa
+from dof_discord_bot.src.faces import FaceIndex as _FaceIndex  # noqa
+
+# Declare the size of the catalogue, how many queries are measured, and the seed to make the results reproducible
+CATALOGUE_SIZE = 10000
+QUERIES = 200
+SEED = 1
+
+_SYLLABLES = ("ba", "ra", "the", "on", "gal", "den", "mor", "can", "ly", "si", "ca", "ar", "wyn", "tho", "mund", "el",
+              "is", "van", "ko", "dre", "ga", "hin", "su", "ran", "ta", "los", "ne", "mi", "ros", "ul", "pha", "ea")
+
+
+def _catalogue(random: _random.Random) -> list:
+    """
+    Generate unique names of one to three words, similar to the character names.
+    """
+    names = set()
+    while len(names) < CATALOGUE_SIZE:
+        words = [str.join("", random.choices(_SYLLABLES, k=random.randint(2, 4)))
+                 for _ in range(random.choice((1, 1, 1, 2, 3)))]
+        names.add(str.join("_", words))
+    return sorted(names)
+
+
+def _typo(random: _random.Random, name: str) -> str:
+    """
+    Introduce a single typo (a removed, replaced or swapped character) into the name.
+    """
+    i = random.randrange(len(name) - 1)
+    kind = random.randrange(3)
+    if kind == 0:
+        return name[:i] + name[i + 1:]
+    if kind == 1:
+        return name[:i] + random.choice("aeiouxyz") + name[i + 1:]
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def _report(name: str, seconds: float, count: int = QUERIES):
+    """
+    Print a single measurement, per query.
+    """
+    print(f"{name:<48} {seconds / count * 1e6:10.1f} us/query")
+
+
+def _measure(function, queries: list) -> float:
+    """
+    Measure the best time of running the function on all queries.
+    """
+    return min(_timeit.repeat(lambda: [function(query) for query in queries], number=1, repeat=3))
+
+
+def _nibble_distance(first: bytes, second: bytes) -> int:
+    """
+    Compute the distance between two face keys in pure Python - used as the baseline.
+    """
+    return sum(abs((a >> 4) - (b >> 4)) + abs((a & 0x0F) - (b & 0x0F)) for a, b in zip(first, second))
+
+
+def measure_faces(random: _random.Random, names: list):
+    """
+    Measure the cost of finding the most similar faces, compared to a Python loop over all faces.
+    """
+    faces = {name: _BodyProperties(4, 25.0, 0.5, 0.5, bytes(random.getrandbits(8) for _ in range(67)))
+             for name in names}
+    queries = random.sample(list(faces.values()), QUERIES // 10)
+
+    print(f"\nBuilding the face index ({CATALOGUE_SIZE} faces):")
+    index = None
+
+    def build():
+        nonlocal index
+        index = _FaceIndex(faces)
+
+    print(f"{'face index':<48} {min(_timeit.repeat(build, number=1, repeat=3)) * 1e3:10.1f} ms")
+
+    print(f"\nMost similar faces ({len(queries)} queries):")
+    _report("python loop", _measure(lambda face: sorted(
+        (_nibble_distance(face.key, other.key), name) for name, other in faces.items())[:5], queries), len(queries))
+    _report("face index", _measure(lambda face: index.similar(face, 5), queries), len(queries))
+
+
+def main():
+    """
+    Run all character lookup benchmarks and print the results.
+    """
+    random = _random.Random(SEED)
+    names = _catalogue(random)
+    names_set = set(names)
+    samples = random.sample(names, QUERIES)
+    typos = [_typo(random, name) for name in samples]
+    double_typos = [_typo(random, typo) for typo in typos]
+    prefixes = [name[:max(3, len(name) - 2)] for name in samples]
+
+    print(f"Building the index ({CATALOGUE_SIZE} names):")
+    index = None
+
+    def build():
+        nonlocal index
+        index = _NameIndex(names)
+
+    print(f"{'name index':<48} {min(_timeit.repeat(build, number=1, repeat=3)) * 1e3:10.1f} ms")
+
+    print(f"\nLookups ({QUERIES} queries):")
+    _report("exact - set membership (before)", _measure(names_set.__contains__, samples))
+    _report("exact - name index", _measure(index.resolve, samples))
+    _report("prefix - linear scan", _measure(
+        lambda prefix: [name for name in names if name.startswith(prefix)], prefixes))
+    _report("prefix - name index", _measure(index.resolve, prefixes))
+    _report("typo - difflib.get_close_matches", _measure(
+        lambda query: _difflib.get_close_matches(query, names, n=3), typos[:QUERIES // 10]), QUERIES // 10)
+    _report("typo - name index", _measure(index.suggest, typos))
+    _report("two typos - name index", _measure(index.suggest, double_typos))
+
+    found = sum(sample in index.suggest(typo) for sample, typo in zip(samples, typos))
+    print(f"\nTypos answered with the original name: {found} / {QUERIES}")
+    found = sum(sample in index.suggest(typo) for sample, typo in zip(samples, double_typos))
+    print(f"Two typos answered with the original name: {found} / {QUERIES}")
+
+    measure_faces(random, names)
+
+
+if __name__ == "__main__":
+    main()
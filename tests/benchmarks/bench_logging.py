@@ -0,0 +1,156 @@
+"""
+Benchmark of the per-record logging cost, measured through the `Log` class at DEBUG level.
+
+Run it directly from the root folder of the project:
+
+    python tests/benchmarks/bench_logging.py
+"""
+import os as _os
+import sys as _sys
+import json as _json
+import timeit as _timeit
+import inspect as _inspect
+import logging as _logging
+import tempfile as _tempfile
+import io as _io
+
+# Make sure dof_discord_bot package can be found and overrides any installed versions, the token is never used
+_sys.path.insert(0, _os.path.join(_os.path.dirname(__file__), "..", ".."))
+_os.environ.setdefault("DOF_TOKEN", "benchmark")
+from dof_discord_bot.src.constants import RES_DIR as _RES_DIR  # noqa
+from dof_discord_bot.src.logger import Log as _Log  # noqa
+from dof_discord_bot.res import verbose_file_handler as _verbose  # noqa
+from dof_discord_bot.res import restricted_file_handler as _restricted  # noqa
+from dof_discord_bot.res import routing_file_handler as _routing  # noqa
+
+# Declare how many records are emitted per measurement, and how deep the (simulated) event loop stack is
+RECORDS = 5000
+STACK_DEPTH = 30
+
+
+class _LegacyVerboseFileHandler(_logging.FileHandler):
+    """
+    The verbose handler as implemented before the lazy caller resolution - used as the baseline.
+    """
+
+    def emit(self, record):
+        """
+        Find the caller by inspecting the full stack, then look up the frame info again.
+        """
+        stack = _inspect.stack()[::-1]
+        frame = None
+        while stack:
+            frame = stack.pop()
+            if _os.path.basename(frame.filename) == "logger.py":
+                frame = stack.pop()[0] if stack else frame
+                break
+
+        caller = _inspect.getframeinfo(frame)
+        record.filename = _os.path.relpath(caller.filename, _verbose._ROOT_DIR)
+        record.function = caller.function
+        record.lineno = caller.lineno
+        return _logging.FileHandler.emit(self, record)
+
+
+def _formatter(name: str) -> _logging.Formatter:
+    """
+    Create the formatter, as declared in the logging config file.
+    """
+    with open(_os.path.join(_RES_DIR, "config.json")) as f:
+        config = _json.load(f)["formatters"][name]
+    return _logging.Formatter(config["format"], config["datefmt"], style=config["style"])
+
+
+def _emit_records(depth: int = STACK_DEPTH, mixed_levels: bool = False):
+    """
+    Recurse to simulate a deep stack (such as discord's event dispatching), then log all records.
+
+    Set `mixed_levels` to cycle through the levels instead of only logging the debug records.
+    """
+    if depth:
+        return _emit_records(depth - 1, mixed_levels)
+
+    functions = (_Log.debug, _Log.info, _Log.warning, _Log.error) if mixed_levels else (_Log.debug,)
+    for i in range(RECORDS):
+        functions[i % len(functions)]("Benchmark record %d", i)
+
+
+def measure(name: str, handlers: list, mixed_levels: bool = False) -> float:
+    """
+    Measure the average cost (in microseconds) of a single `Log` call with the given handlers attached.
+    """
+    logger = _logging.getLogger(f"dof-discord-bot-benchmark.{name}")
+    logger.propagate = False
+    logger.setLevel(_logging.DEBUG)
+    for handler in handlers:
+        logger.addHandler(handler)
+
+    original_logger, _Log._logger = _Log._logger, logger
+    try:
+        elapsed = min(_timeit.repeat(lambda: _emit_records(mixed_levels=mixed_levels), number=1, repeat=3))
+    finally:
+        _Log._logger = original_logger
+        for handler in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+
+    print(f"{name:<40} {elapsed / RECORDS * 1e6:8.2f} us/record")
+    return elapsed
+
+
+def main():
+    """
+    Run all logging benchmarks and print the results.
+    """
+    verbose_formatter = _formatter("verbose")
+    basic_formatter = _formatter("basic")
+    levels = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+    def verbose_handler(handler_class: type, directory: str, **kwargs) -> _logging.Handler:
+        handler = handler_class(_os.path.join(directory, "verbose.log"), encoding="utf8", **kwargs)
+        handler.setFormatter(verbose_formatter)
+        return handler
+
+    def restricted_handlers(directory: str, in_memory: bool = False) -> list:
+        handlers = list()
+        for level in levels:
+            handler = _restricted._RestrictedFileHandler(_os.path.join(directory, f"{level.lower()}.log"),
+                                                         encoding="utf8", delay=in_memory)
+            handler.setLevel(level)
+            handler.setFormatter(basic_formatter)
+            if in_memory:
+                handler.stream = _io.StringIO()
+            handlers.append(handler)
+        return handlers
+
+    def routing_handler(directory: str, in_memory: bool = False) -> _logging.Handler:
+        handler = _routing._LevelRoutingFileHandler(
+            {level: _os.path.join(directory, f"{level.lower()}.log") for level in levels}, encoding="utf8",
+            delay=in_memory)
+        handler.setLevel("DEBUG")
+        handler.setFormatter(basic_formatter)
+        if in_memory:
+            for target in handler.targets.values():
+                target.stream = _io.StringIO()
+        return handler
+
+    with _tempfile.TemporaryDirectory() as directory:
+        print(f"Verbose handler emit cost ({RECORDS} records, stack depth {STACK_DEPTH}):")
+        measure("verbose (inspect.stack, before)", [verbose_handler(_LegacyVerboseFileHandler, directory)])
+        measure("verbose (frame resolution)", [verbose_handler(
+            _verbose._VerboseFileHandler, directory, caller_resolution=_verbose.FRAME_RESOLUTION)])
+        if _verbose.STACKLEVEL_SUPPORTED:
+            measure("verbose (record resolution)", [verbose_handler(
+                _verbose._VerboseFileHandler, directory, caller_resolution=_verbose.RECORD_RESOLUTION)])
+
+        print(f"\nPer-level files emit cost ({RECORDS} records, all levels):")
+        measure("4 x restricted handler (before)", restricted_handlers(directory), mixed_levels=True)
+        measure("level routing handler", [routing_handler(directory)], mixed_levels=True)
+
+        print(f"\nPer-level files dispatch cost, excluding disk I/O ({RECORDS} records, all levels):")
+        measure("4 x restricted handler (before)", restricted_handlers(directory, True), mixed_levels=True)
+        measure("level routing handler", [routing_handler(directory, True)], mixed_levels=True)
+
+
+if __name__ == "__main__":
+    main()
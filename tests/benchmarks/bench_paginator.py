@@ -0,0 +1,141 @@
+"""
+Benchmark of the paginator, on generated catalogue-sized inputs (10k lines).
+
+Run it directly from the root folder of the project:
+
+    python tests/benchmarks/bench_paginator.py
+"""
+import os as _os
+import sys as _sys
+import random as _random
+import timeit as _timeit
+from discord.ext import commands as _commands
+
+# Make sure dof_discord_bot package can be found and overrides any installed versions, the token is never used
+_sys.path.insert(0, _os.path.join(_os.path.dirname(__file__), "..", ".."))
+_os.environ.setdefault("DOF_TOKEN", "benchmark")
+from dof_discord_bot.src.utils import LinePaginator as _LinePaginator, Page as _Page  # noqa
+
+# Declare the number of lines, the lines per page, and the seed to make the results reproducible
+CATALOGUE_SIZE = 10000
+MAX_LINES = 20
+SEED = 1
+
+
+class _LinePaginatorBefore(_commands.Paginator):
+    """
+    The previous paginator - extends discord.py's `Paginator` and adds the lines one by one, used as the baseline.
+    """
+
+    def __init__(self, max_lines: int = None, **kwargs):
+        super().__init__(**kwargs)
+        self.max_lines = max_lines
+        self.lines_count = 0
+
+    def add_line(self, line: str = "", *, empty: bool = False):
+        if self.max_lines is not None:
+            if self.lines_count >= self.max_lines:
+                self.lines_count = 0
+                self.close_page()
+            self.lines_count += 1
+        super().add_line(line, empty=empty)
+
+    def add_page(self, page: _Page):
+        for line in page.lines:
+            self.add_line(line)
+        self.close_page()
+
+    def close_page(self):
+        self.lines_count = 0
+        super().close_page()
+
+
+def _report(name: str, seconds: float, count: int = CATALOGUE_SIZE):
+    """
+    Print a single measurement, per line.
+    """
+    print(f"{name:<48} {seconds / count * 1e6:10.2f} us/line")
+
+
+def _measure(function) -> float:
+    """
+    Measure the best time of running the function.
+    """
+    return min(_timeit.repeat(function, number=1, repeat=5))
+
+
+def _lines(random: _random.Random) -> list:
+    """
+    Generate lines of varying length, similar to the log records and the command details.
+    """
+    return [str.join(" ", ("x" * random.randint(1, 10) for _ in range(random.randint(1, 12))))
+            for _ in range(CATALOGUE_SIZE)]
+
+
+def main():
+    """
+    Run all paginator benchmarks and print the results.
+    """
+    lines = _lines(_random.Random(SEED))
+    pages = [_Page(lines[i:i + 10]) for i in range(0, CATALOGUE_SIZE, 10)]
+    blocks = [_Page(f"**`{line[:20]}`**\n*{line}*", "") for line in lines[::2]]
+
+    def lines_before():
+        paginator = _LinePaginatorBefore(max_lines=MAX_LINES)
+        for line in lines:
+            paginator.add_line(line)
+        return paginator.pages
+
+    def lines_after():
+        paginator = _LinePaginator(max_lines=MAX_LINES)
+        for line in lines:
+            paginator.add_line(line)
+        return paginator.pages
+
+    def pages_before():
+        paginator = _LinePaginatorBefore(prefix="", suffix="", max_size=4096)
+        for page in pages:
+            paginator.add_page(page)
+        return paginator.pages
+
+    def pages_after():
+        paginator = _LinePaginator(prefix="", suffix="", max_size=4096)
+        for page in pages:
+            paginator.add_page(page)
+        return paginator.pages
+
+    def blocks_before():
+        # The workaround previously used by the global help, to keep the command details together
+        paginator = _LinePaginatorBefore(prefix="", suffix="", max_lines=MAX_LINES)
+        for block in blocks:
+            if paginator.lines_count + len(block.lines[0].split("\n")) > MAX_LINES:
+                paginator.lines_count = 0
+                paginator.close_page()
+            for line in block.lines:
+                paginator.add_line(line)
+        return paginator.pages
+
+    def blocks_after():
+        paginator = _LinePaginator(prefix="", suffix="", max_lines=MAX_LINES)
+        for block in blocks:
+            paginator.add_block(block)
+        return paginator.pages
+
+    print(f"Single lines ({CATALOGUE_SIZE} lines, {MAX_LINES} lines per page):")
+    _report("add_line - discord.py paginator (before)", _measure(lines_before))
+    _report("add_line - line paginator", _measure(lines_after))
+
+    print(f"\nWhole pages ({len(pages)} pages of 10 lines):")
+    _report("add_page - line by line (before)", _measure(pages_before))
+    _report("add_page - line paginator", _measure(pages_after))
+
+    print(f"\nBlocks ({len(blocks)} blocks of 2 lines, {MAX_LINES} lines per page):")
+    _report("manual lines count (before)", _measure(blocks_before), len(blocks) * 2)
+    _report("add_block - line paginator", _measure(blocks_after), len(blocks) * 2)
+
+    assert lines_before() == lines_after() and pages_before() == pages_after() and blocks_before() == blocks_after()
+    print("\nThe pages are identical")
+
+
+if __name__ == "__main__":
+    main()
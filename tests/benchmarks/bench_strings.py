@@ -0,0 +1,102 @@
+"""
+Benchmark of loading the strings resources, both in-process and as the import time of the `strings` module.
+
+Run it directly from the root folder of the project:
+
+    python tests/benchmarks/bench_strings.py
+"""
+import os as _os
+import sys as _sys
+import timeit as _timeit
+import tempfile as _tempfile
+import subprocess as _subprocess
+import yaml as _yaml
+
+# Make sure dof_discord_bot package can be found and overrides any installed versions, the token is never used
+_ROOT_DIR = _os.path.join(_os.path.dirname(__file__), "..", "..")
+_sys.path.insert(0, _ROOT_DIR)
+_os.environ.setdefault("DOF_TOKEN", "benchmark")
+from dof_discord_bot.src import strings as _strings  # noqa
+
+# Declare how many times each measurement is repeated
+REPEATS = 10
+
+
+def _report(name: str, seconds: float):
+    """
+    Print a single measurement.
+    """
+    print(f"{name:<40} {seconds * 1e3:8.2f} ms")
+
+
+def measure_loading():
+    """
+    Measure the in-process cost of each way of loading the strings.
+    """
+    with open(_strings._STRINGS_FILE_PATH, "rb") as f:
+        content = f.read()
+
+    print("Loading the strings (in-process):")
+    _report("yaml.SafeLoader (before)", min(_timeit.repeat(
+        lambda: _yaml.load(content, Loader=_yaml.SafeLoader), number=1, repeat=REPEATS)))
+    if hasattr(_yaml, "CSafeLoader"):
+        _report("yaml.CSafeLoader", min(_timeit.repeat(
+            lambda: _yaml.load(content, Loader=_yaml.CSafeLoader), number=1, repeat=REPEATS)))
+
+    with _tempfile.TemporaryDirectory() as directory:
+        cache_file_path = _os.path.join(directory, "strings.cache")
+        _strings._load(cache_file_path=cache_file_path)
+        _report("binary snapshot", min(_timeit.repeat(
+            lambda: _strings._load(cache_file_path=cache_file_path), number=1, repeat=REPEATS)))
+
+
+def _import_time() -> float:
+    """
+    Import the `strings` module in a fresh interpreter and return its own (exclusive) import time in seconds.
+    """
+    result = _subprocess.run([_sys.executable, "-X", "importtime", "-c", "import dof_discord_bot.src.strings"],
+                             cwd=_ROOT_DIR, stderr=_subprocess.PIPE, universal_newlines=True, check=True)
+    for line in result.stderr.splitlines():
+        if line.rstrip().endswith(" dof_discord_bot.src.strings"):
+            self_time = int(line.split(":")[1].split("|")[0])
+            if self_time:
+                return self_time / 1e6
+    raise RuntimeError("Failed to find the strings module import time")
+
+
+def measure_import():
+    """
+    Measure the import time of the `strings` module, without and with the binary snapshots (of all locales).
+
+    Any existing snapshots are put aside for the "cold" measurement, and then restored.
+    """
+    cache_file_paths = [_os.path.splitext(path)[0] + ".cache" for path in _strings._locale_files().values()]
+    existing = [path for path in cache_file_paths if _os.path.exists(path)]
+
+    print("\nImporting dof_discord_bot.src.strings (fresh interpreter):")
+    for path in existing:
+        _os.replace(path, path + ".benchmark")
+    try:
+        cold = list()
+        for _ in range(3):
+            for path in cache_file_paths:
+                if _os.path.exists(path):
+                    _os.remove(path)
+            cold.append(_import_time())
+        _report("without snapshot", min(cold))
+        _report("with snapshot", min(_import_time() for _ in range(3)))
+    finally:
+        for path in existing:
+            _os.replace(path + ".benchmark", path)
+
+
+def main():
+    """
+    Run all strings benchmarks and print the results.
+    """
+    measure_loading()
+    measure_import()
+
+
+if __name__ == "__main__":
+    main()
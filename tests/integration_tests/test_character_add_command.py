@@ -0,0 +1,34 @@
+"""
+Tests associated with the !character add command.
+"""
+import pytest
+from . import helpers
+from dof_discord_bot.src import strings
+from dof_discord_bot.src.logger import Log
+
+
+@helpers.threaded_async
+async def test_rejects_invalid_code():
+    """
+    Calling the command with a malformed character code should result in the character not being added.
+    """
+    async def error_to_appear():
+        """
+        Make sure that the bot answers the command and the invalid code is reported.
+        """
+        message = helpers.get_test_channel().last_message
+
+        if message and message.author.name == "DofDevBotApplication":
+            assert message.embeds[0].title.startswith(strings.Characters.invalid_character_code.format(""))
+            return True
+
+        Log.debug("Waiting for the response to the !character add command to appear")
+
+    def or_fail():
+        """
+        Otherwise, fail the test.
+        """
+        pytest.fail("Timed out waiting for response to the !character add command")
+
+    await helpers.get_test_channel().send("!character add test_character not a character code")
+    await helpers.wait_for(error_to_appear, or_fail)
@@ -0,0 +1,37 @@
+"""
+Tests associated with the !logs command.
+"""
+import pytest
+from . import helpers
+from dof_discord_bot.src import strings
+from dof_discord_bot.src.logger import Log
+
+
+@helpers.threaded_async
+async def test_returns_recent_logs():
+    """
+    Calling the command with a level should result in a session displaying the most recent records of that level.
+    """
+    Log.warning("Warning record logged by the !logs command test")
+
+    async def logs_to_appear():
+        """
+        Make sure that the bot answers the command and the logs session is displayed.
+        """
+        message = helpers.get_test_channel().last_message
+
+        if message and message.author.name == "DofDevBotApplication":
+            assert message.embeds[0].author.name == strings.Info.logs_title.format("WARNING")
+            assert "Warning record logged by the !logs command test" in message.embeds[0].description
+            return True
+
+        Log.debug("Waiting for the response to the !logs command to appear")
+
+    def or_fail():
+        """
+        Otherwise, fail the test.
+        """
+        pytest.fail("Timed out waiting for response to the !logs command")
+
+    await helpers.get_test_channel().send("!logs warning 5")
+    await helpers.wait_for(logs_to_appear, or_fail)
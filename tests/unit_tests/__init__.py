@@ -0,0 +1,3 @@
+"""
+Unit tests are used to test the bot's building blocks directly, without connecting to discord (so no tokens are needed).
+"""
@@ -0,0 +1,43 @@
+"""
+Configuration module containing pytest-specific hooks.
+"""
+import os
+import sys
+import asyncio
+import logging
+import pytest
+from _pytest.config import Config as PyTestConfig
+
+# Make sure dof_discord_bot package can be found and overrides any installed versions, the token is never used
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+os.environ.setdefault("DOF_TOKEN", "testing")
+from dof_discord_bot.src.logger import Log  # noqa
+from dof_discord_bot.src import logger  # noqa
+
+LOG_DIR = os.path.join(os.path.dirname(__file__), "..", "log")
+
+
+def pytest_configure(config: PyTestConfig):
+    """
+    Configuration hook which redirects all logging into the tests-specific log folder.
+
+    Accesses the private method of `logger` to avoid repeating the code.
+    """
+    for file_name in os.listdir(LOG_DIR):
+        if file_name.endswith(".log"):
+            os.remove(os.path.join(LOG_DIR, file_name))
+
+    # noinspection PyProtectedMember
+    logger._configure(log_directory=LOG_DIR)
+    Log._logger = logging.getLogger("dof-discord-bot")
+    Log.info("Pytest configuration hook finished successfully")
+
+
+@pytest.fixture
+def loop() -> asyncio.AbstractEventLoop:
+    """
+    Fixture providing a new event loop, closed after the test.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
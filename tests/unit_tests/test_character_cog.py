@@ -0,0 +1,85 @@
+"""
+Tests associated with the character collections of the character cog.
+"""
+import asyncio
+import pytest
+from dof_discord_bot.src.characters import BodyProperties
+from dof_discord_bot.src.cogs import character
+
+_BODY_PROPERTIES = BodyProperties(4, 25.0, 0.5, 0.5, bytes(range(32)))
+
+
+@pytest.fixture
+def stored_character():
+    """
+    Store a character (as if it was added with the !character add command), removing it afterwards.
+    """
+    character.STORED_CHARACTERS["olek_the_young"] = ("custom", _BODY_PROPERTIES)
+    yield "olek_the_young"
+    del character.STORED_CHARACTERS["olek_the_young"]
+    character.update_characters()
+
+
+def test_build_leaves_collections_unchanged(stored_character):
+    """
+    Building the collections shouldn't modify the current ones, so that it can be done in the background.
+    """
+    version = character.CHARACTERS_VERSION
+    catalogue = character.build_characters(*character.character_sources())
+
+    assert catalogue.characters[stored_character].body_properties == _BODY_PROPERTIES
+    assert catalogue.index.resolve("olek_the_yo") == stored_character
+    assert stored_character not in character.CHARACTERS
+    assert character.CHARACTERS_VERSION == version
+
+
+def test_rebuild_swaps_collections(loop, stored_character):
+    """
+    Rebuilding the collections in an executor should make the stored character available, and clear the derived values.
+    """
+    character.EXPORTS[None] = b"{}"
+    loop.run_until_complete(character.rebuild_characters(loop))
+
+    assert character.find_character("olek_the_yo").name == stored_character
+    assert stored_character in character.CUSTOM_CHARACTERS
+    assert any("olek_the_young" in line for line in character.CUSTOM_CHARACTERS_SPLIT)
+    assert not character.EXPORTS
+
+
+def test_rebuild_retries_after_concurrent_change(loop, stored_character):
+    """
+    If the characters change while the collections are being built, they should be built again from the latest sources.
+    """
+    async def rebuild():
+        first = loop.create_task(character.rebuild_characters(loop))
+        await asyncio.sleep(0)
+
+        # Simulates another character being added in the meantime
+        character.STORED_CHARACTERS["olek_the_ancient"] = ("custom", _BODY_PROPERTIES)
+        second = loop.create_task(character.rebuild_characters(loop))
+        await asyncio.gather(first, second)
+
+    try:
+        loop.run_until_complete(rebuild())
+        assert stored_character in character.CHARACTERS
+        assert "olek_the_ancient" in character.CHARACTERS
+    finally:
+        del character.STORED_CHARACTERS["olek_the_ancient"]
+
+
+def test_strings_update_rebuilds_in_background(loop, stored_character):
+    """
+    Updating the strings from within the event loop shouldn't rebuild the collections on the event loop, but in the
+    background - the new collections are swapped once they are built.
+    """
+    async def update():
+        version = character.CHARACTERS_VERSION
+        character.update_characters()
+        assert character.CHARACTERS_VERSION == version
+
+        # noinspection PyProtectedMember
+        await asyncio.gather(*character._REBUILDS)
+        assert character.CHARACTERS_VERSION > version
+
+    loop.run_until_complete(update())
+    assert stored_character in character.CHARACTERS
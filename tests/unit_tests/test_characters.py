@@ -0,0 +1,106 @@
+"""
+Tests associated with the character codes and the character name lookups.
+"""
+import pytest
+from dof_discord_bot.src.characters import NameIndex, BodyProperties, CharacterError, normalise_name
+
+_NAMES = ("rhagaea", "olek_the_old", "olek_the_young", "caladog", "derthert", "garios", "gareth")
+
+
+@pytest.fixture(scope="module")
+def index() -> NameIndex:
+    """
+    Fixture providing the index of a handful of names.
+    """
+    return NameIndex(_NAMES)
+
+
+def test_normalise_name():
+    """
+    Names should be lowercase, with the words separated by single underscores.
+    """
+    assert normalise_name("  Olek  the_Old ") == "olek_the_old"
+
+
+def test_resolves_exact_names(index):
+    """
+    Names should be resolved regardless of their formatting.
+    """
+    assert index.resolve("Olek the Old") == "olek_the_old"
+    assert "RHAGAEA" in index
+    assert len(index) == len(_NAMES)
+
+
+def test_resolves_unique_prefixes(index):
+    """
+    A prefix of a single name (or of any of its later words) should resolve to that name.
+    """
+    assert index.resolve("rhag") == "rhagaea"
+    assert index.resolve("young") == "olek_the_young"
+
+
+def test_ambiguous_prefixes(index):
+    """
+    A prefix of more than one name shouldn't resolve, but it should complete to all matching names.
+    """
+    assert index.resolve("olek") is None
+    assert index.resolve("gar") is None
+    assert index.complete("olek") == ["olek_the_old", "olek_the_young"]
+    assert index.complete("gar", limit=1) == ["gareth"]
+
+
+def test_suggests_names_with_typos(index):
+    """
+    Names a typo (a removed, replaced, added or swapped character) away from the query should be suggested.
+    """
+    assert index.suggest("rhagea")[0] == "rhagaea"
+    assert index.suggest("caladoq")[0] == "caladog"
+    assert index.suggest("derthertt")[0] == "derthert"
+    assert index.suggest("drethert")[0] == "derthert"
+
+
+def test_doesnt_suggest_different_names(index):
+    """
+    Names too different from the query shouldn't be suggested.
+    """
+    assert index.suggest("xyzzy") == []
+    assert index.suggest("") == []
+
+
+def test_parses_body_properties():
+    """
+    The character code should be parsed into its values, and formatted back into the same code.
+    """
+    code = '<BodyProperties version="4" age="43" weight="0.5" build="0.25" key="0000AC0E50FC3004" />'
+    body_properties = BodyProperties.parse(code)
+
+    assert (body_properties.version, body_properties.age, body_properties.weight, body_properties.build) == \
+        (4, 43.0, 0.5, 0.25)
+    assert body_properties.key == bytes.fromhex("0000AC0E50FC3004")
+    assert str(body_properties) == code
+    assert BodyProperties.parse(str(body_properties)) == body_properties
+
+
+def test_parses_body_properties_with_different_formatting():
+    """
+    Extra whitespace, different order of the attributes and a lowercase key should be accepted.
+    """
+    code = '  <BodyProperties  key="0000ac0e"   build="0.5" weight="0.5" age="25.5" version="4"/>\n'
+    assert str(BodyProperties.parse(code)) == \
+        '<BodyProperties version="4" age="25.5" weight="0.5" build="0.5" key="0000AC0E" />'
+
+
+@pytest.mark.parametrize("code", (
+    "",
+    "not a code",
+    '<BodyProperties version="4" age="43" weight="0.5" build="0.5" />',
+    '<BodyProperties version="4" age="old" weight="0.5" build="0.5" key="0000" />',
+    '<BodyProperties version="4" age="43" weight="0.5" build="0.5" key="XYZ" />',
+    '<BodyProperties version="4" age="43" weight="0.5" build="0.5" key="0000" /> trailing',
+))
+def test_rejects_invalid_body_properties(code):
+    """
+    Malformed codes should be rejected with the character error.
+    """
+    with pytest.raises(CharacterError):
+        BodyProperties.parse(code)
@@ -0,0 +1,63 @@
+"""
+Tests associated with the index of the character faces.
+"""
+from dof_discord_bot.src.characters import BodyProperties
+from dof_discord_bot.src.faces import FaceIndex
+
+
+def _face(key: str) -> BodyProperties:
+    """
+    Helper function used to create a character code with the given (hex) key.
+    """
+    return BodyProperties(4, 25.0, 0.5, 0.5, bytes.fromhex(key))
+
+
+_FACES = {
+    "same": _face("1234"),
+    "one_nibble": _face("1235"),
+    "two_nibbles": _face("2235"),
+    "far": _face("FFFF"),
+}
+
+
+def test_orders_by_nibble_distance():
+    """
+    The faces should be ordered by the sum of the absolute nibble differences, most similar first.
+    """
+    assert FaceIndex(_FACES).similar(_face("1234")) == \
+        [("same", 0), ("one_nibble", 1), ("two_nibbles", 2), ("far", 14 + 13 + 12 + 11)]
+
+
+def test_excludes_names():
+    """
+    Excluded faces should be skipped, still returning up to the limit of the other faces.
+    """
+    assert FaceIndex(_FACES).similar(_face("1234"), limit=2, exclude={"same"}) == \
+        [("one_nibble", 1), ("two_nibbles", 2)]
+
+
+def test_limit_larger_than_index():
+    """
+    A limit larger than the number of the faces should return all faces, and a limit of zero should return none.
+    """
+    index = FaceIndex(_FACES)
+    assert len(index.similar(_face("1234"), limit=10)) == len(_FACES)
+    assert index.similar(_face("1234"), limit=0) == []
+
+
+def test_keys_of_different_lengths():
+    """
+    Shorter keys should be padded with zeros, and longer keys truncated to the widest indexed key.
+    """
+    index = FaceIndex({"short": _face("12"), "long": _face("1234")})
+    assert index.similar(_face("1200")) == [("short", 0), ("long", 7)]
+    assert index.similar(_face("123400FF")) == [("long", 0), ("short", 7)]
+
+
+def test_empty_index():
+    """
+    An empty index shouldn't find any faces.
+    """
+    index = FaceIndex(dict())
+    assert len(index) == 0
+    assert index.similar(_face("1234")) == []
@@ -0,0 +1,73 @@
+"""
+Tests associated with the logger, and the caller resolution of the verbose records in particular.
+"""
+import os
+import json
+import pytest
+from dof_discord_bot.src import logger
+from dof_discord_bot.src.constants import RES_DIR
+from dof_discord_bot.src.logger import Log
+from dof_discord_bot.res import verbose_file_handler
+from .conftest import LOG_DIR
+
+
+@pytest.fixture
+def configure(tmp_path):
+    """
+    Return a function configuring the logging with the verbose handler resolving the callers in the given mode, and
+    logging into a temporary folder. The default configuration is restored afterwards.
+    """
+    def configure(caller_resolution: str, queued: bool) -> str:
+        with open(os.path.join(RES_DIR, "config.json")) as f:
+            config = json.load(f)
+        config["handlers"]["verbose"]["caller_resolution"] = caller_resolution
+
+        config_file_path = str(tmp_path / "config.json")
+        with open(config_file_path, "w") as f:
+            json.dump(config, f)
+
+        # noinspection PyProtectedMember
+        logger._configure(config_file_path=config_file_path, log_directory=str(tmp_path), queued=queued)
+        return str(tmp_path / "verbose.log")
+
+    yield configure
+
+    # noinspection PyProtectedMember
+    logger._configure(log_directory=LOG_DIR, queued=False)
+
+
+def _verbose_record(path: str, message: str) -> list:
+    """
+    Helper function used to find the verbose record with the given message, returns its (stripped) columns.
+    """
+    with open(path, encoding="utf8") as f:
+        line = next(line for line in f if line.rstrip().endswith(message))
+    return [column.strip() for column in line.split("|")]
+
+
+@pytest.mark.parametrize("queued", (False, True))
+def test_frame_resolution_finds_the_caller(configure, queued):
+    """
+    Resolving the caller by walking the frames should point at the `Log` call, whether the logging is queued or not.
+    """
+    path = configure(verbose_file_handler.FRAME_RESOLUTION, queued)
+    Log.info("Frame resolution test record")
+    Log.flush()
+
+    columns = _verbose_record(path, "Frame resolution test record")
+    assert columns[2] == os.path.join("..", "tests", "unit_tests", "test_logger.py")
+    assert columns[3].split()[0] == "test_frame_resolution_finds_the_caller"
+
+
+@pytest.mark.skipif(not verbose_file_handler.STACKLEVEL_SUPPORTED, reason="Requires Python 3.8+")
+@pytest.mark.parametrize("queued", (False, True))
+def test_record_resolution_finds_the_caller(configure, queued):
+    """
+    Resolving the caller with the logging module's `stacklevel` should point at the `Log` call as well.
+    """
+    path = configure(verbose_file_handler.RECORD_RESOLUTION, queued)
+    Log.info("Record resolution test record")
+    Log.flush()
+
+    columns = _verbose_record(path, "Record resolution test record")
+    assert columns[3].split()[0] == "test_record_resolution_finds_the_caller"
@@ -0,0 +1,97 @@
+"""
+Tests associated with the page sources, producing the session pages on demand.
+"""
+import pytest
+from dof_discord_bot.src.utils import PageSource
+
+
+class _PageSource(PageSource):
+    """
+    Source of the given number of pages, recording how many pages were produced.
+    """
+
+    def __init__(self, count: int, estimated_count: int):
+        super().__init__(estimated_count)
+        self.count = count
+        self.produced = 0
+
+    async def produce(self):
+        for page_number in range(self.count):
+            self.produced += 1
+            yield f"Page {page_number}"
+
+
+def test_produces_first_page_only(loop):
+    """
+    Fetching the first page should only produce the first page (and one more, if only one page was estimated).
+    """
+    source = _PageSource(count=10, estimated_count=5)
+
+    assert loop.run_until_complete(source.fetch(0)) == 0
+    assert source.produced == 1
+    assert list(source) == ["Page 0"]
+    assert not source.exhausted and len(source) == 5
+
+
+def test_underestimated_count(loop):
+    """
+    Once the estimated number of pages is reached, the number of pages should grow with each produced page, until the
+    source is exhausted.
+    """
+    source = _PageSource(count=7, estimated_count=3)
+
+    # Reaching the estimate produces one more page, so there is always a next page until the source is exhausted
+    assert loop.run_until_complete(source.fetch(2)) == 2
+    assert source.produced == 4
+    assert len(source) == 5 and not source.exhausted
+    assert loop.run_until_complete(source.fetch(6)) == 6
+    assert len(source) == 8 and not source.exhausted
+    assert loop.run_until_complete(source.fetch(7)) == 6
+    assert len(source) == 7 and source.exhausted
+
+
+def test_overestimated_count(loop):
+    """
+    Fetching a page past the end should return the last page's number, and fix the number of pages.
+    """
+    source = _PageSource(count=2, estimated_count=5)
+
+    assert len(source) == 5
+    assert loop.run_until_complete(source.fetch(4)) == 1
+    assert len(source) == 2 and source.exhausted
+    assert source[1] == "Page 1"
+
+
+@pytest.mark.parametrize("count, estimated_count", ((7, 3), (2, 5), (4, 4), (1, 1)))
+def test_fetch_all(loop, count, estimated_count):
+    """
+    Fetching all pages should return the real last page's number, no matter the estimate, each page produced once.
+    """
+    source = _PageSource(count=count, estimated_count=estimated_count)
+    loop.run_until_complete(source.fetch(0))
+
+    assert loop.run_until_complete(source.fetch_all()) == count - 1
+    assert len(source) == count and source.exhausted
+    assert source.produced == count
+
+
+def test_empty_source(loop):
+    """
+    A source without any pages should be exhausted (and empty) once fetched.
+    """
+    source = _PageSource(count=0, estimated_count=1)
+
+    loop.run_until_complete(source.fetch(0))
+    assert source.exhausted
+    assert len(source) == 0 and not source
+
+
+def test_produce_must_be_implemented():
+    """
+    A source without the `produce` method shouldn't be created.
+    """
+    class _Source(PageSource):
+        pass
+
+    with pytest.raises(TypeError):
+        _Source()
@@ -0,0 +1,86 @@
+"""
+Tests associated with the line paginator.
+"""
+import random
+import pytest
+from discord.ext import commands
+from dof_discord_bot.src.utils import LinePaginator, Page
+
+
+def _lines(seed: int, count: int) -> list:
+    """
+    Helper function used to generate the lines of varying length.
+    """
+    generator = random.Random(seed)
+    return [str.join(" ", ("x" * generator.randint(1, 10) for _ in range(generator.randint(0, 20))))
+            for _ in range(count)]
+
+
+@pytest.mark.parametrize("prefix, suffix", (("```", "```"), ("", ""), (None, None)))
+@pytest.mark.parametrize("seed", range(5))
+def test_pages_match_discord_paginator(prefix, suffix, seed):
+    """
+    Without the lines limit, the pages should be the same as the ones of discord.py's paginator.
+    """
+    paginator = LinePaginator(prefix=prefix, suffix=suffix, max_size=500)
+    expected = commands.Paginator(prefix=prefix, suffix=suffix, max_size=500)
+    for line in _lines(seed, 200):
+        paginator.add_line(line)
+        expected.add_line(line)
+
+    assert paginator.pages == expected.pages
+
+
+def test_limits_lines():
+    """
+    Each page should have at most the maximum number of lines.
+    """
+    paginator = LinePaginator(prefix="", suffix="", max_lines=3)
+    for i in range(7):
+        paginator.add_line(str(i))
+
+    assert paginator.pages == ["\n0\n1\n2\n", "\n3\n4\n5\n", "\n6\n"]
+
+
+def test_adds_whole_pages():
+    """
+    Each added page should be closed, with the lines split between more pages only if they don't fit on one.
+    """
+    paginator = LinePaginator(prefix="", suffix="", max_lines=3)
+    paginator.add_page(Page("a", "b"))
+    paginator.add_page(Page("c", "d", "e", "f"))
+
+    assert paginator.pages == ["\na\nb\n", "\nc\nd\ne\n", "\nf\n"]
+
+
+def test_keeps_blocks_together():
+    """
+    Blocks which don't fit on the current page should be moved to the next page as a whole.
+    """
+    paginator = LinePaginator(prefix="", suffix="", max_lines=4)
+    paginator.add_block(Page("a", ""))
+    paginator.add_line("b")
+    paginator.add_block(Page("c", ""))
+    paginator.add_block(Page("d", "e", "f", "g", "h"))
+
+    assert paginator.pages == ["\na\n\nb\n", "\nc\n\n", "\nd\ne\nf\ng\n", "\nh\n"]
+
+
+def test_keeps_blocks_together_by_size():
+    """
+    Blocks should also be moved to the next page if they don't fit within the page size.
+    """
+    paginator = LinePaginator(prefix="", suffix="", max_size=10)
+    paginator.add_block(Page("aaa"))
+    paginator.add_block(Page("bbb", "c"))
+
+    assert paginator.pages == ["\naaa\n", "\nbbb\nc\n"]
+
+
+def test_rejects_oversized_lines():
+    """
+    Lines which can't fit on any page should be rejected.
+    """
+    paginator = LinePaginator(max_size=20)
+    with pytest.raises(RuntimeError):
+        paginator.add_line("x" * 20)
@@ -0,0 +1,88 @@
+"""
+Tests associated with the in-memory buffer of the most recent log records.
+"""
+import logging
+import pytest
+from dof_discord_bot.src import logger
+from dof_discord_bot.src.logger import Log, LogError
+from dof_discord_bot.res.ring_buffer_handler import _RingBufferHandler
+from .conftest import LOG_DIR
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    """
+    Helper function used to create a record of the given level, with the given message.
+    """
+    return logging.LogRecord("dof-discord-bot", level, __file__, 0, message, None, None)
+
+
+def test_keeps_most_recent_records():
+    """
+    Only up to the capacity of the most recent records should be kept, newest first.
+    """
+    handler = _RingBufferHandler(capacity=3)
+    for i in range(5):
+        handler.handle(_record(logging.INFO, f"Record {i}"))
+
+    assert handler.records() == ["Record 4", "Record 3", "Record 2"]
+
+
+def test_truncates_long_records():
+    """
+    Records longer than the maximum length should be truncated, with the truncation marked.
+    """
+    handler = _RingBufferHandler(max_length=10)
+    handler.handle(_record(logging.INFO, "x" * 10))
+    handler.handle(_record(logging.INFO, "x" * 11))
+
+    assert handler.records() == ["xxxxxxx...", "x" * 10]
+
+
+def test_filters_records_by_level_and_count():
+    """
+    Only the records of at least the given level should be returned, up to the given count.
+    """
+    handler = _RingBufferHandler()
+    for level in (logging.DEBUG, logging.ERROR, logging.INFO, logging.WARNING, logging.ERROR):
+        handler.handle(_record(level, logging.getLevelName(level)))
+
+    assert handler.records(logging.WARNING) == ["ERROR", "WARNING", "ERROR"]
+    assert handler.records(logging.WARNING, count=2) == ["ERROR", "WARNING"]
+    assert handler.records(logging.DEBUG, count=0) == []
+
+
+@pytest.fixture(params=(False, True), ids=("synchronous", "queued"))
+def queued(request) -> bool:
+    """
+    Fixture configuring the logging (synchronous or queued) into the tests-specific log folder, restoring the
+    synchronous logging afterwards.
+    """
+    # noinspection PyProtectedMember
+    logger._configure(log_directory=LOG_DIR, queued=request.param)
+    yield request.param
+
+    # noinspection PyProtectedMember
+    logger._configure(log_directory=LOG_DIR, queued=False)
+
+
+def test_recent_records(queued):
+    """
+    The recent records should be found through the logger, whether the logging is queued or not.
+    """
+    Log.warning("Recent warning record")
+    Log.debug("Recent debug record")
+    if queued:
+        # noinspection PyProtectedMember
+        logger._listener.queue.join()
+
+    records = Log.recent("warning", 1)
+    assert len(records) == 1 and "Recent warning record" in records[0]
+    assert "Recent debug record" in Log.recent("debug", 1)[0]
+
+
+def test_recent_rejects_unknown_level():
+    """
+    Unknown levels should be rejected with the log error.
+    """
+    with pytest.raises(LogError):
+        Log.recent("verbose")
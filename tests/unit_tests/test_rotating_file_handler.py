@@ -0,0 +1,88 @@
+"""
+Tests associated with the rotating file handler.
+"""
+import os
+import time
+import types
+import logging
+from dof_discord_bot.res import rotating_file_handler
+from dof_discord_bot.res.rotating_file_handler import _RotatingFileHandler
+
+
+def _record(message: str) -> logging.LogRecord:
+    """
+    Helper function used to create a record with the given message.
+    """
+    return logging.LogRecord("dof-discord-bot", logging.INFO, __file__, 0, message, None, None)
+
+
+def test_rotates_old_file_after_restart(tmp_path, monkeypatch):
+    """
+    The age of an existing file should be kept across the handler restarts (even if the file was written just before
+    the restart), so that a file older than the time cap is rotated straight away.
+    """
+    path = str(tmp_path / "a.log")
+    started = time.time() - 2 * 3600
+    monkeypatch.setattr(rotating_file_handler, "_time", types.SimpleNamespace(time=lambda: started,
+                                                                              strftime=time.strftime))
+    handler = _RotatingFileHandler(path, max_age=3600)
+    handler.close()
+    monkeypatch.undo()
+
+    # Written just before the restart, so the last modification time is recent
+    with open(path, "a") as f:
+        f.write("recent record\n")
+
+    handler = _RotatingFileHandler(path, max_age=3600)
+    try:
+        assert handler.shouldRollover(_record("new record"))
+
+        handler.doRollover()
+        assert not handler.shouldRollover(_record("new record"))
+    finally:
+        handler.close()
+
+
+def test_rotates_old_file_without_start_record(tmp_path):
+    """
+    The age of a file started without the start record should fall back to the file's modification time.
+    """
+    path = str(tmp_path / "a.log")
+    with open(path, "w") as f:
+        f.write("old record\n")
+    old = time.time() - 116 * 24 * 3600
+    os.utime(path, (old, old))
+
+    handler = _RotatingFileHandler(path, max_age=3600)
+    try:
+        assert handler.shouldRollover(_record("new record"))
+    finally:
+        handler.close()
+
+
+def test_keeps_new_file(tmp_path):
+    """
+    A new file (or one younger than the time cap) shouldn't be rotated.
+    """
+    handler = _RotatingFileHandler(str(tmp_path / "a.log"), max_age=3600)
+    try:
+        assert not handler.shouldRollover(_record("new record"))
+    finally:
+        handler.close()
+
+
+def test_rotates_by_size(tmp_path):
+    """
+    The file should be rotated once it reaches the size cap, and the rotated file should be renamed with a timestamp.
+    """
+    path = str(tmp_path / "a.log")
+    handler = _RotatingFileHandler(path, max_bytes=10)
+    try:
+        handler.emit(_record("a record longer than the size cap"))
+        assert handler.shouldRollover(_record("another record"))
+
+        handler.doRollover()
+        assert [name for name in os.listdir(str(tmp_path)) if name.startswith("a.log.")]
+        assert not handler.shouldRollover(_record("another record"))
+    finally:
+        handler.close()
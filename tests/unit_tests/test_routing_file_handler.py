@@ -0,0 +1,72 @@
+"""
+Tests associated with the level-routing file handler.
+"""
+import logging
+import pytest
+from dof_discord_bot.res.routing_file_handler import _LevelRoutingFileHandler
+
+
+def _record(level: int, message: str) -> logging.LogRecord:
+    """
+    Helper function used to create a record of the given level, with the given message.
+    """
+    return logging.LogRecord("dof-discord-bot", level, __file__, 0, message, None, None)
+
+
+@pytest.fixture
+def handler(tmp_path) -> _LevelRoutingFileHandler:
+    """
+    Fixture providing the handler writing the debug, info and error records (but not the warnings) into separate files.
+    """
+    handler = _LevelRoutingFileHandler({"DEBUG": str(tmp_path / "debug.log"), "info": str(tmp_path / "info.log"),
+                                        logging.ERROR: str(tmp_path / "error.log")})
+    handler.setFormatter(logging.Formatter("{levelname} {message}", style="{"))
+    yield handler
+    handler.close()
+
+
+def test_routes_records_to_level_files(tmp_path, handler):
+    """
+    Each record should only be written into the file of its level.
+    """
+    for level in (logging.DEBUG, logging.INFO, logging.ERROR):
+        handler.handle(_record(level, "Routed record"))
+    handler.flush()
+
+    assert (tmp_path / "debug.log").read_text() == "DEBUG Routed record\n"
+    assert (tmp_path / "info.log").read_text() == "INFO Routed record\n"
+    assert (tmp_path / "error.log").read_text() == "ERROR Routed record\n"
+
+
+def test_drops_records_of_levels_without_file(tmp_path, handler):
+    """
+    Records of the levels without an associated file shouldn't be written anywhere.
+    """
+    handler.handle(_record(logging.WARNING, "Dropped record"))
+    handler.flush()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["debug.log", "error.log", "info.log"]
+    assert all(not path.read_text() for path in tmp_path.iterdir())
+
+
+def test_flushes_and_closes_all_files(handler):
+    """
+    Flushing and closing the handler should flush and close each file's handler.
+    """
+    flushed = list()
+    for level, target in handler.targets.items():
+        target.flush = lambda level=level, flush=target.flush: (flushed.append(level), flush())
+
+    handler.flush()
+    assert sorted(flushed) == [logging.DEBUG, logging.INFO, logging.ERROR]
+
+    handler.close()
+    assert all(target.stream is None for target in handler.targets.values())
+
+
+def test_rejects_unknown_levels(tmp_path):
+    """
+    Files of unknown levels should be rejected when the handler is created.
+    """
+    with pytest.raises(ValueError):
+        _LevelRoutingFileHandler({"VERBOSE": str(tmp_path / "verbose.log")})
@@ -0,0 +1,281 @@
+"""
+Tests associated with the interactive sessions.
+"""
+import time
+import types
+import asyncio
+import discord
+from dof_discord_bot.src.store import SessionDatabase
+from dof_discord_bot.src.utils import Session, SessionManager, SessionScheduler, PageSource
+
+NEXT = "➡"
+PREVIOUS = "⬅"
+LAST = "⏭"
+
+
+class _Message:
+    """
+    Stand-in for a session message, recording the displayed pages and the removed reactions.
+    """
+
+    def __init__(self, channel: "_Channel", message_id: int, embed: discord.Embed = None):
+        self.channel = channel
+        self.id = message_id
+        self.embed = embed
+        self.edits = list()
+        self.removed = list()
+        self.deleted = False
+        self.edit_delay = 0
+
+    async def edit(self, embed: discord.Embed):
+        await asyncio.sleep(self.edit_delay)
+        self.edits.append(embed.description)
+        self.embed = embed
+
+    async def add_reaction(self, emoji: str):
+        pass
+
+    async def remove_reaction(self, emoji: discord.PartialEmoji, user: discord.abc.Snowflake):
+        self.removed.append(str(emoji))
+
+    async def delete(self):
+        self.deleted = True
+
+
+class _Channel:
+    """
+    Stand-in for a channel (in a server, unless specified otherwise), keeping the sent messages.
+    """
+
+    def __init__(self, direct: bool = False):
+        self.id = 1
+        self.guild = None if direct else types.SimpleNamespace(get_member=lambda _: None)
+        self.messages = dict()
+
+    async def send(self, embed: discord.Embed) -> _Message:
+        message = _Message(self, 100 + len(self.messages), embed)
+        self.messages[message.id] = message
+        return message
+
+    async def fetch_message(self, message_id: int) -> _Message:
+        return self.messages[message_id]
+
+
+class _Bot:
+    """
+    Stand-in for the bot, owning the sessions registry and the scheduler.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, channel: _Channel, database: SessionDatabase = None):
+        self.loop = loop
+        self.channel = channel
+        self.sessions = SessionManager(database=database)
+        self.scheduler = SessionScheduler(loop)
+
+    def get_locale(self, _) -> str:
+        return "en"
+
+    def get_channel(self, _) -> _Channel:
+        return self.channel
+
+    def get_user(self, _):
+        return None
+
+
+class _Session(Session):
+    """
+    Session displaying the given number of pages.
+    """
+
+    def __init__(self, ctx, title: str, icon: str):
+        super().__init__(ctx, title, icon)
+        self.page_count = ctx.page_count
+
+    async def build_pages(self):
+        self.pages = [f"Page {page_number}" for page_number in range(self.page_count)]
+
+
+class _PageSource(PageSource):
+    """
+    Source of the given number of pages.
+    """
+
+    def __init__(self, count: int, estimated_count: int):
+        super().__init__(estimated_count)
+        self.count = count
+
+    async def produce(self):
+        for page_number in range(self.count):
+            yield f"Page {page_number}"
+
+
+class _SourceSession(_Session):
+    """
+    Session displaying the given number of pages, produced on demand (with the number of pages underestimated).
+    """
+
+    async def build_pages(self):
+        self.pages = _PageSource(self.page_count, estimated_count=3)
+
+
+def _start(loop: asyncio.AbstractEventLoop, bot: _Bot, author_id: int = 1, page_count: int = 5,
+           session_class: type = _Session, title: str = "Title") -> _Session:
+    """
+    Start a session of the given author, in the bot's channel.
+    """
+    ctx = types.SimpleNamespace(bot=bot, author=discord.Object(author_id), channel=bot.channel,
+                                guild=bot.channel.guild, page_count=page_count)
+    return loop.run_until_complete(session_class.start(ctx, title, "Icon"))
+
+
+def _settle(loop: asyncio.AbstractEventLoop):
+    """
+    Let the sessions handle all pending actions.
+    """
+    loop.run_until_complete(asyncio.sleep(0.05))
+
+
+def test_restored_session_handles_events_by_message_id(loop, tmp_path):
+    """
+    A restored session should handle the events routed by its message id, even though the restored message (fetched
+    rather than received) is never cached, and its author is only known by the id.
+    """
+    database = SessionDatabase(str(tmp_path / "sessions.db"))
+    channel = _Channel()
+    message = loop.run_until_complete(channel.send(discord.Embed()))
+    database.save(message.id, channel.id, 1, _Session.type_name(), "Title", "Icon", "en",
+                  ["First page", "Second page"], 0, time.time() + 60)
+
+    bot = _Bot(loop, channel, database)
+    loop.run_until_complete(bot.sessions.restore(bot))
+    session = bot.sessions.get(message.id)
+    assert session is not None
+
+    loop.run_until_complete(bot.sessions.on_reaction_add(message.id, discord.PartialEmoji(name=NEXT),
+                                                         discord.Object(1)))
+    _settle(loop)
+    assert message.edits == ["Second page"]
+    assert message.removed == [NEXT]
+
+    loop.run_until_complete(bot.sessions.on_message_delete(message.id))
+    assert bot.sessions.get(message.id) is None
+    bot.scheduler.close()
+    database.close()
+
+
+def test_last_page_of_page_source(loop):
+    """
+    Requesting the last page should produce all pages and display the real last page, rather than the estimated one.
+    """
+    bot = _Bot(loop, _Channel())
+    session = _start(loop, bot, page_count=7, session_class=_SourceSession)
+    assert session.message.embed.footer.text == "Page 1 / ~3"
+
+    loop.run_until_complete(bot.sessions.on_reaction_add(session.message.id, LAST, discord.Object(1)))
+    _settle(loop)
+    assert session.message.edits == ["Page 6"]
+    assert session.message.embed.footer.text == "Page 7 / 7"
+    assert session.is_last_page
+    bot.scheduler.close()
+
+
+def test_burst_of_page_changes_is_coalesced(loop):
+    """
+    A burst of page changes should result in a single edit (to the last requested page), and a single removal of
+    each reaction.
+    """
+    bot = _Bot(loop, _Channel())
+    session = _start(loop, bot)
+    user = discord.Object(1)
+
+    async def burst():
+        await asyncio.gather(*(bot.sessions.on_reaction_add(session.message.id, emoji, user)
+                               for emoji in (NEXT, NEXT, PREVIOUS, NEXT, NEXT)))
+
+    loop.run_until_complete(burst())
+    _settle(loop)
+    assert session.message.edits == ["Page 3"]
+    assert sorted(session.message.removed) == sorted((NEXT, PREVIOUS))
+    assert session.current_page == session.requested_page == 3
+    bot.scheduler.close()
+
+
+def test_pages_are_displayed_in_order(loop):
+    """
+    The page changes requested while a page is being displayed should be handled once it's displayed.
+    """
+    bot = _Bot(loop, _Channel())
+    session = _start(loop, bot)
+    session.message.edit_delay = 0.02
+    user = discord.Object(1)
+
+    loop.run_until_complete(bot.sessions.on_reaction_add(session.message.id, NEXT, user))
+    loop.run_until_complete(asyncio.sleep(0.01))
+    loop.run_until_complete(bot.sessions.on_reaction_add(session.message.id, NEXT, user))
+    loop.run_until_complete(bot.sessions.on_reaction_add(session.message.id, NEXT, user))
+    _settle(loop)
+    assert session.message.edits == ["Page 1", "Page 3"]
+    bot.scheduler.close()
+
+
+def test_stop_cancels_pending_actions(loop):
+    """
+    Stopping the session while a page is being displayed should cancel the pending actions.
+    """
+    bot = _Bot(loop, _Channel())
+    session = _start(loop, bot)
+    session.message.edit_delay = 1
+    user = discord.Object(1)
+
+    loop.run_until_complete(bot.sessions.on_reaction_add(session.message.id, NEXT, user))
+    loop.run_until_complete(asyncio.sleep(0.01))
+    task = session._actions_task
+    assert task is not None
+
+    loop.run_until_complete(session.stop())
+    _settle(loop)
+    assert task.cancelled()
+    assert session._actions_task is None
+    assert session.message.edits == [] and session.message.removed == []
+    assert session.message.deleted
+    assert bot.sessions.get(session.message.id) is None and len(bot.scheduler) == 0
+    bot.scheduler.close()
+
+
+def test_direct_messages_session(loop):
+    """
+    In the direct messages, the reactions can't be removed by the bot - removing a reaction should be handled the
+    same way as adding it instead.
+    """
+    bot = _Bot(loop, _Channel(direct=True))
+    session = _start(loop, bot)
+    user = discord.Object(1)
+    assert not session.remove_reactions
+
+    loop.run_until_complete(bot.sessions.on_reaction_add(session.message.id, NEXT, user))
+    _settle(loop)
+    loop.run_until_complete(bot.sessions.on_reaction_remove(session.message.id, NEXT, user))
+    _settle(loop)
+    assert session.message.edits == ["Page 1", "Page 2"]
+    assert session.message.removed == []
+    bot.scheduler.close()
+
+
+def test_sessions_share_page_embeds(loop, monkeypatch):
+    """
+    Sessions displaying the same pages should share the embeds, each serialised only once.
+    """
+    serialised = list()
+    to_dict = discord.Embed.to_dict
+    monkeypatch.setattr(discord.Embed, "to_dict", lambda embed: serialised.append(embed) or to_dict(embed))
+
+    bot = _Bot(loop, _Channel())
+    first = _start(loop, bot, author_id=1, title="Shared")
+    second = _start(loop, bot, author_id=2, title="Shared")
+    assert first.message is not second.message
+    assert first.message.embed is second.message.embed
+
+    first_dict, second_dict = first.message.embed.to_dict(), second.message.embed.to_dict()
+    assert first_dict is second_dict
+    assert serialised == [first.message.embed]
+    bot.scheduler.close()
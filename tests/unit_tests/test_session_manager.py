@@ -0,0 +1,136 @@
+"""
+Tests associated with the registry of the active sessions.
+"""
+import types
+from dof_discord_bot.src.store import SessionDatabase
+from dof_discord_bot.src.utils import SessionManager
+
+
+class _Session:
+    """
+    Stand-in for a session displayed in a message, recording the routed events and counting how many times it was
+    stopped.
+    """
+
+    def __init__(self, message_id: int, author_id: int):
+        self.message = types.SimpleNamespace(id=message_id)
+        self.destination = types.SimpleNamespace(id=1)
+        self.author = types.SimpleNamespace(id=author_id)
+        self.title = "Title"
+        self.icon = "Icon"
+        self.locale = "en"
+        self.pages = ["First page", "Second page"]
+        self.current_page = 0
+        self.deadline = 0.0
+        self.stopped = 0
+        self.events = list()
+
+    @staticmethod
+    def type_name() -> str:
+        return "_Session"
+
+    async def stop(self):
+        self.stopped += 1
+
+    async def on_reaction_add(self, emoji: str, user):
+        self.events.append(("add", emoji))
+
+    async def on_reaction_remove(self, emoji: str, user):
+        self.events.append(("remove", emoji))
+
+    async def on_message_delete(self):
+        self.events.append(("delete", None))
+
+
+def _route_events(loop, manager: SessionManager, message_id: int):
+    """
+    Helper function used to route each type of the events of the given message.
+    """
+    user = types.SimpleNamespace(id=1)
+    loop.run_until_complete(manager.on_reaction_add(message_id, "➡", user))
+    loop.run_until_complete(manager.on_reaction_remove(message_id, "⬅", user))
+    loop.run_until_complete(manager.on_message_delete(message_id))
+
+
+def test_replaces_previous_session_of_author(loop, tmp_path):
+    """
+    Registering a new session should stop the author's previous session of the same type, and delete it from the
+    database.
+    """
+    database = SessionDatabase(str(tmp_path / "sessions.db"))
+    manager = SessionManager(database=database)
+    first, second = _Session(1, author_id=1), _Session(2, author_id=1)
+
+    loop.run_until_complete(manager.register(first))
+    loop.run_until_complete(manager.register(second))
+
+    assert first.stopped == 1
+    assert manager.get(1) is None and manager.get(2) is second
+    assert [values[0] for values in loop.run_until_complete(database.take())] == [2]
+    database.close()
+
+
+def test_evicts_least_recently_used_sessions(loop, tmp_path):
+    """
+    Sessions above the limit should be stopped (least recently used first), and deleted from the database.
+    """
+    database = SessionDatabase(str(tmp_path / "sessions.db"))
+    manager = SessionManager(max_sessions=3, database=database)
+    sessions = [_Session(message_id, author_id=message_id) for message_id in range(1, 6)]
+
+    for session in sessions:
+        loop.run_until_complete(manager.register(session))
+
+    assert [session.stopped for session in sessions] == [1, 1, 0, 0, 0]
+    assert len(manager) == 3
+    assert sorted(values[0] for values in loop.run_until_complete(database.take())) == [3, 4, 5]
+    database.close()
+
+
+def test_routes_events_by_message_id(loop):
+    """
+    The events should only be routed to the session displayed in the message, and the events of any other messages
+    ignored.
+    """
+    manager = SessionManager()
+    first, second = _Session(1, author_id=1), _Session(2, author_id=2)
+    loop.run_until_complete(manager.register(first))
+    loop.run_until_complete(manager.register(second))
+
+    _route_events(loop, manager, 1)
+    _route_events(loop, manager, 3)
+
+    assert first.events == [("add", "➡"), ("remove", "⬅"), ("delete", None)]
+    assert second.events == []
+
+
+def test_unregistered_session_receives_no_events(loop):
+    """
+    Once the session is unregistered (as done when it's stopped), its events should no longer be routed to it.
+    """
+    manager = SessionManager()
+    session = _Session(1, author_id=1)
+    loop.run_until_complete(manager.register(session))
+    manager.unregister(session)
+
+    _route_events(loop, manager, 1)
+
+    assert session.events == []
+    assert manager.get(1) is None and len(manager) == 0
+
+
+def test_replaced_and_evicted_sessions_receive_no_events(loop):
+    """
+    The sessions stopped by the registry (replaced by a newer session, or evicted above the limit) should no longer
+    receive any events.
+    """
+    manager = SessionManager(max_sessions=2)
+    replaced, evicted = _Session(1, author_id=1), _Session(2, author_id=2)
+    for session in (replaced, evicted, _Session(3, author_id=1), _Session(4, author_id=3)):
+        loop.run_until_complete(manager.register(session))
+
+    _route_events(loop, manager, 1)
+    _route_events(loop, manager, 2)
+
+    assert replaced.stopped == evicted.stopped == 1
+    assert replaced.events == evicted.events == []
@@ -0,0 +1,123 @@
+"""
+Tests associated with the scheduler of the session timeouts.
+"""
+import asyncio
+import pytest
+from dof_discord_bot.src.utils import SessionScheduler
+
+
+class _Session:
+    """
+    Stand-in for a session, counting how many times it was stopped.
+    """
+
+    def __init__(self):
+        self.author = None
+        self.stopped = 0
+
+    async def stop(self):
+        self.stopped += 1
+
+
+@pytest.fixture
+def scheduler(loop) -> SessionScheduler:
+    """
+    Fixture providing a scheduler running in the test's event loop, closed after the test.
+    """
+    scheduler = SessionScheduler(loop)
+    yield scheduler
+    scheduler.close()
+
+
+def test_stops_session_after_timeout(loop, scheduler):
+    """
+    The session should be stopped (once) after its timeout, and not before.
+    """
+    session = _Session()
+    scheduler.schedule(session, 0.05)
+
+    loop.run_until_complete(asyncio.sleep(0.01))
+    assert session.stopped == 0
+    loop.run_until_complete(asyncio.sleep(0.1))
+    assert session.stopped == 1
+    assert len(scheduler) == 0
+
+
+def test_extended_timeout(loop, scheduler):
+    """
+    Extending the timeout should keep the session running until the new deadline.
+    """
+    session = _Session()
+    scheduler.schedule(session, 0.02)
+    scheduler.schedule(session, 0.15)
+
+    loop.run_until_complete(asyncio.sleep(0.08))
+    assert session.stopped == 0
+    loop.run_until_complete(asyncio.sleep(0.15))
+    assert session.stopped == 1
+
+
+def test_shortened_timeout(loop, scheduler):
+    """
+    Shortening the timeout should stop the session at the new (earlier) deadline.
+    """
+    session = _Session()
+    scheduler.schedule(session, 10)
+    scheduler.schedule(session, 0.02)
+
+    loop.run_until_complete(asyncio.sleep(0.1))
+    assert session.stopped == 1
+    assert len(scheduler) == 0
+
+
+def test_cancelled_timeout(loop, scheduler):
+    """
+    A cancelled session should never be stopped.
+    """
+    session = _Session()
+    scheduler.schedule(session, 0.02)
+    scheduler.cancel(session)
+
+    loop.run_until_complete(asyncio.sleep(0.1))
+    assert session.stopped == 0
+    assert len(scheduler) == 0
+
+
+def test_rescheduled_after_cancel(loop, scheduler):
+    """
+    A session scheduled again after being cancelled should only be stopped (once) at the new deadline.
+    """
+    session = _Session()
+    scheduler.schedule(session, 0.02)
+    scheduler.cancel(session)
+    scheduler.schedule(session, 0.15)
+
+    loop.run_until_complete(asyncio.sleep(0.08))
+    assert session.stopped == 0
+    loop.run_until_complete(asyncio.sleep(0.15))
+    assert session.stopped == 1
+
+
+def test_expires_sessions_together(loop, scheduler, monkeypatch):
+    """
+    All sessions past their deadlines should be stopped together, leaving the other sessions scheduled.
+    """
+    batches = list()
+    stop = SessionScheduler._stop
+
+    async def record_stop(sessions):
+        batches.append(len(sessions))
+        await stop(sessions)
+
+    monkeypatch.setattr(SessionScheduler, "_stop", staticmethod(record_stop))
+    sessions = [_Session() for _ in range(3)]
+    later = _Session()
+    for session in sessions:
+        scheduler.schedule(session, 0.02)
+    scheduler.schedule(later, 10)
+
+    loop.run_until_complete(asyncio.sleep(0.1))
+    assert [session.stopped for session in sessions] == [1, 1, 1]
+    assert later.stopped == 0
+    assert batches == [3]
+    assert len(scheduler) == 1
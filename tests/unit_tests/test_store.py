@@ -0,0 +1,29 @@
+"""
+Tests associated with the local databases.
+"""
+from dof_discord_bot.src.store import LocaleDatabase
+
+
+def test_locales_are_kept_after_reopening(loop, tmp_path):
+    """
+    The selected locales should be read back after the database is reopened, with the latest selection of each target.
+    """
+    path = str(tmp_path / "locales.db")
+
+    async def select():
+        database = LocaleDatabase(path)
+        database.save(1, "de")
+        database.save(2, "en")
+        database.save(1, "pt-br")
+        await database.locales()
+        database.close()
+
+    async def read() -> dict:
+        database = LocaleDatabase(path)
+        try:
+            return await database.locales()
+        finally:
+            database.close()
+
+    loop.run_until_complete(select())
+    assert loop.run_until_complete(read()) == {1: "pt-br", 2: "en"}
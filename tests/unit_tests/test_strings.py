@@ -0,0 +1,76 @@
+"""
+Tests associated with loading the strings.
+"""
+import os
+import copy
+import pytest
+import datetime
+from dof_discord_bot.src import strings
+from dof_discord_bot.src.constants import DEFAULT_LOCALE
+
+
+def test_load_uses_snapshot(tmp_path):
+    """
+    Loading the strings should write the snapshot, and loading them again should give the same strings.
+    """
+    path = tmp_path / "strings.yaml"
+    path.write_text("strings:\n  section:\n    value: \"Value\"\n")
+
+    # noinspection PyProtectedMember
+    assert strings._load(str(path)) == {"strings": {"section": {"value": "Value"}}}
+    assert os.path.exists(str(tmp_path / "strings.cache"))
+
+    # noinspection PyProtectedMember
+    assert strings._load(str(path)) == {"strings": {"section": {"value": "Value"}}}
+
+
+def test_load_skips_snapshot_of_unmarshallable_values(tmp_path):
+    """
+    Values which can't be stored in the snapshot (such as dates) should only skip the snapshot, not fail the loading.
+    """
+    path = tmp_path / "strings.yaml"
+    path.write_text("strings:\n  section:\n    released: 2020-11-08\n")
+
+    # noinspection PyProtectedMember
+    assert strings._load(str(path)) == {"strings": {"section": {"released": datetime.date(2020, 11, 8)}}}
+    assert os.listdir(str(tmp_path)) == ["strings.yaml"]
+
+
+@pytest.mark.parametrize("section, subsection, value", (
+    ("help_cog", None, "x"),
+    ("character_cog", "aliases", ["x"]),
+))
+def test_update_rejects_invalid_sections(section, subsection, value):
+    """
+    Sections which aren't mappings should be rejected as invalid strings, leaving the old strings in place.
+    """
+    configs = copy.deepcopy(strings.load_strings())
+    if subsection is None:
+        configs[DEFAULT_LOCALE]["strings"][section] = value
+    else:
+        configs[DEFAULT_LOCALE]["strings"][section][subsection] = value
+    help_title = strings.Help.help_title
+
+    with pytest.raises(strings.StringsError):
+        strings.update_strings(configs)
+    assert strings.Help.help_title == help_title
+
+
+def test_update_runs_callbacks_after_failing_callback():
+    """
+    A failing update callback should be reported, without stopping the other callbacks or the update itself.
+    """
+    called = list()
+
+    def failing_callback():
+        raise RuntimeError("Failing callback")
+
+    strings.on_strings_update(failing_callback)
+    strings.on_strings_update(lambda: called.append(True))
+    try:
+        strings.update_strings(strings.load_strings())
+    finally:
+        # noinspection PyProtectedMember
+        del strings._UPDATE_CALLBACKS[-2:]
+
+    assert called